@@ -1,6 +1,10 @@
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
+import xml.etree.ElementTree as ET
 import arxiv
+import requests
+from .arxiv_ids import arxiv_paper_id, parse_arxiv_id
+from .citations import format_citation
 from .base_api import ResearchAPI, Paper, Citation, SortOrder, SortBy
 from .base_api_error import (
     APIRequestError,
@@ -11,6 +15,20 @@ from .base_api_error import (
     APIQuotaError,
 )
 
+ARXIV_QUERY_URL = "https://export.arxiv.org/api/query"
+OPENSEARCH_NS = "{http://a9.com/-/spec/opensearch/1.1/}"
+# arXiv accepts up to a few hundred IDs per id_list query
+DEFAULT_ID_BATCH_SIZE = 100
+
+
+def _query_id(paper_id: str) -> str:
+    """Identifier arXiv's id_list understands, keeping any explicit version."""
+    parsed = parse_arxiv_id(paper_id)
+    if parsed is None:
+        return paper_id
+    arxiv_id, version = parsed
+    return f"{arxiv_id}v{version}" if version else arxiv_id
+
 
 class ArxivAPI(ResearchAPI):
     def __init__(self, max_retries: int = 3) -> None:
@@ -73,6 +91,24 @@ class ArxivAPI(ResearchAPI):
             details=APIErrorDetail(code="arxiv:unknown_error", retryable=False),
         ) from error
 
+    @staticmethod
+    def _build_query(
+        query: str,
+        before: Optional[date] = None,
+        after: Optional[date] = None,
+        author: Optional[str] = None,
+    ) -> str:
+        """Combine search terms and filters into an arXiv search_query string."""
+        query_parts = [query]
+        if author:
+            query_parts.append(f"au:{author}")
+        if before or after:
+            # arXiv only accepts closed ranges in YYYYMMDDTTTT form
+            start = (after or date(1991, 1, 1)).strftime("%Y%m%d")
+            end = (before or date.today()).strftime("%Y%m%d")
+            query_parts.append(f"submittedDate:[{start}0000 TO {end}2359]")
+        return " AND ".join(query_parts)
+
     def search(
         self,
         query: str,
@@ -84,14 +120,6 @@ class ArxivAPI(ResearchAPI):
         sort_by: Optional[SortBy] = "relevance",
     ) -> List[Paper]:
         try:
-            query_parts = [query]
-            if author:
-                query_parts.append(f"au:{author}")
-            if before:
-                query_parts.append(f"submittedDate:[* TO {before.isoformat()}]")
-            if after:
-                query_parts.append(f"submittedDate:[{after.isoformat()} TO *]")
-
             sort_criterion_map = {
                 "relevance": arxiv.SortCriterion.Relevance,
                 "last_updated_date": arxiv.SortCriterion.LastUpdatedDate,
@@ -112,7 +140,7 @@ class ArxivAPI(ResearchAPI):
             )
 
             search = arxiv.Search(
-                query=" AND ".join(query_parts),
+                query=self._build_query(query, before, after, author),
                 max_results=limit,
                 sort_by=sort_criterion,
                 sort_order=sort_order_value,
@@ -121,30 +149,7 @@ class ArxivAPI(ResearchAPI):
             # obtain results before processing to make error catching easier
             raw_results = list(self.client.results(search))
 
-            results = []
-            for result in raw_results:
-                try:
-                    results.append(
-                        Paper(
-                            id=result.entry_id,
-                            title=result.title,
-                            authors=[a.name for a in result.authors],
-                            abstract=result.summary,
-                            publication_date=result.published.date(),
-                            pdf_url=result.pdf_url,
-                            source="arXiv",
-                        )
-                    )
-                except AttributeError as e:
-                    raise APIResponseError(
-                        message="Invalid arXiv result structure",
-                        source="arxiv",
-                        details=APIErrorDetail(
-                            code="arxiv:invalid_result",
-                            retryable=False,
-                            metadata={"exception": str(e)},
-                        ),
-                    ) from e
+            results = [self._to_paper(result) for result in raw_results]
 
             if not results:
                 raise APIResponseError(
@@ -158,9 +163,105 @@ class ArxivAPI(ResearchAPI):
             self._handle_arxiv_error(e)
             raise
 
+    @staticmethod
+    def _to_paper(result: arxiv.Result) -> Paper:
+        """Paper stored under the versionless ID, with the version alongside."""
+        try:
+            parsed = parse_arxiv_id(result.entry_id)
+            return Paper(
+                id=arxiv_paper_id(parsed[0]) if parsed else result.entry_id,
+                title=result.title,
+                authors=[a.name for a in result.authors],
+                abstract=result.summary,
+                publication_date=result.published.date(),
+                pdf_url=result.pdf_url,
+                source="arXiv",
+                version=parsed[1] if parsed else None,
+            )
+        except AttributeError as e:
+            raise APIResponseError(
+                message="Invalid arXiv result structure",
+                source="arxiv",
+                details=APIErrorDetail(
+                    code="arxiv:invalid_result",
+                    retryable=False,
+                    metadata={"exception": str(e)},
+                ),
+            ) from e
+
+    def latest_versions(
+        self, paper_ids: Sequence[str], batch_size: int = DEFAULT_ID_BATCH_SIZE
+    ) -> Dict[str, Paper]:
+        """
+        Current metadata for many papers, ``batch_size`` IDs per request.
+
+        Args:
+            paper_ids: Stored arXiv paper IDs (versions are ignored)
+            batch_size: IDs per id_list query
+
+        Returns:
+            Latest version of each paper keyed by its stored ID; papers arXiv
+            does not know are omitted
+        """
+        try:
+            latest: Dict[str, Paper] = {}
+            parsed = [parse_arxiv_id(pid) for pid in paper_ids]
+            query_ids = [p[0] for p in parsed if p is not None]
+            for start in range(0, len(query_ids), batch_size):
+                batch = query_ids[start : start + batch_size]
+                search = arxiv.Search(id_list=batch, max_results=len(batch))
+                for result in list(self.client.results(search)):
+                    paper = self._to_paper(result)
+                    latest[paper.id] = paper
+            return latest
+        except Exception as e:
+            self._handle_arxiv_error(e)
+            raise
+
+    def count(
+        self,
+        query: str,
+        before: Optional[date] = None,
+        after: Optional[date] = None,
+        author: Optional[str] = None,
+    ) -> int:
+        """Count matches using the feed's totalResults with zero records requested."""
+        try:
+            response = requests.get(
+                ARXIV_QUERY_URL,
+                params={
+                    "search_query": self._build_query(query, before, after, author),
+                    "max_results": "0",
+                },
+                timeout=30,
+            )
+            if not response.ok:
+                raise APIRequestError(
+                    message=f"arXiv API request failed with HTTP {response.status_code}",
+                    status_code=response.status_code,
+                    source="arxiv",
+                    details=APIErrorDetail(
+                        code="arxiv:http_error",
+                        retryable=response.status_code >= 500,
+                        metadata={"url": response.url},
+                    ),
+                )
+
+            total = ET.fromstring(response.content).find(f"{OPENSEARCH_NS}totalResults")
+            if total is None or not (total.text or "").strip().isdigit():
+                raise APIResponseError(
+                    message="arXiv feed did not report a total result count",
+                    source="arxiv",
+                    details=APIErrorDetail(code="arxiv:missing_total", retryable=True),
+                )
+            return int((total.text or "").strip())
+        except Exception as e:
+            self._handle_arxiv_error(e)
+            raise
+
     def get_citation(self, paper_id: str, format: int = 0) -> Citation:
         try:
-            search = arxiv.Search(id_list=[paper_id])
+            search = arxiv.Search(id_list=[_query_id(paper_id)])
             try:
                 paper = next(self.client.results(search))
             except StopIteration:
@@ -173,10 +274,14 @@ class ArxivAPI(ResearchAPI):
                 )
 
             try:
-                authors = [author.name for author in paper.authors]
-                year = paper.published.year
-                title = paper.title
-                url = paper.entry_id
+                cited = Paper(
+                    id=paper.entry_id,
+                    title=paper.title,
+                    authors=[author.name for author in paper.authors],
+                    abstract="",
+                    publication_date=paper.published,
+                    source="arXiv",
+                )
             except AttributeError as e:
                 raise APIResponseError(
                     message="Missing required fields in arXiv paper",
@@ -188,32 +293,8 @@ class ArxivAPI(ResearchAPI):
                     ),
                 )
 
-            # Citation formatting remains the same
-            if format == 0:  # MLA
-                citation_format = "MLA"
-                citation_str = f'{", ".join(authors)}. "{title}." arXiv, {year}, {url}.'
-            elif format == 1:  # APA
-                citation_format = "APA"
-                citation_str = f"{', '.join(authors)} ({year}). {title}. arXiv. {url}"
-            elif format == 2:  # Chicago
-                citation_format = "Chicago"
-                citation_str = (
-                    f'{", ".join(authors)}. "{title}." arXiv ({year}). {url}.'
-                )
-            else:
-                citation_format = "Unknown"
-                citation_str = f"{', '.join(authors)}. {title} ({year}). {url}"
-
-            return Citation(
-                id=paper.entry_id,
-                title=title,
-                citation_format=citation_format,
-                citation_str=citation_str,
-                authors=authors,
-                year=year,
-                source="arXiv",
-                url=url,
-            )
+            # formatted locally, the same way as citations for saved papers
+            return format_citation(cited, format)
         except Exception as e:
             self._handle_arxiv_error(e)
             raise
@@ -222,7 +303,7 @@ class ArxivAPI(ResearchAPI):
         self, paper_id: str, dirpath: str = ".", filename: Optional[str] = None
     ) -> None:
         try:
-            search = arxiv.Search(id_list=[paper_id])
+            search = arxiv.Search(id_list=[_query_id(paper_id)])
             try:
                 paper = next(self.client.results(search))
             except StopIteration:
@@ -0,0 +1,45 @@
+import re
+from typing import Optional, Tuple
+
+ARXIV_ABS_PREFIX = "http://arxiv.org/abs/"
+
+# abs/pdf URLs, arXiv:-prefixed or bare identifiers, new (2301.00001) or
+# old (hep-th/9901001) style, with an optional version suffix
+_ARXIV_ID = re.compile(
+    r"^(?:https?://(?:export\.)?arxiv\.org/(?:abs|pdf)/|arxiv:)?"
+    r"(?P<id>\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})"
+    r"(?:v(?P<version>\d+))?(?:\.pdf)?$",
+    re.IGNORECASE,
+)
+
+
+def parse_arxiv_id(paper_id: str) -> Optional[Tuple[str, Optional[int]]]:
+    """
+    Split an arXiv URL or identifier into its bare ID and version.
+
+    Returns:
+        ``("1706.03762", 7)`` for ``http://arxiv.org/abs/1706.03762v7``, a
+        None version when there is no suffix, or None for non-arXiv IDs
+    """
+    match = _ARXIV_ID.match(paper_id.strip())
+    if not match:
+        return None
+    version = match.group("version")
+    return match.group("id"), int(version) if version else None
+
+
+def arxiv_paper_id(arxiv_id: str) -> str:
+    """The versionless ID arXiv papers are stored under."""
+    return ARXIV_ABS_PREFIX + arxiv_id
+
+
+def arxiv_base_id(paper_id: str) -> Optional[str]:
+    """Versionless stored ID for an arXiv URL or identifier, else None."""
+    parsed = parse_arxiv_id(paper_id)
+    return arxiv_paper_id(parsed[0]) if parsed else None
+
+
+def arxiv_version(paper_id: str) -> Optional[int]:
+    """Version suffix of an arXiv URL or identifier, if any."""
+    parsed = parse_arxiv_id(paper_id)
+    return parsed[1] if parsed else None
@@ -24,6 +24,8 @@ class Paper:
     source: Optional[str] = None  # TODO: make source type + make mandatory
     doi: Optional[str] = None
     citation_count: Optional[int] = 0
+    version: Optional[int] = None  # arXiv version the metadata describes
+    venue: Optional[str] = None  # journal or proceedings, when known
 
 
 @dataclass
@@ -53,6 +55,28 @@ class ResearchAPI(ABC):
         """Search for papers given a query string."""
         pass
 
+    @abstractmethod
+    def count(
+        self,
+        query: str,
+        before: Optional[date] = None,
+        after: Optional[date] = None,
+        author: Optional[str] = None,
+    ) -> int:
+        """
+        Count papers matching a query without fetching the records.
+
+        Args:
+            query: Search terms
+            before: Only count papers published on or before this date
+            after: Only count papers published on or after this date
+            author: Filter by author name
+
+        Returns:
+            Total number of matching papers reported by the source.
+        """
+        pass
+
     @abstractmethod
     def download_paper(
         self, paper_id: str, dirpath: str = ".", filename: Optional[str] = None
@@ -69,6 +93,18 @@ class ResearchAPI(ABC):
         """
         pass
 
+    def get_full_text(self, paper_id: str) -> Optional[str]:
+        """
+        Retrieve the structured full text of a paper, if the source offers it.
+
+        Args:
+            paper_id: ID of the paper.
+
+        Returns:
+            Plain text of the paper, or None when it has to be extracted from the PDF.
+        """
+        return None
+
     @abstractmethod
     def get_citation(self, paper_id: str, format: int) -> Union[Citation, None]:
         """
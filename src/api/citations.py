@@ -0,0 +1,123 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from .arxiv_ids import parse_arxiv_id
+from .base_api import Citation, Paper
+
+# index is the ``format`` argument of ResearchAPI.get_citation
+CITATION_FORMATS = ("MLA", "APA", "Chicago", "BibTeX")
+BIBTEX = CITATION_FORMATS.index("BibTeX")
+
+_KEY_STOPWORDS = {"a", "an", "the", "on", "of", "in", "for", "to", "and", "with"}
+_BIBTEX_SPECIAL = re.compile(r"[\\{}&%$#_]")
+
+
+def _ascii_words(text: str) -> List[str]:
+    decomposed = unicodedata.normalize("NFKD", text)
+    ascii_text = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.findall(r"[a-z0-9]+", ascii_text.lower())
+
+
+def _bibtex_escape(text: str) -> str:
+    return _BIBTEX_SPECIAL.sub(
+        lambda m: r"\textbackslash{}" if m.group() == "\\" else "\\" + m.group(),
+        text,
+    )
+
+
+def citation_url(paper: Paper) -> Optional[str]:
+    """Link for a citation: the DOI if known, else a URL-shaped ID or the PDF."""
+    if paper.doi:
+        return f"https://doi.org/{paper.doi}"
+    if paper.id.startswith(("http://", "https://")):
+        return paper.id
+    return paper.pdf_url
+
+
+def citation_key(paper: Paper) -> str:
+    """BibTeX key: first author's surname, year and first significant title word."""
+    surname = _ascii_words(paper.authors[0])[-1:] if paper.authors else []
+    year = str(paper.publication_date.year) if paper.publication_date else ""
+    word = next((w for w in _ascii_words(paper.title) if w not in _KEY_STOPWORDS), "")
+    return "".join(surname or ["anon"]) + year + word
+
+
+def _bibtex(paper: Paper, key: str, year: Optional[int], url: Optional[str]) -> str:
+    fields = [
+        ("author", " and ".join(_bibtex_escape(a) for a in paper.authors)),
+        # double braces keep the title's capitalization
+        ("title", "{" + _bibtex_escape(paper.title) + "}"),
+        ("year", str(year) if year else ""),
+    ]
+    parsed = parse_arxiv_id(paper.id) if paper.source == "arXiv" else None
+    if parsed:
+        fields += [("eprint", parsed[0]), ("archivePrefix", "arXiv")]
+    elif paper.source:
+        fields.append(("publisher", _bibtex_escape(paper.source)))
+    fields += [("doi", paper.doi or ""), ("url", url or "")]
+    body = "".join(f"  {name} = {{{value}}},\n" for name, value in fields if value)
+    return f"@misc{{{key},\n{body}}}"
+
+
+def format_citation(
+    paper: Paper, format: int = 0, key: Optional[str] = None
+) -> Citation:
+    """
+    Format a citation from a paper's own metadata, without any API call.
+
+    Args:
+        paper: Paper to cite
+        format: Index into ``CITATION_FORMATS`` (0=MLA, 1=APA, 2=Chicago, 3=BibTeX)
+        key: BibTeX entry key (default: :func:`citation_key`)
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if not 0 <= format < len(CITATION_FORMATS):
+        raise ValueError(f"Unknown citation format: {format}")
+    authors = ", ".join(paper.authors)
+    year = paper.publication_date.year if paper.publication_date else None
+    shown_year = year or "n.d."
+    url = citation_url(paper)
+    venue = paper.venue or paper.source or ""
+
+    if format == 0:
+        citation_str = f'{authors}. "{paper.title}." {venue}, {shown_year}'
+        citation_str += f", {url}." if url else "."
+    elif format == 1:
+        citation_str = f"{authors} ({shown_year}). {paper.title}. {venue}."
+        citation_str += f" {url}" if url else ""
+    elif format == 2:
+        citation_str = f'{authors}. "{paper.title}." {venue} ({shown_year}).'
+        citation_str += f" {url}." if url else ""
+    else:
+        citation_str = _bibtex(paper, key or citation_key(paper), year, url)
+
+    return Citation(
+        id=paper.id,
+        title=paper.title,
+        citation_format=CITATION_FORMATS[format],
+        citation_str=citation_str,
+        authors=paper.authors,
+        year=year,
+        source=paper.source,
+        url=url,
+    )
+
+
+def format_citations(papers: Iterable[Paper], format: int = 0) -> Iterator[Citation]:
+    """
+    Lazily format many citations, giving clashing BibTeX keys a, b, ... suffixes.
+    """
+    seen: Set[str] = set()
+    clashes: Dict[str, int] = {}
+    for paper in papers:
+        key = None
+        if format == BIBTEX:
+            base = key = citation_key(paper)
+            while key in seen:
+                suffix = clashes.get(base, 0)
+                clashes[base] = suffix + 1
+                key = base + chr(ord("a") + suffix % 26) * (suffix // 26 + 1)
+            seen.add(key)
+        yield format_citation(paper, format, key)
@@ -1,8 +1,9 @@
 from .base_api import ResearchAPI, Paper, Citation, SortOrder, SortBy
 from .xploreapi import Xplore
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 import os
+import xml.etree.ElementTree as ET
 from dotenv import load_dotenv
 from requests.exceptions import RequestException
 import requests
@@ -233,6 +234,64 @@ class IEEEAPI(ResearchAPI):
                 ),
             ) from e
 
+    def count(
+        self,
+        query: str,
+        before: Optional[date] = None,
+        after: Optional[date] = None,
+        author: Optional[str] = None,
+    ) -> int:
+        """Count matching papers from ``total_records`` with a single-record request.
+
+        Year bounds are applied with ``publication_year`` (or ``start_year``/``end_year``
+        for ranges), so ``before``/``after`` are only honoured at year granularity.
+
+        Raises:
+            APIResponseError: For invalid queries or malformed responses
+            APIRequestError: For network/retryable errors
+            APIAuthError: For authorization issues
+        """
+        try:
+            # fresh builder so filters never leak into self.query
+            count_query = Xplore(self.api_key)
+            count_query.dataFormat("object")
+            count_query.queryText(query)
+            if author:
+                count_query.authorText(author)
+            if before and after and before.year == after.year:
+                count_query.publicationYear(str(after.year))
+            else:
+                if after:
+                    count_query.searchField("start_year", str(after.year))
+                if before:
+                    count_query.searchField("end_year", str(before.year))
+            count_query.maximumResults(1)
+
+            response = count_query.callAPI()
+            if "error" in response:
+                self._handle_ieee_error(response)
+
+            return int(response.get("total_records", 0))
+
+        except (APIResponseError, APIAuthError, APIRequestError):
+            raise
+        except RequestException as e:
+            raise APIRequestError(
+                message=f"Count failed: {str(e)}",
+                source="ieee",
+                details=APIErrorDetail(code="ieee:network_error", retryable=True),
+            ) from e
+        except Exception as e:
+            raise APIRequestError(
+                message=f"Unexpected count error: {str(e)}",
+                source="ieee",
+                details=APIErrorDetail(
+                    code="ieee:count_failed",
+                    retryable=False,
+                    metadata={"exception": str(e)},
+                ),
+            ) from e
+
     def download_paper(
         self, paper_id: str, dirpath: str = ".", filename: Optional[str] = None
     ) -> None:
@@ -344,6 +403,74 @@ class IEEEAPI(ResearchAPI):
                 details=APIErrorDetail(code="ieee:download_failed", retryable=False),
             ) from e
 
+    def get_full_text(self, paper_id: str) -> Optional[str]:
+        """Fetch full text from the Open Access endpoint, then the entitled one.
+
+        The entitled (chargeable) endpoint is only tried when ``IEEE_AUTH_TOKEN``
+        is set.
+
+        Args:
+            paper_id: IEEE article number
+
+        Returns:
+            Plain text of the article, or None if it is not available as full text
+
+        Raises:
+            APIRequestError: For network/retryable errors
+        """
+        requests_to_try: List[Tuple[str, Optional[str]]] = [("openAccess", None)]
+        auth_token = os.getenv("IEEE_AUTH_TOKEN")
+        if auth_token:
+            requests_to_try.append(("fullTextRequest", auth_token))
+
+        for method, token in requests_to_try:
+            try:
+                text_query = Xplore(self.api_key)
+                text_query.dataType("xml")
+                if token:
+                    text_query.setAuthToken(token)
+                getattr(text_query, method)(paper_id)
+                text = self._parse_full_text(text_query.callAPI())
+            except RequestException as e:
+                raise APIRequestError(
+                    message=f"Full text request failed: {str(e)}",
+                    source="ieee",
+                    details=APIErrorDetail(code="ieee:network_error", retryable=True),
+                ) from e
+            except Exception as e:
+                raise APIRequestError(
+                    message=f"Unexpected full text error: {str(e)}",
+                    source="ieee",
+                    details=APIErrorDetail(
+                        code="ieee:fulltext_failed",
+                        retryable=False,
+                        metadata={"paper_id": paper_id, "exception": str(e)},
+                    ),
+                ) from e
+            if text:
+                return text
+        return None
+
+    @staticmethod
+    def _parse_full_text(raw: str) -> Optional[str]:
+        """Flatten a full text XML document into section titles and paragraphs."""
+        try:
+            root = ET.fromstring(raw)
+        except ET.ParseError:
+            return None  # JSON error payloads, HTML error pages, ...
+        if root.tag == "error" or root.find(".//error") is not None:
+            return None
+
+        blocks = []
+        for element in root.iter():
+            tag = element.tag.rsplit("}", 1)[-1]
+            if tag in ("title", "p"):
+                text = " ".join("".join(element.itertext()).split())
+                if text:
+                    blocks.append(text)
+        text = "\n\n".join(blocks)
+        return text or None
+
     def get_citation(self, paper_id: str, format: int = 0) -> Citation:
         """Get formatted citation for a paper.
 
@@ -0,0 +1,338 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, NoReturn, Optional, Sequence
+import os
+import re
+import time
+import requests
+from requests.exceptions import RequestException
+from .base_api import Paper
+from .base_api_error import (
+    APIRequestError,
+    APIResponseError,
+    APIErrorDetail,
+    BaseAPIError,
+)
+from src.storage.cache import MetadataCache
+
+DEFAULT_METADATA_ENDPOINT = "https://api.semanticscholar.org/graph/v1"
+# the public API allows about one request per second without a key
+DEFAULT_MIN_INTERVAL = float(os.getenv("IWADI_METADATA_INTERVAL", "1.0"))
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 60.0
+
+_ARXIV_ABS_URL = re.compile(r"arxiv\.org/(?:abs|pdf)/(?P<id>.+?)(?:v\d+)?(?:\.pdf)?$")
+TITLE_PREFIX = "TITLE:"
+RECORD_FIELDS = "externalIds,title,authors,year,citationCount"
+
+
+def title_identifier(title: str) -> Optional[str]:
+    """Identifier for a title-only lookup, normalized so it caches well."""
+    words = re.findall(r"\w+", title.lower())
+    return TITLE_PREFIX + " ".join(words) if words else None
+
+
+@dataclass
+class PaperMetadata:
+    """Bibliographic metadata returned by a batch metadata provider."""
+
+    doi: Optional[str] = None
+    arxiv_id: Optional[str] = None
+    title: Optional[str] = None
+    authors: List[str] = field(default_factory=list)
+    year: Optional[int] = None
+    citation_count: Optional[int] = None
+
+
+def paper_identifier(paper: Paper) -> Optional[str]:
+    """
+    Provider-neutral identifier for a paper: ``DOI:<doi>`` or ``ARXIV:<id>``.
+
+    Returns None when the paper carries neither identifier.
+    """
+    if paper.doi:
+        return f"DOI:{paper.doi}"
+    match = _ARXIV_ABS_URL.search(paper.id)
+    if match:
+        return f"ARXIV:{match.group('id')}"
+    return None
+
+
+class MetadataProvider(ABC):
+    """Source of metadata for many papers per request."""
+
+    @abstractmethod
+    def lookup(self, identifiers: Sequence[str]) -> Dict[str, PaperMetadata]:
+        """
+        Look up metadata for a batch of identifiers.
+
+        Args:
+            identifiers: ``DOI:...``, ``ARXIV:...`` or ``TITLE:...``
+                identifiers (see :func:`title_identifier`).
+
+        Returns:
+            Metadata keyed by identifier; unknown identifiers are omitted.
+        """
+        pass
+
+    def split_requests(self, identifiers: Sequence[str]) -> List[List[str]]:
+        """
+        Group identifiers the way :meth:`lookup` sends them, one group per request.
+
+        Callers use this to cache each request's results as soon as it returns.
+        """
+        return [list(identifiers)] if identifiers else []
+
+
+class SemanticScholarProvider(MetadataProvider):
+    """Batch lookups against the Semantic Scholar graph API (or a compatible stand-in)."""
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        batch_size: int = 500,
+        max_retries: int = 3,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+    ) -> None:
+        self.endpoint = (
+            endpoint
+            or os.getenv("IWADI_METADATA_ENDPOINT")
+            or DEFAULT_METADATA_ENDPOINT
+        ).rstrip("/")
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.min_interval = min_interval
+        self._last_request = float("-inf")
+        self.session = requests.Session()
+        api_key = os.getenv("IWADI_METADATA_API_KEY")
+        if api_key:
+            self.session.headers["x-api-key"] = api_key
+
+    def lookup(self, identifiers: Sequence[str]) -> Dict[str, PaperMetadata]:
+        results: Dict[str, PaperMetadata] = {}
+        ids = [i for i in identifiers if not i.startswith(TITLE_PREFIX)]
+        for start in range(0, len(ids), self.batch_size):
+            batch = ids[start : start + self.batch_size]
+            records = self._post_batch(batch)
+            for identifier, record in zip(batch, records):
+                if record:
+                    results[identifier] = self._parse_record(record)
+
+        # titles have no batch endpoint: one best-match request each
+        for identifier in identifiers:
+            if identifier.startswith(TITLE_PREFIX):
+                record = self._match_title(identifier[len(TITLE_PREFIX) :])
+                if record:
+                    results[identifier] = self._parse_record(record)
+        return results
+
+    def split_requests(self, identifiers: Sequence[str]) -> List[List[str]]:
+        ids = [i for i in identifiers if not i.startswith(TITLE_PREFIX)]
+        batches = [
+            ids[start : start + self.batch_size]
+            for start in range(0, len(ids), self.batch_size)
+        ]
+        return batches + [[i] for i in identifiers if i.startswith(TITLE_PREFIX)]
+
+    def _post_batch(self, batch: List[str]) -> List[Optional[dict]]:
+        response = self._request(
+            "post",
+            "/paper/batch",
+            params={"fields": RECORD_FIELDS},
+            json={"ids": batch},
+        )
+        if not response.ok:
+            self._raise_http_error(response, len(batch))
+
+        records = self._json(response)
+        if not isinstance(records, list) or len(records) != len(batch):
+            raise APIResponseError(
+                message="Metadata response does not match the requested batch",
+                source="metadata",
+                details=APIErrorDetail(code="metadata:invalid_response"),
+            )
+        return records
+
+    def _match_title(self, title: str) -> Optional[dict]:
+        """Best title match, kept only if its normalized title is the same."""
+        response = self._request(
+            "get",
+            "/paper/search/match",
+            params={"query": title, "fields": RECORD_FIELDS},
+        )
+        if response.status_code == 404:  # no match
+            return None
+        if not response.ok:
+            self._raise_http_error(response, 1)
+
+        body = self._json(response)
+        matches = body.get("data") if isinstance(body, dict) else None
+        if not isinstance(matches, list):
+            raise APIResponseError(
+                message="Metadata title match has no data",
+                source="metadata",
+                details=APIErrorDetail(code="metadata:invalid_response"),
+            )
+        for record in matches:
+            if title_identifier(record.get("title") or "") == TITLE_PREFIX + title:
+                return dict(record)
+        return None
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a throttled request, retrying network errors and retryable statuses.
+
+        Retries back off exponentially unless the server sends Retry-After.
+        The last response is returned as is, so callers still see the error.
+        """
+        send = self.session.post if method == "post" else self.session.get
+        attempt = 0
+        while True:
+            self._throttle()
+            retry_after: Optional[str] = None
+            try:
+                response = send(f"{self.endpoint}{path}", timeout=30, **kwargs)
+            except RequestException as e:
+                if attempt >= self.max_retries:
+                    raise APIRequestError(
+                        message=f"Metadata lookup failed: {str(e)}",
+                        source="metadata",
+                        details=APIErrorDetail(
+                            code="metadata:network_error",
+                            retryable=True,
+                            metadata={"attempts": attempt + 1},
+                        ),
+                    ) from e
+            else:
+                if (
+                    response.status_code not in RETRYABLE_STATUS
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+            attempt += 1
+            time.sleep(self._backoff(attempt, retry_after))
+
+    def _throttle(self) -> None:
+        """Keep at least ``min_interval`` seconds between requests."""
+        wait = self._last_request + self.min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER)
+        return float(2 ** (attempt - 1))
+
+    def _raise_http_error(
+        self, response: requests.Response, batch_size: int
+    ) -> NoReturn:
+        raise APIRequestError(
+            message=f"Metadata lookup failed with HTTP {response.status_code}",
+            status_code=response.status_code,
+            source="metadata",
+            details=APIErrorDetail(
+                code="metadata:http_error",
+                retryable=response.status_code in RETRYABLE_STATUS,
+                metadata={"endpoint": self.endpoint, "batch_size": batch_size},
+            ),
+        )
+
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        try:
+            return response.json()
+        except ValueError as e:
+            raise APIResponseError(
+                message="Metadata response is not valid JSON",
+                source="metadata",
+                details=APIErrorDetail(
+                    code="metadata:invalid_response",
+                    metadata={"exception": str(e)},
+                ),
+            ) from e
+
+    @staticmethod
+    def _parse_record(record: dict) -> PaperMetadata:
+        external_ids = record.get("externalIds") or {}
+        return PaperMetadata(
+            doi=external_ids.get("DOI"),
+            arxiv_id=external_ids.get("ArXiv"),
+            title=record.get("title"),
+            authors=[a["name"] for a in record.get("authors") or [] if a.get("name")],
+            year=record.get("year"),
+            citation_count=record.get("citationCount"),
+        )
+
+
+def lookup_cached(
+    identifiers: Sequence[str],
+    provider: MetadataProvider,
+    cache: MetadataCache,
+    failed: Optional[List[str]] = None,
+) -> Dict[str, PaperMetadata]:
+    """
+    Resolve identifiers from the cache, fetching only the misses in batches.
+
+    Each request is cached as soon as it returns, so a later failure keeps
+    the earlier results. Identifiers the provider does not know are cached
+    as None and not asked for again until the cache's negative TTL expires.
+
+    Args:
+        identifiers: Identifiers to resolve
+        provider: Metadata provider for cache misses
+        cache: Metadata cache
+        failed: If given, a request that still fails after the provider's
+            retries ends the lookup instead of raising, and every identifier
+            left unresolved is appended here
+
+    Returns:
+        Metadata keyed by identifier; unknown or unresolved ones are omitted.
+    """
+    unique = list(dict.fromkeys(identifiers))
+    cached = cache.get_many(unique)
+    results = {
+        key: PaperMetadata(**value)
+        for key, value in cached.items()
+        if value is not None
+    }
+
+    chunks = provider.split_requests([key for key in unique if key not in cached])
+    for done, chunk in enumerate(chunks):
+        try:
+            fetched = provider.lookup(chunk)
+        except BaseAPIError:
+            if failed is None:
+                raise
+            failed.extend(key for rest in chunks[done:] for key in rest)
+            break
+        cache.put_many(
+            {key: asdict(fetched[key]) if key in fetched else None for key in chunk}
+        )
+        results.update(fetched)
+    return results
+
+
+def enrich_citation_counts(
+    papers: List[Paper], provider: MetadataProvider, cache: MetadataCache
+) -> Dict[str, int]:
+    """
+    Fill in ``citation_count`` for papers the provider knows about.
+
+    Returns:
+        The updated counts keyed by paper ID.
+    """
+    identifiers = {paper.id: paper_identifier(paper) for paper in papers}
+    metadata = lookup_cached(
+        [key for key in identifiers.values() if key], provider, cache
+    )
+
+    updated: Dict[str, int] = {}
+    for paper in papers:
+        key = identifiers[paper.id]
+        meta = metadata.get(key) if key else None
+        if meta and meta.citation_count is not None:
+            paper.citation_count = meta.citation_count
+            updated[paper.id] = meta.citation_count
+    return updated
@@ -0,0 +1,248 @@
+import sys
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .base_api import Paper
+
+# sentinels for missing values in the numeric columns
+_NO_DATE = 0
+_NO_COUNT = -1
+_NO_VERSION = 0  # arXiv versions start at 1
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+class PaperView:
+    """
+    Read-mostly ``Paper`` look-alike backed by one row of a :class:`PaperBatch`.
+
+    Views are slotted and hold only the batch and a row index, so iterating
+    a batch does not materialize per-paper dicts or author lists. Authors
+    come back as a tuple; use :meth:`to_paper` for a mutable ``Paper``.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "PaperBatch", index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    @property
+    def id(self) -> str:
+        return self._batch.ids[self._index]
+
+    @property
+    def title(self) -> str:
+        return self._batch.titles[self._index]
+
+    @property
+    def authors(self) -> Tuple[str, ...]:
+        return self._batch.authors_of(self._index)
+
+    @property
+    def abstract(self) -> str:
+        return self._batch.abstracts[self._index]
+
+    @property
+    def pdf_url(self) -> Optional[str]:
+        return self._batch.pdf_urls[self._index]
+
+    @property
+    def publication_date(self) -> Optional[date]:
+        ordinal = self._batch.dates[self._index]
+        return date.fromordinal(ordinal) if ordinal != _NO_DATE else None
+
+    @property
+    def source(self) -> Optional[str]:
+        return self._batch.sources[self._index]
+
+    @property
+    def doi(self) -> Optional[str]:
+        return self._batch.dois[self._index]
+
+    @property
+    def citation_count(self) -> Optional[int]:
+        count = self._batch.citation_counts[self._index]
+        return count if count != _NO_COUNT else None
+
+    @citation_count.setter
+    def citation_count(self, value: Optional[int]) -> None:
+        # lets enrichment write straight into the batch
+        self._batch.citation_counts[self._index] = _NO_COUNT if value is None else value
+
+    @property
+    def version(self) -> Optional[int]:
+        version = self._batch.versions[self._index]
+        return version if version != _NO_VERSION else None
+
+    @property
+    def venue(self) -> Optional[str]:
+        return self._batch.venues[self._index]
+
+    def to_paper(self) -> Paper:
+        return Paper(
+            id=self.id,
+            title=self.title,
+            authors=list(self.authors),
+            abstract=self.abstract,
+            pdf_url=self.pdf_url,
+            publication_date=self.publication_date,
+            source=self.source,
+            doi=self.doi,
+            citation_count=self.citation_count,
+            version=self.version,
+            venue=self.venue,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (PaperView, Paper)):
+            return self.to_paper() == (
+                other.to_paper() if isinstance(other, PaperView) else other
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PaperView(id={self.id!r}, title={self.title!r})"
+
+
+class PaperBatch:
+    """
+    Columnar container for many papers, stored as parallel arrays.
+
+    Dates, citation counts and versions live in typed ``array`` columns,
+    sources, venues and author names are interned, and all author lists
+    share one flat list
+    indexed by an offsets array. Dedup and ranking work on row indexes and
+    return new batches without building ``Paper`` objects.
+    """
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.abstracts: List[str] = []
+        self.pdf_urls: List[Optional[str]] = []
+        self.dates = array("l")  # date ordinals
+        self.sources: List[Optional[str]] = []
+        self.dois: List[Optional[str]] = []
+        self.citation_counts = array("q")
+        self.versions = array("q")
+        self.venues: List[Optional[str]] = []
+        self.author_names: List[str] = []
+        self.author_offsets = array("Q", [0])
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Paper]) -> "PaperBatch":
+        batch = cls()
+        batch.extend(papers)
+        return batch
+
+    def append(self, paper: Paper) -> None:
+        self.ids.append(paper.id)
+        self.titles.append(paper.title)
+        self.abstracts.append(paper.abstract)
+        self.pdf_urls.append(paper.pdf_url)
+        self.dates.append(
+            paper.publication_date.toordinal() if paper.publication_date else _NO_DATE
+        )
+        self.sources.append(_intern(paper.source))
+        self.dois.append(paper.doi)
+        self.citation_counts.append(
+            _NO_COUNT if paper.citation_count is None else paper.citation_count
+        )
+        self.versions.append(_NO_VERSION if paper.version is None else paper.version)
+        self.venues.append(_intern(paper.venue))
+        self.author_names.extend(sys.intern(name) for name in paper.authors)
+        self.author_offsets.append(len(self.author_names))
+
+    def extend(self, papers: Iterable[Paper]) -> None:
+        for paper in papers:
+            self.append(paper)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> PaperView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PaperBatch index out of range")
+        return PaperView(self, index)
+
+    def __iter__(self) -> Iterator[PaperView]:
+        return (PaperView(self, i) for i in range(len(self)))
+
+    def authors_of(self, index: int) -> Tuple[str, ...]:
+        start, end = self.author_offsets[index], self.author_offsets[index + 1]
+        return tuple(self.author_names[start:end])
+
+    def to_papers(self) -> List[Paper]:
+        return [view.to_paper() for view in self]
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Column name to values, with decoded dates and authors, for export."""
+        return {
+            "id": self.ids,
+            "title": self.titles,
+            "authors": [list(self.authors_of(i)) for i in range(len(self))],
+            "abstract": self.abstracts,
+            "pdf_url": self.pdf_urls,
+            "publication_date": [
+                date.fromordinal(d) if d != _NO_DATE else None for d in self.dates
+            ],
+            "source": self.sources,
+            "doi": self.dois,
+            "citation_count": [
+                c if c != _NO_COUNT else None for c in self.citation_counts
+            ],
+            "version": [v if v != _NO_VERSION else None for v in self.versions],
+            "venue": self.venues,
+        }
+
+    # --------------------------
+    # Bulk operations
+    # --------------------------
+
+    def take(self, indexes: Sequence[int]) -> "PaperBatch":
+        """New batch with the given rows, in the given order."""
+        batch = PaperBatch()
+        for column in (
+            "ids",
+            "titles",
+            "abstracts",
+            "pdf_urls",
+            "sources",
+            "dois",
+            "venues",
+            "dates",
+            "citation_counts",
+            "versions",
+        ):
+            values = getattr(self, column)
+            getattr(batch, column).extend(values[i] for i in indexes)
+        for i in indexes:
+            start, end = self.author_offsets[i], self.author_offsets[i + 1]
+            batch.author_names.extend(self.author_names[start:end])
+            batch.author_offsets.append(len(batch.author_names))
+        return batch
+
+    def dedupe(self) -> "PaperBatch":
+        """Keep the first row per DOI (case-insensitive), or per ID without one."""
+        seen = set()
+        keep = []
+        for i, (paper_id, doi) in enumerate(zip(self.ids, self.dois)):
+            key = f"doi:{doi.lower()}" if doi else paper_id
+            if key not in seen:
+                seen.add(key)
+                keep.append(i)
+        return self.take(keep) if len(keep) < len(self) else self
+
+    def rank_by_citations(self, descending: bool = True) -> "PaperBatch":
+        """Rows sorted by citation count (unknown counts sort as zero)."""
+        order = sorted(
+            range(len(self)),
+            key=lambda i: max(self.citation_counts[i], 0),
+            reverse=descending,
+        )
+        return self.take(order)
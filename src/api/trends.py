@@ -0,0 +1,50 @@
+from datetime import date
+from typing import Dict, Iterable, Optional
+from .base_api import ResearchAPI
+from src.storage.cache import MetadataCache
+
+
+def count_by_year(
+    api: ResearchAPI,
+    source: str,
+    query: str,
+    years: Iterable[int],
+    cache: MetadataCache,
+    author: Optional[str] = None,
+    refresh: bool = False,
+) -> Dict[int, int]:
+    """
+    Number of papers matching ``query`` in each year, one count request per year.
+
+    Counts are cached per (source, query, author, year), so repeated or
+    overlapping trend queries only ask the source for the missing years.
+
+    Args:
+        api: Source to count against
+        source: Source name, used in cache keys
+        query: Search terms
+        years: Year buckets to count
+        cache: Cache for per-bucket counts
+        author: Filter by author name
+        refresh: Ignore cached counts
+
+    Returns:
+        Counts keyed by year
+    """
+    keys = {year: f"count:{source}:{query}:{author or ''}:{year}" for year in years}
+    cached = {} if refresh else cache.get_many(keys.values())
+
+    counts: Dict[int, int] = {}
+    fetched: Dict[str, int] = {}
+    try:
+        for year, key in keys.items():
+            if key in cached:
+                counts[year] = cached[key]
+                continue
+            counts[year] = fetched[key] = api.count(
+                query, before=date(year, 12, 31), after=date(year, 1, 1), author=author
+            )
+    finally:
+        # keep whatever was counted before a failure
+        cache.put_many(fetched)
+    return counts
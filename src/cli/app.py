@@ -1,5 +1,20 @@
 import click
-from src.cli.commands import create_project, list_projects, search, save, view
+from src.cli.commands import (
+    cite,
+    create_project,
+    enrich,
+    export,
+    find,
+    import_refs,
+    list_projects,
+    open_paper,
+    refresh,
+    search,
+    save,
+    storage,
+    trends,
+    view,
+)
 from src.cli.context import IwadiContext
 
 
@@ -17,6 +32,15 @@ app.add_command(list_projects.list, name="list-projects")
 app.add_command(search.search, name="search")
 app.add_command(save.save_papers, name="save")
 app.add_command(view.view, name="view")
+app.add_command(enrich.enrich, name="enrich")
+app.add_command(import_refs.import_refs, name="import")
+app.add_command(trends.trends, name="trends")
+app.add_command(export.export, name="export")
+app.add_command(find.find, name="find")
+app.add_command(refresh.refresh, name="refresh")
+app.add_command(cite.cite, name="cite")
+app.add_command(open_paper.open_paper, name="open")
+app.add_command(storage.storage, name="storage")
 
 if __name__ == "__main__":
     app()
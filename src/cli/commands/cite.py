@@ -0,0 +1,114 @@
+from pathlib import Path
+from typing import Callable, Optional
+import click
+from src.api.base_api import Citation
+from src.api.base_api_error import BaseAPIError
+from src.api.citations import BIBTEX, CITATION_FORMATS
+from src.api.ieee_api import IEEEAPI
+from src.cli.context import IwadiContext
+from src.cli.utils.display import display_error
+from src.cli.utils.error_handler import api_error_handler
+from src.storage.citations import iter_citations
+
+FORMAT_CHOICES = [name.lower() for name in CITATION_FORMATS]
+
+
+def _publisher_citations(format: int) -> Callable[[Citation], Optional[str]]:
+    """Fetch IEEE's own citation for IEEE papers; others stay local."""
+    api = IEEEAPI()
+
+    def fetch(citation: Citation) -> Optional[str]:
+        if not citation.id.isdigit():  # IEEE papers are saved by article number
+            return None
+        try:
+            return api.get_citation(citation.id, format).citation_str
+        except BaseAPIError:
+            return None
+
+    return fetch
+
+
+@click.command()
+@click.option(
+    "--project", "-p", help="Project to cite (uses active project if not specified)"
+)
+@click.option(
+    "--format",
+    "-f",
+    "citation_format",
+    type=click.Choice(FORMAT_CHOICES, case_sensitive=False),
+    default="bibtex",
+    show_default=True,
+    help="Citation style",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output file (default: standard output)",
+)
+@click.option("--source", "-s", help="Only papers from this source")
+@click.option("--author", "-a", help="Only papers by this author")
+@click.option("--after", type=int, help="Only papers published in or after this year")
+@click.option("--before", type=int, help="Only papers published in or before this year")
+@click.option(
+    "--remote",
+    is_flag=True,
+    help="Use IEEE's own citations for IEEE papers (fetched once, then cached)",
+)
+@click.pass_context
+@api_error_handler
+def cite(
+    ctx: click.Context,
+    project: Optional[str],
+    citation_format: str,
+    output: Optional[Path],
+    source: Optional[str],
+    author: Optional[str],
+    after: Optional[int],
+    before: Optional[int],
+    remote: bool,
+) -> None:
+    """
+    Write citations for a project's library.
+
+    Citations are formatted offline from the stored metadata and streamed
+    as they are produced.
+
+    Examples:
+
+        iwadi cite -p thesis -o thesis.bib
+        iwadi cite -p thesis -f apa --after 2020
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    format = FORMAT_CHOICES.index(citation_format.lower())
+    # IEEE formats MLA, APA and Chicago only
+    fetch = _publisher_citations(format) if remote and format != BIBTEX else None
+    citations = iter_citations(
+        target_project,
+        format,
+        fetch,
+        source=source,
+        author=author,
+        year_from=after,
+        year_to=before,
+    )
+    separator = "\n\n" if format == BIBTEX else "\n"
+
+    count = 0
+    with click.open_file(str(output or "-"), "w", encoding="utf-8") as out:
+        for citation in citations:
+            out.write(citation + separator)
+            count += 1
+
+    if not count:
+        click.secho("No saved papers to cite", fg="yellow", err=True)
+    elif output:
+        click.secho(f"Wrote {count} citations to {output}", fg="green")
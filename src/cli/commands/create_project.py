@@ -2,8 +2,9 @@ import click
 from pathlib import Path
 from typing import Optional
 from src.cli.utils.error_handler import api_error_handler
-from src.cli.project import Project
+from src.cli.project import Project, default_projects_root
 from src.cli.context import IwadiContext
+from src.storage.catalog import ProjectCatalog
 
 
 @click.command()
@@ -28,7 +29,7 @@ def create(ctx: click.Context, name: str, path: Optional[str]) -> None:
         )
         raise click.Abort()
 
-    base_path = Path(path) if path else Path.home() / "iwadi_projects"
+    base_path = Path(path) if path else default_projects_root()
     project = Project(name=name, base_path=base_path)
     iwadi_ctx.set_project(project)
 
@@ -39,6 +40,10 @@ def create(ctx: click.Context, name: str, path: Optional[str]) -> None:
         project.papers_path.mkdir(exist_ok=False)
         project.notes_path.mkdir(exist_ok=False)
         project.save_metadata()
+        ProjectCatalog(base_path).register(project)
+        if base_path.resolve() != default_projects_root().resolve():
+            # lets other commands find the project by name alone
+            ProjectCatalog(default_projects_root()).register(project)
 
         click.secho(f"Created project '{name}' at: {project.path}", fg="green")
         click.echo(f"• Papers directory: {project.papers_path}")
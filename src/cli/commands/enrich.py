@@ -0,0 +1,54 @@
+from itertools import islice
+from typing import Optional
+import click
+from src.api.metadata_api import SemanticScholarProvider, enrich_citation_counts
+from src.cli.context import IwadiContext
+from src.cli.utils.display import display_error
+from src.cli.utils.error_handler import api_error_handler
+from src.storage.cache import MetadataCache
+from src.storage.db import iter_papers, update_citation_counts
+
+ENRICH_CHUNK_SIZE = 500
+
+
+@click.command()
+@click.option(
+    "--project", "-p", help="Project to enrich (uses active project if not specified)"
+)
+@click.option(
+    "--endpoint",
+    help="Metadata API base URL (default: $IWADI_METADATA_ENDPOINT or Semantic Scholar)",
+)
+@click.pass_context
+@api_error_handler
+def enrich(ctx: click.Context, project: Optional[str], endpoint: Optional[str]) -> None:
+    """Refresh citation counts for every paper saved in a project."""
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    provider, cache = SemanticScholarProvider(endpoint), MetadataCache()
+    papers = iter_papers(target_project, columns=("id", "doi"))
+    total = updated = 0
+    while True:
+        chunk = list(islice(papers, ENRICH_CHUNK_SIZE))
+        if not chunk:
+            break
+        counts = enrich_citation_counts(chunk, provider, cache)
+        update_citation_counts(target_project, counts)
+        total += len(chunk)
+        updated += len(counts)
+
+    if not total:
+        click.secho("No saved papers to enrich", fg="yellow")
+        return
+
+    click.secho(
+        f"Updated citation counts for {updated} of {total} papers "
+        f"in '{target_project.name}'",
+        fg="green",
+    )
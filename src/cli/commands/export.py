@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import Optional, Tuple
+import click
+from src.cli.context import IwadiContext
+from src.cli.utils.display import (
+    STREAM_FORMATS,
+    display_error,
+    stream_papers,
+    validate_format,
+)
+from src.storage.db import iter_papers
+from src.storage.export import DEFAULT_ROW_GROUP_SIZE, export_parquet
+from src.storage.store import PAPER_FIELDS
+
+
+@click.command()
+@click.option(
+    "--project", "-p", help="Project to export (uses active project if not specified)"
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["parquet", *STREAM_FORMATS]),
+    default="parquet",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output file (default: <project>.parquet, or standard output for "
+    "ndjson, csv and tsv)",
+)
+@click.option(
+    "--column",
+    "-c",
+    "columns",
+    multiple=True,
+    type=click.Choice(PAPER_FIELDS),
+    help="Parquet columns to export (repeatable; default: all)",
+)
+@click.option("--source", "-s", help="Only papers from this source")
+@click.option("--author", "-a", help="Only papers by this author")
+@click.option("--after", type=int, help="Only papers published in or after this year")
+@click.option("--before", type=int, help="Only papers published in or before this year")
+@click.option(
+    "--row-group-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_ROW_GROUP_SIZE,
+    show_default=True,
+    help="Rows per Parquet row group",
+)
+@click.pass_context
+def export(
+    ctx: click.Context,
+    project: Optional[str],
+    output_format: str,
+    output: Optional[Path],
+    columns: Tuple[str, ...],
+    source: Optional[str],
+    author: Optional[str],
+    after: Optional[int],
+    before: Optional[int],
+    row_group_size: int,
+) -> None:
+    """
+    Export a project's library to a columnar file, or stream it as rows.
+
+    Examples:
+
+        iwadi export -p thesis -o thesis.parquet
+        iwadi export -p thesis -c title -c authors --after 2020
+        iwadi export -p thesis -f ndjson | jq .title
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    if output_format in STREAM_FORMATS:
+        if columns:
+            raise click.UsageError("--column only applies to parquet exports")
+        papers = iter_papers(
+            target_project,
+            source=source,
+            author=author,
+            year_from=after,
+            year_to=before,
+        )
+        rows = 0
+        with click.open_file(str(output or "-"), "w", encoding="utf-8") as out:
+            for lines in stream_papers(papers, validate_format(output_format)):
+                out.write(lines)
+                rows += 1
+        if output:
+            click.secho(f"Exported {rows} papers to {output}", fg="green")
+        return
+
+    dest = output or Path(f"{target_project.name}.{output_format}")
+    try:
+        rows = export_parquet(
+            target_project,
+            dest,
+            columns=columns or None,
+            row_group_size=row_group_size,
+            source=source,
+            author=author,
+            year_from=after,
+            year_to=before,
+        )
+    except RuntimeError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    click.secho(f"Exported {rows} papers to {dest}", fg="green")
@@ -0,0 +1,67 @@
+from typing import Optional
+import click
+from src.cli.context import IwadiContext
+from src.cli.utils.display import display_error, display_papers, validate_format
+from src.storage.store import DEFAULT_FUZZY_LIMIT, get_store
+
+
+@click.command()
+@click.argument("query", required=True)
+@click.option(
+    "--project", "-p", help="Project to search (uses active project if not specified)"
+)
+@click.option("--fuzzy", is_flag=True, help="Match approximate titles and author names")
+@click.option(
+    "--limit",
+    "-l",
+    default=DEFAULT_FUZZY_LIMIT,
+    type=click.IntRange(1),
+    show_default=True,
+    help="Maximum number of matches",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    default="table",
+    help="Output format (table, json, minimal, ndjson, csv, tsv)",
+)
+@click.pass_context
+def find(
+    ctx: click.Context,
+    query: str,
+    project: Optional[str],
+    fuzzy: bool,
+    limit: int,
+    output_format: str,
+) -> None:
+    """
+    Find saved papers in a project.
+
+    Without --fuzzy, QUERY matches an ID, a DOI or part of a title.
+
+    Examples:
+
+        iwadi find 10.1109/CVPR.2016.90
+        iwadi find --fuzzy "atention is al you need"
+        iwadi find --fuzzy "geoff hinton" -p thesis
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+        fmt = validate_format(output_format)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    store = get_store(target_project)
+    if fuzzy:
+        papers = [paper for paper, _ in store.find_fuzzy(query, limit=limit)]
+    else:
+        papers = store.find_exact(query, limit=limit)
+
+    if not papers:
+        click.secho(f"No saved papers match '{query}'", fg="yellow")
+        return
+    display_papers(papers, format=fmt)
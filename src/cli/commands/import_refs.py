@@ -0,0 +1,144 @@
+from pathlib import Path
+from typing import Dict, Optional
+import click
+from src.api.metadata_api import SemanticScholarProvider
+from src.cli.context import IwadiContext
+from src.cli.utils.display import display_error
+from src.cli.utils.error_handler import api_error_handler
+from src.cli.utils.prefetch import Prefetcher, DEFAULT_PREFETCH_KBPS
+from src.storage.cache import MetadataCache
+from src.storage.db import set_pdf_paths
+from src.storage.references import import_references, iter_references
+from src.storage.write_queue import WriteQueue
+
+DOWNLOAD_CHUNK = 50
+
+
+@click.command()
+@click.argument(
+    "reference_file", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--project",
+    "-p",
+    help="Project to import into (uses active project if not specified)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "ref_format",
+    type=click.Choice(["bibtex", "ris"], case_sensitive=False),
+    help="Reference format (inferred from the file extension by default)",
+)
+@click.option(
+    "--resolve/--no-resolve",
+    default=True,
+    help="Resolve DOIs and arXiv IDs through batched metadata lookups",
+    show_default=True,
+)
+@click.option(
+    "--download",
+    is_flag=True,
+    help="Download arXiv PDFs after all metadata has been imported",
+)
+@click.option(
+    "--batch-size",
+    default=5000,
+    type=click.IntRange(1),
+    help="Entries resolved and committed per transaction",
+    show_default=True,
+)
+@click.option(
+    "--queue",
+    is_flag=True,
+    help="Hand batches to a single writer (for several importers on one project)",
+)
+@click.pass_context
+@api_error_handler
+def import_refs(
+    ctx: click.Context,
+    reference_file: Path,
+    project: Optional[str],
+    ref_format: Optional[str],
+    resolve: bool,
+    download: bool,
+    batch_size: int,
+    queue: bool,
+) -> None:
+    """
+    Import a BibTeX or RIS library into a project.
+
+    Examples:
+
+        iwadi import refs.bib --project thesis
+        iwadi import zotero.ris --project thesis --download
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+        write_queue = WriteQueue(target_project) if queue else None
+        entries = iter_references(reference_file, ref_format)
+        result = import_references(
+            entries,
+            target_project,
+            provider=SemanticScholarProvider() if resolve else None,
+            cache=MetadataCache() if resolve else None,
+            batch_size=batch_size,
+            queue=write_queue,
+        )
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    click.secho(
+        f"Imported {result.imported} references into '{target_project.name}'",
+        fg="green",
+    )
+    if result.unresolved:
+        click.secho(
+            f"{result.unresolved} references could not be looked up and were "
+            "imported as parsed; re-run the import to resolve them",
+            fg="yellow",
+        )
+    if result.queued:
+        click.echo(
+            f"{result.queued} more are queued for the importer currently "
+            "writing to this project"
+        )
+
+    if not result.pending_downloads:
+        return
+    if not download:
+        click.echo(
+            f"{len(result.pending_downloads)} PDFs available; "
+            "re-run with --download to fetch them"
+        )
+        return
+
+    # metadata is already committed, so a failed download only loses that PDF
+    pending = result.pending_downloads
+    with click.progressbar(length=len(pending), label="Downloading PDFs") as bar:
+        for start in range(0, len(pending), DOWNLOAD_CHUNK):
+            chunk = pending[start : start + DOWNLOAD_CHUNK]
+            downloaded: Dict[str, Path] = {}
+            with Prefetcher(
+                {}, top_k=len(chunk), max_kbps=DEFAULT_PREFETCH_KBPS
+            ) as prefetcher:
+                prefetcher.start(chunk)
+                for paper in chunk:
+                    pdf_path = target_project.pdf_path_for(paper.id)
+                    if prefetcher.promote(paper, pdf_path):
+                        downloaded[paper.id] = pdf_path
+                    bar.update(1)
+            if write_queue is None:
+                set_pdf_paths(target_project, downloaded)
+            else:
+                # queued behind the metadata batches, whose rows may not
+                # have been written yet
+                write_queue.save_papers(
+                    [p for p in chunk if p.id in downloaded], downloaded
+                )
+
+    if write_queue is not None and write_queue.outstanding():
+        click.echo("Downloaded PDFs are recorded once the queue is written")
@@ -1,16 +1,73 @@
 from pathlib import Path
+from typing import Optional
 import click
+from tabulate import tabulate
+from src.cli.project import default_projects_root
+from src.storage.catalog import ProjectCatalog
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KB", "MB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
 
 
 @click.command()
-def list() -> None:
+@click.option(
+    "--path",
+    "-p",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    help="Projects root to list (default: ~/iwadi_projects)",
+)
+@click.option("--stats", is_flag=True, help="Show paper counts, PDF sizes and dates")
+@click.option(
+    "--rescan", is_flag=True, help="Rebuild the catalog from the project directories"
+)
+def list(path: Optional[Path], stats: bool, rescan: bool) -> None:
     """List all research projects"""
-    base_path = Path.home() / "iwadi_projects"
-    if not base_path.exists() or not any(base_path.iterdir()):
+    base_path = path or default_projects_root()
+    if not base_path.exists():
+        click.secho("No projects found", fg="yellow")
+        return
+
+    catalog = ProjectCatalog(base_path)
+    if rescan:
+        catalog.rebuild()
+    else:
+        # first run against an older projects root: catalogue it once
+        catalog.ensure_scanned()
+    entries = catalog.entries()
+
+    if not entries:
         click.secho("No projects found", fg="yellow")
         return
 
     click.secho("Your research projects:", fg="cyan", bold=True)
-    for project in sorted(base_path.iterdir()):
-        if project.is_dir():
-            click.echo(f"• {project.name}")
+    if not stats:
+        for entry in entries:
+            click.echo(f"• {entry.name}")
+        return
+
+    rows = [
+        [
+            entry.name,
+            entry.paper_count,
+            format_bytes(entry.pdf_bytes),
+            (entry.created or "")[:10],
+            (entry.modified_at or "")[:16].replace("T", " "),
+        ]
+        for entry in entries
+    ]
+    click.echo(
+        tabulate(
+            rows,
+            headers=["Project", "Papers", "PDFs", "Created", "Modified"],
+            tablefmt="simple",
+            colalign=("left", "right", "right", "left", "left"),
+        )
+    )
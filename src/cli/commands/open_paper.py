@@ -0,0 +1,69 @@
+from typing import Optional
+import click
+from src.api.arxiv_ids import arxiv_base_id
+from src.cli.commands.save import ensure_pdf
+from src.cli.context import IwadiContext
+from src.cli.utils.display import display_error
+from src.cli.utils.error_handler import api_error_handler
+from src.storage.store import get_store
+
+
+@click.command()
+@click.argument("query", required=True)
+@click.option(
+    "--project",
+    "-p",
+    help="Project to open from (uses active project if not specified)",
+)
+@click.option(
+    "--print-path", is_flag=True, help="Print the PDF's path instead of opening it"
+)
+@click.pass_context
+@api_error_handler
+def open_paper(
+    ctx: click.Context, query: str, project: Optional[str], print_path: bool
+) -> None:
+    """
+    Open a saved paper's PDF, fetching it first if it is not on disk.
+
+    QUERY matches an ID, a DOI or part of a title, as in 'iwadi find'.
+    arXiv IDs may be given bare, with an arXiv: prefix or with a version.
+
+    Examples:
+
+        iwadi open 1706.03762
+        iwadi open arXiv:1706.03762v7
+        iwadi open "residual learning" --print-path
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    matches = get_store(target_project).find_exact(query, limit=5)
+    ids = {query, arxiv_base_id(query)}
+    exact = [p for p in matches if p.id in ids or p.doi == query]
+    if len(exact) == 1:
+        matches = exact
+    if not matches:
+        click.secho(f"No saved papers match '{query}'", fg="yellow")
+        raise click.Abort()
+    if len(matches) > 1:
+        click.secho(f"'{query}' matches several papers:", fg="yellow")
+        for paper in matches:
+            click.echo(f"  {paper.id}  {paper.title[:70]}")
+        raise click.Abort()
+
+    try:
+        pdf_path = ensure_pdf(target_project, matches[0].id)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    if print_path:
+        click.echo(str(pdf_path))
+    else:
+        click.launch(str(pdf_path))
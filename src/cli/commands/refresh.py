@@ -0,0 +1,66 @@
+from typing import Optional
+import click
+from src.api.arxiv_api import ArxivAPI
+from src.cli.commands.save import save_selected
+from src.cli.context import IwadiContext
+from src.cli.utils.display import display_error
+from src.cli.utils.error_handler import api_error_handler
+from src.storage.db import iter_papers, saved_versions
+
+
+@click.command()
+@click.option(
+    "--project", "-p", help="Project to refresh (uses active project if not specified)"
+)
+@click.option(
+    "--check", is_flag=True, help="Only report new versions, don't download them"
+)
+@click.pass_context
+@api_error_handler
+def refresh(ctx: click.Context, project: Optional[str], check: bool) -> None:
+    """
+    Check saved arXiv papers for new versions and download them.
+
+    All papers are checked with batched arXiv queries; only papers with a
+    newer version than the one saved are downloaded again.
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    paper_ids = [
+        p.id for p in iter_papers(target_project, source="arXiv", columns=("id",))
+    ]
+    # papers saved without a version (e.g. imported references) have no
+    # download to bring up to date
+    known = saved_versions(target_project, paper_ids)
+    if not known:
+        click.secho("No versioned arXiv papers to refresh", fg="yellow")
+        return
+
+    latest = ArxivAPI().latest_versions(list(known))
+    updates = [
+        paper
+        for paper_id, paper in latest.items()
+        if paper.version is not None and paper.version > known[paper_id]
+    ]
+    if not updates:
+        click.secho(f"All {len(known)} arXiv papers are up to date", fg="green")
+        return
+
+    for paper in updates:
+        click.echo(f"v{known[paper.id]} → v{paper.version}: {paper.title[:60]}")
+    if check:
+        click.secho(f"\n{len(updates)} papers have new versions", fg="yellow")
+        return
+
+    saved = save_selected(updates, target_project)
+    click.secho(
+        f"\nUpdated {saved} of {len(updates)} papers in '{target_project.name}'",
+        fg="green",
+        bold=True,
+    )
@@ -1,14 +1,21 @@
-from typing import Optional, List
+from typing import AbstractSet, Optional, List
 import click
-from src.api.base_api import Paper
+import os
+from pathlib import Path
+from src.api.base_api import Paper, ResearchAPI
+from src.api.base_api_error import BaseAPIError
 from src.cli.utils.interactive import prompt_paper_selection
+from src.cli.utils.prefetch import Prefetcher
 from src.cli.utils.error_handler import api_error_handler
 from src.api.arxiv_api import ArxivAPI
 from src.api.ieee_api import IEEEAPI
 from src.cli.context import IwadiContext
-from src.storage.db import save_paper_in_db
+from src.storage.db import save_paper_in_db, save_paper_text, saved_versions
+from src.storage.locks import move_into_place
+from src.storage.pdf_store import evict_pdfs
+from src.storage.session import SessionStore
+from src.storage.store import PDF_LOCAL, PDF_QUEUED, get_store
 from src.cli.project import Project
-from pathlib import Path
 
 API_MAP = {
     "arxiv": ArxivAPI(),
@@ -17,7 +24,7 @@ API_MAP = {
 
 
 @click.command()
-@click.argument("paper_ids", nargs=-1)
+@click.argument("paper_refs", nargs=-1)
 @click.option(
     "--project", "-p", help="Project to save to (uses active project if not specified)"
 )
@@ -25,47 +32,78 @@ API_MAP = {
 @click.pass_context
 @api_error_handler
 def save_papers(
-    ctx: click.Context, paper_ids: List[str], project: Optional[str], interactive: bool
+    ctx: click.Context, paper_refs: List[str], project: Optional[str], interactive: bool
 ) -> None:
-    """Save papers to a project."""
-    iwadi_ctx: IwadiContext = ctx.obj
-
-    if not project and not iwadi_ctx.active_project:
-        click.secho(
-            "No project specified and no active project set. "
-            "Use --project or set an active project.",
-            fg="red",
-        )
-        ctx.exit(1)
+    """
+    Save papers from recent search results to a project.
 
-    target_project_name = (
-        project if not iwadi_ctx.active_project else iwadi_ctx.active_project.name
-    )
+    Papers are given by ID or by their result number in the last search.
 
-    assert target_project_name is not None
+    Examples:
 
-    papers_dir = (
-        iwadi_ctx.get_papers_path()
-        if not project
-        else Path(f"projects/{target_project_name}/papers")
-    )
+        iwadi save 1 3 -p thesis
+        iwadi save http://arxiv.org/abs/1706.03762
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
 
-    if not paper_ids and not interactive:
+    if not paper_refs and not interactive:
         click.secho("Must specify either paper IDs or use --interactive", fg="red")
         ctx.exit(1)
 
-    available_papers = get_recent_papers()
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        click.secho(str(e), fg="red")
+        ctx.exit(1)
 
+    session = SessionStore()
     if interactive:
-        selected_papers = prompt_paper_selection(available_papers)
+        selected_papers = prompt_paper_selection(session.recent())
     else:
-        selected_papers = [p for p in available_papers if p.id in paper_ids]
+        selected_papers, missing = session.resolve(paper_refs)
+        for ref in missing:
+            click.secho(f"Not found in recent search results: {ref}", fg="yellow")
 
     if not selected_papers:
         click.secho("No papers selected to save.", fg="yellow")
         return
 
-    for paper in selected_papers:
+    saved = save_selected(selected_papers, target_project)
+
+    click.secho(
+        f"\nSaved {saved} papers to project '{target_project.name}'",
+        fg="green",
+        bold=True,
+    )
+
+
+def save_selected(
+    papers: List[Paper], project: Project, prefetcher: Optional[Prefetcher] = None
+) -> int:
+    """
+    Download papers into a project and record their metadata.
+
+    An arXiv paper whose version is already saved is skipped, so re-saving
+    never downloads the same PDF twice. In a lazy project only metadata (and
+    structured full text, when the source has it) is saved, and the PDF is
+    queued for :func:`ensure_pdf`. Afterwards the project's PDF budget is
+    enforced.
+
+    Args:
+        papers: Papers to save
+        project: Destination project
+        prefetcher: Background downloads to promote instead of re-downloading
+
+    Returns:
+        Number of papers saved
+    """
+    known_versions = saved_versions(project, [p.id for p in papers])
+    saved = 0
+    for paper in papers:
+        known = known_versions.get(paper.id)
+        if paper.version is not None and known is not None and known >= paper.version:
+            click.secho(f"Already saved (v{known}): {paper.title[:50]}...", fg="cyan")
+            continue
         if not paper.source:
             click.secho(f"Skipping {paper.id}: No source available", fg="yellow")
             continue
@@ -77,45 +115,117 @@ def save_papers(
             continue
 
         try:
-            source_api.download_paper(paper.id, dirpath=str(papers_dir))
+            pdf_path = project.pdf_path_for(paper.id)
+            lazy = project.pdf_mode == "lazy"
+            if lazy and known is not None and pdf_path.exists():
+                pdf_path.unlink()  # an older version; fetched anew on first use
+            full_text = None
+            if not (prefetcher and prefetcher.promote(paper, pdf_path)):
+                # structured full text makes the PDF download and parse unnecessary
+                full_text = _fetch_full_text(source_api, paper)
+                if full_text is None and not lazy:
+                    _download_pdf(source_api, paper.id, pdf_path)
             # metadata saving in DB
-            pdf_path = papers_dir / f"{paper.id}.pdf"
-            save_paper_in_db(
-                paper,
-                iwadi_ctx.active_project
-                or Project(name=target_project_name, base_path=Path("projects")),
-                pdf_path,
-            )
+            if pdf_path.exists():
+                save_paper_in_db(paper, project, pdf_path)
+            elif lazy:
+                save_paper_in_db(paper, project, pdf_path, pdf_state=PDF_QUEUED)
+            else:
+                save_paper_in_db(paper, project, None)
+            if full_text or pdf_path.exists():
+                _store_paper_text(paper.id, project, full_text, pdf_path)
 
             click.secho(f"✓ Saved {paper.title[:50]}...", fg="green")
+            saved += 1
         except Exception as e:
             click.secho(f"Failed to save {paper.id}: {str(e)}", fg="red")
 
-    click.secho(
-        f"\nSaved {len(selected_papers)} papers to project '{target_project_name}'",
-        fg="green",
-        bold=True,
-    )
+    _enforce_budget(project)
+    return saved
+
+
+def ensure_pdf(project: Project, paper_id: str) -> Path:
+    """
+    Local path of a saved paper's PDF, downloading it first if needed.
+
+    A PDF that was queued by a lazy save or evicted is fetched from the
+    paper's source; text is extracted from it if none is stored yet. The
+    PDF is then marked as just used, and the project's budget is enforced
+    without evicting it.
+
+    Raises:
+        ValueError: If the paper is not saved or its PDF cannot be fetched
+    """
+    store = get_store(project)
+    location = store.pdf_location(paper_id)
+    if location is None:
+        raise ValueError(f"Paper {paper_id} is not saved in '{project.name}'")
+    stored_path, state, source = location
+    pdf_path = Path(stored_path) if stored_path else project.pdf_path_for(paper_id)
+
+    if not pdf_path.exists():
+        source_api = API_MAP.get(source.lower())
+        if not source_api:
+            raise ValueError(f"Cannot fetch PDFs from source {source}")
+        _download_pdf(source_api, paper_id, pdf_path)
+        if not pdf_path.exists():
+            raise ValueError(f"Could not download the PDF of {paper_id}")
+        click.secho(f"Fetched {pdf_path.name}", fg="green")
+        store.set_pdf_paths({paper_id: pdf_path})
+        if store.get_paper_text(paper_id) is None:
+            _store_paper_text(paper_id, project, None, pdf_path)
+    elif state == PDF_LOCAL and stored_path == str(pdf_path):
+        # only the eviction order changes; the paper itself is untouched
+        store.touch_pdfs([paper_id])
+    else:
+        # repairs the state of a PDF that arrived outside ensure_pdf
+        store.set_pdf_paths({paper_id: pdf_path})
+
+    _enforce_budget(project, keep={paper_id})
+    return pdf_path
+
+
+def _enforce_budget(project: Project, keep: AbstractSet[str] = frozenset()) -> None:
+    evicted = evict_pdfs(project, keep=keep)
+    if evicted:
+        click.secho(
+            f"Evicted {len(evicted)} least recently used PDFs to stay under "
+            "the project's budget",
+            fg="cyan",
+        )
+
+
+def _download_pdf(source_api: ResearchAPI, paper_id: str, pdf_path: Path) -> None:
+    # download under a private name so concurrent workers never see (or
+    # clobber) a half-written PDF
+    part = pdf_path.with_name(f".{pdf_path.name}.{os.getpid()}.part")
+    source_api.download_paper(paper_id, dirpath=str(part.parent), filename=part.name)
+    if part.exists():
+        move_into_place(part, pdf_path)
+
+
+def _fetch_full_text(source_api: ResearchAPI, paper: Paper) -> Optional[str]:
+    try:
+        return source_api.get_full_text(paper.id)
+    except BaseAPIError as e:
+        click.secho(f"Full text unavailable for {paper.id}: {e.message}", fg="yellow")
+        return None
 
 
-def get_recent_papers() -> List[Paper]:
-    """Retrieve recently searched/fetched papers."""
-    # TODO: Replace with actual implementation
-    return [
-        Paper(
-            id="123",
-            title="Sample Paper 1",
-            authors=["Alice", "Bob"],
-            source="arxiv",
-            doi="10.1234/sample1",
-            abstract="Sample abstract 1",
-        ),
-        Paper(
-            id="456",
-            title="Sample Paper 2",
-            authors=["Charlie", "David"],
-            source="ieee",
-            doi="10.5678/sample2",
-            abstract="Sample abstract 2",
-        ),
-    ]
+def _store_paper_text(
+    paper_id: str, project: Project, full_text: Optional[str], pdf_path: Path
+) -> None:
+    """Store the full text, falling back to extracting it from the PDF."""
+    if full_text:
+        save_paper_text(project, paper_id, full_text, origin="fulltext")
+        return
+
+    try:
+        # deferred: PyMuPDF is only needed when there is no structured text
+        from src.ai.parser import extract_text_from_pdf
+
+        save_paper_text(
+            project, paper_id, extract_text_from_pdf(pdf_path), origin="pdf"
+        )
+    except Exception as e:
+        click.secho(f"Could not extract text from {pdf_path.name}: {e}", fg="yellow")
@@ -1,15 +1,34 @@
 import click
+import sys
+from contextlib import nullcontext, redirect_stdout
 from datetime import date
-from typing import Optional, List, Union, cast
+from typing import Dict, Optional, List, Set, Tuple, Union, cast
 
 from src.api.arxiv_api import ArxivAPI
 from src.api.ieee_api import IEEEAPI
 from src.api.base_api import ResearchAPI, Paper, SortBy, SortOrder
-from src.cli.utils.display import display_papers, display_error, validate_format
+from src.api.base_api_error import BaseAPIError
+from src.api.metadata_api import SemanticScholarProvider, enrich_citation_counts
+from src.api.paper_batch import PaperBatch
+from src.storage.cache import MetadataCache
+from src.storage.federated import FederatedQuery, saved_paper_ids
+from src.storage.session import SessionStore
+from src.cli.utils.display import (
+    STREAM_FORMATS,
+    display_papers,
+    display_error,
+    validate_format,
+)
 from src.cli.utils.interactive import prompt_paper_selection
 from src.cli.utils.error_handler import api_error_handler
-from src.cli.commands.save import save_papers
+from src.cli.utils.prefetch import (
+    Prefetcher,
+    DEFAULT_PREFETCH_K,
+    DEFAULT_PREFETCH_KBPS,
+)
+from src.cli.commands.save import save_selected
 from src.cli.context import IwadiContext
+from src.cli.project import default_projects_root
 
 API_MAP = {
     "arxiv": ArxivAPI(),
@@ -39,7 +58,7 @@ def get_api(source: str) -> Optional[Union[ResearchAPI, None]]:
     "--sort",
     "sort_by",
     default="relevance",
-    help="Sort method (relevance, author, last_updated_date, submitted_date)",
+    help="Sort method (relevance, author, last_updated_date, submitted_date, citations)",
     show_default=True,
 )
 @click.option(
@@ -57,15 +76,47 @@ def get_api(source: str) -> Optional[Union[ResearchAPI, None]]:
     help="Maximum results per source",
     show_default=True,
 )
+@click.option(
+    "--enrich/--no-enrich",
+    default=False,
+    help="Look up citation counts for all results in batches",
+    show_default=True,
+)
 @click.option("--save", "-S", is_flag=True, help="Prompt to save results after display")
+@click.option(
+    "--prefetch",
+    default=DEFAULT_PREFETCH_K,
+    type=click.IntRange(0, 100),
+    help="Top results to download in the background while selecting (0 disables)",
+    show_default=True,
+)
+@click.option(
+    "--prefetch-kbps",
+    default=DEFAULT_PREFETCH_KBPS,
+    type=click.IntRange(0),
+    help="Bandwidth cap for background downloads in KiB/s (0 means uncapped)",
+    show_default=True,
+)
 @click.option(
     "--format",
     "-f",
     "output_format",
     default="table",
-    help="Output format (table, json, etc.)",
+    help="Output format (table, json, minimal, ndjson, csv, tsv)",
     show_default=True,
 )
+@click.option("--local", is_flag=True, help="Search saved papers instead of sources")
+@click.option(
+    "--all-projects",
+    is_flag=True,
+    help="With --local, search every project and show where each paper is saved",
+)
+@click.option(
+    "--project",
+    "-p",
+    "local_project",
+    help="Project for --local (uses active project if not specified)",
+)
 @click.pass_context
 @api_error_handler
 def search(
@@ -78,8 +129,14 @@ def search(
     sort_by: str,
     sort_order: str,
     limit: int,
+    enrich: bool,
     save: bool,
+    prefetch: int,
+    prefetch_kbps: int,
     output_format: str,
+    local: bool,
+    all_projects: bool,
+    local_project: Optional[str],
 ) -> None:
     """
     Search research papers across multiple sources.
@@ -88,6 +145,7 @@ def search(
 
         iwadi search "quantum computing" --author "Preskill" --after 2018
         iwadi search "neural networks" --source arxiv --source ieee --limit 5
+        iwadi search "transformer" --local --all-projects
     """
 
     iwadi_ctx: IwadiContext = ctx.obj
@@ -101,9 +159,10 @@ def search(
         "author",
         "last_updated_date",
         "submitted_date",
+        "citations",
     ]:
         display_error(
-            "Invalid sort method. Choose from: relevance, author, last_updated_date, submitted_date"
+            "Invalid sort method. Choose from: relevance, author, last_updated_date, submitted_date, citations"
         )
         raise click.Abort()
 
@@ -111,13 +170,38 @@ def search(
         display_error("Invalid sort order. Choose from: ascending, descending")
         raise click.Abort()
 
-    sort_by_lit = cast(SortBy, sort_by.lower())
+    # citation counts are only comparable after enrichment, so sort locally
+    sort_by_citations = sort_by.lower() == "citations"
+    sort_by_lit = cast(SortBy, "relevance" if sort_by_citations else sort_by.lower())
     sort_order_lit = cast(SortOrder, sort_order.lower())
 
     after_date = date(after, 1, 1) if after else None
     before_date = date(before, 12, 31) if before else None
 
     all_results: List[Paper] = []
+    locations: Dict[str, List[str]] = {}
+    saved_ids: Optional[Set[str]] = None
+
+    if local or all_projects:
+        try:
+            matches = _search_saved(
+                iwadi_ctx,
+                search,
+                author,
+                after_date,
+                before_date,
+                limit,
+                local_project,
+                all_projects,
+            )
+        except ValueError as e:
+            display_error(str(e))
+            raise click.Abort()
+        all_results = [paper for paper, _ in matches]
+        locations = {paper.id: projects for paper, projects in matches}
+        # stored citation counts are used as they are
+        enrich = False
+        sources = []
 
     for source in sources:
         api = get_api(source)
@@ -143,21 +227,100 @@ def search(
             continue
 
     if not all_results:
-        display_error("No results found across all sources")
+        display_error(
+            "No saved papers match"
+            if local or all_projects
+            else "No results found across all sources"
+        )
         raise click.Abort()
 
+    if enrich or sort_by_citations:
+        try:
+            enrich_citation_counts(
+                all_results, SemanticScholarProvider(), MetadataCache()
+            )
+        except BaseAPIError as e:
+            display_error(f"Could not fetch citation counts: {e.message}")
+
+    # the same paper found in several sources is listed once, by its DOI
+    batch = PaperBatch.from_papers(all_results).dedupe()
+    if sort_by_citations:
+        batch = batch.rank_by_citations(descending=sort_order_lit == "descending")
+    all_results = batch.to_papers()
+
+    if not (local or all_projects):
+        # near-free for unsaved papers; only filter hits touch the databases
+        saved_ids = saved_paper_ids(all_results, default_projects_root())
+
     try:
         fmt = validate_format(output_format)
-        display_papers(all_results, format=fmt)
+        display_papers(all_results, format=fmt, saved=saved_ids)
     except ValueError as e:
         display_error(str(e))
         raise click.Abort()
+    if all_projects and fmt not in ("json",) + STREAM_FORMATS:
+        click.echo()
+        for number, paper in enumerate(all_results, 1):
+            click.echo(f"{number}. saved in: {', '.join(locations[paper.id])}")
 
-    if save or click.confirm("\nWould you like to save any papers?"):
-        selected = prompt_paper_selection(all_results)
-        if selected:
-            project = click.prompt("Enter project name to save to")
-            save_papers(selected, project_name=project, ctx=iwadi_ctx)
-            click.secho(
-                f"Saved {len(selected)} papers to project '{project}'", fg="green"
-            )
+    # lets 'iwadi save <number>' pick from these results without re-querying
+    SessionStore().record_results(all_results)
+
+    # piped rows must stay parseable: only offer to save when asked, and
+    # keep the selection flow's prompts and messages on stderr
+    streaming = fmt in STREAM_FORMATS
+    if save or (
+        not streaming
+        and click.confirm("\nWould you like to save any papers?", err=True)
+    ):
+        # download the likely picks while the user is still choosing
+        prefetcher = (
+            Prefetcher(API_MAP, top_k=prefetch, max_kbps=prefetch_kbps)
+            if prefetch
+            else None
+        )
+        try:
+            if prefetcher:
+                prefetcher.start(all_results)
+
+            with redirect_stdout(sys.stderr) if streaming else nullcontext():
+                selected = prompt_paper_selection(all_results, saved_ids)
+                if selected:
+                    project_name = click.prompt(
+                        "Enter project name to save to", err=True
+                    )
+                    try:
+                        project = iwadi_ctx.resolve_project(project_name)
+                    except ValueError as e:
+                        display_error(str(e))
+                        raise click.Abort()
+
+                    saved = save_selected(selected, project, prefetcher)
+                    click.secho(
+                        f"Saved {saved} papers to project '{project.name}'",
+                        fg="green",
+                    )
+        finally:
+            if prefetcher:
+                prefetcher.close()
+
+
+def _search_saved(
+    iwadi_ctx: IwadiContext,
+    query: str,
+    author: Optional[str],
+    after: Optional[date],
+    before: Optional[date],
+    limit: int,
+    project: Optional[str],
+    all_projects: bool,
+) -> List[Tuple[Paper, List[str]]]:
+    """Search saved papers in one project or, federated, in all of them."""
+    if all_projects:
+        federated = FederatedQuery.from_root(default_projects_root())
+    else:
+        target = iwadi_ctx.resolve_project(project)
+        federated = FederatedQuery([(target.name, target.path / "iwadi.db")])
+    return federated.search(
+        query, limit=limit, author=author, after=after, before=before
+    )
@@ -0,0 +1,113 @@
+from typing import Optional
+import click
+from src.cli.context import IwadiContext
+from src.cli.project import PDF_MODES
+from src.cli.utils.display import display_error
+from src.storage.pdf_store import (
+    evict_pdfs,
+    papers_usage,
+    parse_size,
+    prune_orphaned_pdfs,
+)
+from src.storage.store import PDF_EVICTED, PDF_LOCAL, PDF_QUEUED, get_store
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"
+
+
+@click.command()
+@click.option(
+    "--project", "-p", help="Project to manage (uses active project if not specified)"
+)
+@click.option(
+    "--pdf-mode",
+    type=click.Choice(PDF_MODES),
+    help="eager downloads PDFs on save; lazy fetches them on first open",
+)
+@click.option(
+    "--budget",
+    help="Disk budget for PDFs, e.g. 500M or 2G ('none' removes it)",
+)
+@click.option("--evict", is_flag=True, help="Evict PDFs over the budget now")
+@click.option(
+    "--prune",
+    is_flag=True,
+    help="Delete PDFs of papers that a library upgrade removed",
+)
+@click.pass_context
+def storage(
+    ctx: click.Context,
+    project: Optional[str],
+    pdf_mode: Optional[str],
+    budget: Optional[str],
+    evict: bool,
+    prune: bool,
+) -> None:
+    """
+    Show or change how a project stores PDFs.
+
+    Over budget, the least recently opened PDFs are deleted; their metadata
+    and extracted text stay, and 'iwadi open' fetches them again.
+
+    Upgrading a library can fold papers together, e.g. older arXiv versions
+    into the newest one. Their PDFs are kept until --prune deletes them.
+
+    Examples:
+
+        iwadi storage -p thesis --pdf-mode lazy --budget 2G
+        iwadi storage -p thesis --evict
+        iwadi storage -p thesis --prune
+    """
+    iwadi_ctx: IwadiContext = ctx.obj
+
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+        budget_bytes = parse_size(budget) if budget is not None else None
+    except ValueError as e:
+        display_error(str(e))
+        raise click.Abort()
+
+    if pdf_mode is not None or budget is not None:
+        if pdf_mode is not None:
+            target_project.pdf_mode = pdf_mode
+        if budget is not None:
+            target_project.pdf_budget = budget_bytes
+        target_project.save_metadata()
+        click.secho("Storage settings updated", fg="green")
+
+    if evict or budget is not None:
+        evicted = evict_pdfs(target_project)
+        if evicted:
+            click.secho(f"Evicted {len(evicted)} PDFs", fg="cyan")
+
+    if prune:
+        deleted, skipped = prune_orphaned_pdfs(target_project)
+        for path in deleted:
+            click.echo(f"Deleted {path}")
+        for path in skipped:
+            click.secho(f"Skipped {path}: not in the papers directory", fg="yellow")
+        click.secho(f"Pruned {len(deleted)} orphaned PDFs", fg="cyan")
+
+    store = get_store(target_project)
+    counts = store.pdf_state_counts()
+    orphaned = len(store.orphaned_pdfs())
+    limit = target_project.pdf_budget
+    click.echo(f"PDF mode: {target_project.pdf_mode}")
+    click.echo(
+        f"PDFs on disk: {_format_size(papers_usage(target_project.papers_path))}"
+        + (f" of {_format_size(limit)}" if limit is not None else " (no budget)")
+    )
+    click.echo(
+        f"Local: {counts.get(PDF_LOCAL, 0)}, queued: {counts.get(PDF_QUEUED, 0)}, "
+        f"evicted: {counts.get(PDF_EVICTED, 0)}, without PDF: {counts.get(None, 0)}"
+    )
+    if orphaned:
+        click.secho(
+            f"Orphaned PDFs: {orphaned} (delete them with --prune)", fg="yellow"
+        )
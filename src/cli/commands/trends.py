@@ -0,0 +1,96 @@
+from datetime import date
+from typing import Dict, List, Optional
+import click
+from tabulate import tabulate
+from src.api.trends import count_by_year
+from src.cli.commands.search import API_MAP, get_api
+from src.cli.utils.display import display_error
+from src.cli.utils.error_handler import api_error_handler
+from src.storage.cache import MetadataCache
+
+BAR_WIDTH = 40
+
+
+@click.command()
+@click.argument("query", required=True)
+@click.option(
+    "--by",
+    "group_by",
+    type=click.Choice(["year"]),
+    default="year",
+    help="Bucket to aggregate counts by",
+    show_default=True,
+)
+@click.option(
+    "--source",
+    "-s",
+    "sources",
+    multiple=True,
+    default=["arxiv"],
+    help="Sources to count",
+)
+@click.option("--author", "-a", help="Filter by author name")
+@click.option("--after", type=int, help="First year (default: ten years ago)")
+@click.option("--before", type=int, help="Last year (default: this year)")
+@click.option("--refresh", is_flag=True, help="Ignore cached counts")
+@click.pass_context
+@api_error_handler
+def trends(
+    ctx: click.Context,
+    query: str,
+    group_by: str,
+    sources: List[str],
+    author: Optional[str],
+    after: Optional[int],
+    before: Optional[int],
+    refresh: bool,
+) -> None:
+    """
+    Show how many papers match a query per year, without fetching records.
+
+    Examples:
+
+        iwadi trends "diffusion models" --by year
+        iwadi trends "federated learning" -s arxiv -s ieee --after 2015
+    """
+    last_year = before or date.today().year
+    first_year = after or last_year - 9
+    if first_year > last_year:
+        display_error("--after must not be later than --before")
+        raise click.Abort()
+
+    years = range(first_year, last_year + 1)
+    cache = MetadataCache()
+    columns: Dict[str, Dict[int, int]] = {}
+
+    for source in sources:
+        api = get_api(source)
+        if not api:
+            display_error(
+                f"Unknown source: {source}. Valid sources: {', '.join(API_MAP.keys())}"
+            )
+            continue
+        columns[source] = count_by_year(
+            api, source.lower(), query, years, cache, author=author, refresh=refresh
+        )
+
+    if not columns:
+        raise click.Abort()
+
+    totals = {year: sum(counts[year] for counts in columns.values()) for year in years}
+    peak = max(totals.values()) or 1
+    rows = [
+        [
+            year,
+            *(counts[year] for counts in columns.values()),
+            "█" * round(BAR_WIDTH * totals[year] / peak),
+        ]
+        for year in years
+    ]
+    click.echo(
+        tabulate(
+            rows,
+            headers=[group_by.capitalize(), *columns.keys(), ""],
+            tablefmt="simple",
+        )
+    )
@@ -1,33 +1,33 @@
 import click
 import subprocess
+from typing import Optional
 from src.cli.context import IwadiContext
+from src.storage.snapshot import ProjectSnapshot
 
 
 @click.command()
+@click.option(
+    "--project", "-p", help="Project to view (uses active project if not specified)"
+)
+@click.option("--rebuild", is_flag=True, help="Rebuild the snapshot from scratch")
 @click.pass_context
-def view(ctx: click.Context) -> None:
+def view(ctx: click.Context, project: Optional[str], rebuild: bool) -> None:
     """Launches Datasette for viewing papers metadata in the current project."""
 
-    # Get the active project from the context
     iwadi_ctx: IwadiContext = ctx.obj
-    active_project = iwadi_ctx.active_project
-
-    if not active_project:
-        click.secho(
-            "No active project set. Please create or set a project first.", fg="red"
-        )
+    try:
+        target_project = iwadi_ctx.resolve_project(project)
+    except ValueError as e:
+        click.secho(f"{e}. Please create or set a project first.", fg="red")
         ctx.exit(1)
 
-    # Path to the metadata.db (Assumes 'metadata.db' is in the project base directory)
-    metadata_db_path = active_project.path / "metadata.db"
-
-    if not metadata_db_path.exists():
-        click.secho(
-            f"Error: No 'metadata.db' found in the active project directory ({metadata_db_path})",
-            fg="red",
-        )
-        ctx.exit(1)
+    # Datasette reads a snapshot, so browsing never holds locks on iwadi.db
+    snapshot = ProjectSnapshot(target_project)
+    changed = snapshot.sync(rebuild=rebuild)
+    click.echo(f"Snapshot updated ({changed} papers changed)")
 
-    # Launch Datasette to view the database
-    click.secho(f"Launching Datasette for project: {active_project.name}", fg="green")
-    subprocess.run(["datasette", str(metadata_db_path)], check=True)
+    click.secho(f"Launching Datasette for project: {target_project.name}", fg="green")
+    subprocess.run(
+        ["datasette", str(snapshot.path), "--metadata", str(snapshot.metadata_path)],
+        check=True,
+    )
@@ -1,6 +1,7 @@
 from typing import Optional
 from pathlib import Path
-from src.cli.project import Project
+from src.cli.project import Project, default_projects_root
+from src.storage.catalog import CATALOG_FILENAME, ProjectCatalog
 
 
 class IwadiContext:
@@ -16,3 +17,22 @@ class IwadiContext:
         if not self.active_project:
             raise ValueError("No active project set")
         return self.active_project.papers_path
+
+    def resolve_project(self, name: Optional[str] = None) -> Project:
+        """Load the named project, falling back to the active project."""
+        if not name:
+            if not self.active_project:
+                raise ValueError("No project specified and no active project set")
+            return self.active_project
+        if self.active_project and self.active_project.name == name:
+            return self.active_project
+
+        root = default_projects_root()
+        project_path = root / name
+        if (root / CATALOG_FILENAME).exists():
+            # projects created with --path are catalogued under the default root
+            project_path = ProjectCatalog(root).find(name) or project_path
+        metadata_path = project_path / "project_meta.json"
+        if not metadata_path.exists():
+            raise ValueError(f"Project '{name}' not found at {metadata_path.parent}")
+        return Project.from_metadata(metadata_path)
@@ -3,7 +3,24 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict
 import json
-from typing import Optional, List
+import os
+import re
+from typing import Optional
+
+
+def default_projects_root() -> Path:
+    """Directory holding projects created without a custom --path."""
+    return Path.home() / "iwadi_projects"
+
+
+# "eager" downloads PDFs when papers are saved; "lazy" saves metadata only
+# and fetches each PDF the first time it is opened or its text is needed
+PDF_MODES = ("eager", "lazy")
+
+
+def pdf_filename(paper_id: str) -> str:
+    """File name for a paper's PDF, with path-unsafe ID characters replaced."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", paper_id) + ".pdf"
 
 
 @dataclass
@@ -11,13 +28,14 @@ class Project:
     name: str
     base_path: Path
     created: Optional[str] = None
-    papers: Optional[List] = None
+    pdf_mode: str = "eager"
+    # bytes of PDFs kept under papers/ before the least recently used are
+    # evicted; None keeps every PDF
+    pdf_budget: Optional[int] = None
 
     def __post_init__(self) -> None:
         if self.created is None:
             self.created = datetime.now().isoformat()
-        if self.papers is None:
-            self.papers = []
 
     @property
     def path(self) -> Path:
@@ -35,29 +53,42 @@ class Project:
     def metadata_path(self) -> Path:
         return self.path / "project_meta.json"
 
+    def pdf_path_for(self, paper_id: str) -> Path:
+        """Location of a paper's PDF inside the project."""
+        return self.papers_path / pdf_filename(paper_id)
+
     def to_dict(self) -> Dict:
+        # paper membership lives in iwadi.db, so this stays small and static
         return {
             "project_name": self.name,
             "created": self.created,
-            "papers": self.papers,
             "paths": {
                 "root": str(self.path),
                 "papers": str(self.papers_path),
                 "notes": str(self.notes_path),
             },
+            "storage": {"pdf_mode": self.pdf_mode, "pdf_budget": self.pdf_budget},
         }
 
     def save_metadata(self) -> None:
-        """Save project metadata to file"""
-        self.metadata_path.write_text(json.dumps(self.to_dict(), indent=2))
+        """Save project metadata to file, atomically replacing any old copy"""
+        tmp_path = self.metadata_path.with_name(f".{self.metadata_path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(self.to_dict(), indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.metadata_path)
 
     @classmethod
     def from_metadata(cls, metadata_path: Path) -> "Project":
         """Load project from metadata file"""
+        # older files also carry a "papers" list; iwadi.db is authoritative
         data = json.loads(metadata_path.read_text())
+        storage = data.get("storage", {})
         return cls(
             name=data["project_name"],
             base_path=Path(data["paths"]["root"]).parent,
             created=data["created"],
-            papers=data["papers"],
+            pdf_mode=storage.get("pdf_mode", "eager"),
+            pdf_budget=storage.get("pdf_budget"),
         )
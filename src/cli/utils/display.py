@@ -1,95 +1,270 @@
-from typing import List, Literal, Optional
-from tabulate import tabulate
+import csv
+import io
+import json
+import math
+import os
+from typing import (
+    Any,
+    AbstractSet,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+)
 import click
 from src.api.base_api import Paper
 
-DisplayFormat = Literal["table", "json", "minimal"]
+DisplayFormat = Literal["table", "json", "minimal", "ndjson", "csv", "tsv"]
+DISPLAY_FORMATS = ("table", "json", "minimal", "ndjson", "csv", "tsv")
+# written one paper at a time as the papers arrive, for piping into other tools
+STREAM_FORMATS = ("ndjson", "csv", "tsv")
+RECORD_FIELDS = ("id", "title", "authors", "year", "source", "doi", "citations", "url")
 
+# table rows per page, and rows measured to size the columns; cells in
+# later rows that do not fit are cut short
+DEFAULT_PAGE_ROWS = int(os.getenv("IWADI_PAGE_ROWS", "25"))
+DEFAULT_WIDTH_SAMPLE = 200
+_AUTHORS_WIDTH = 40
 
-def display_papers(papers: List[Paper], format: DisplayFormat = "table") -> None:
+SAVED_BADGE = "saved"
+
+
+def saved_badge(paper: Paper, saved: Optional[AbstractSet[str]]) -> str:
+    """Styled marker for papers already saved in a project, else empty."""
+    if saved and paper.id in saved:
+        return click.style(f"[{SAVED_BADGE}]", fg="green")
+    return ""
+
+
+def display_papers(
+    papers: Iterable[Paper],
+    format: DisplayFormat = "table",
+    saved: Optional[AbstractSet[str]] = None,
+) -> None:
     """
     Display papers in the specified format
 
     Args:
-        papers: List of Paper objects to display
-        format: Output format (table|json|minimal)
+        papers: Papers to display; streaming formats consume an iterator
+            lazily, the others load it into a list first
+        format: Output format (table|json|minimal|ndjson|csv|tsv)
+        saved: IDs of papers already saved in some project, to mark as such
     """
+    if format in STREAM_FORMATS:
+        empty = True
+        for lines in stream_papers(papers, format, saved):
+            click.echo(lines, nl=False)
+            empty = False
+        if empty:
+            # stderr, so nothing but rows reaches a pipe
+            click.secho("No papers to display", fg="yellow", err=True)
+        return
+
+    papers = list(papers)
     if not papers:
         click.secho("No papers to display", fg="yellow")
         return
 
     if format == "json":
-        _display_json(papers)
+        _display_json(papers, saved)
     elif format == "minimal":
-        _display_minimal(papers)
+        _display_minimal(papers, saved)
     else:
-        _display_table(papers)
+        _display_table(papers, saved)
 
 
 def validate_format(format_str: str) -> DisplayFormat:
     """Convert and validate display format"""
-    if format_str.lower() in ("table", "json", "minimal"):
+    if format_str.lower() in DISPLAY_FORMATS:
         return format_str.lower()  # type: ignore
     raise ValueError(f"Invalid format: {format_str}")
 
 
-def _display_table(papers: List[Paper]) -> None:
-    """Display papers in a formatted table"""
-    headers = ["#", "Title", "Authors", "Year", "Source", "Citations"]
-    rows = []
+class PagedTable:
+    """
+    Grid table of papers rendered one page at a time.
 
-    for idx, paper in enumerate(papers, 1):
+    Column widths come from the headers and the first ``sample`` rows, so
+    a page is formatted from its own rows only and every page lines up.
+    """
+
+    def __init__(
+        self,
+        papers: Sequence[Paper],
+        saved: Optional[AbstractSet[str]] = None,
+        page_rows: int = DEFAULT_PAGE_ROWS,
+        sample: int = DEFAULT_WIDTH_SAMPLE,
+    ) -> None:
+        self.papers = papers
+        self.saved = saved
+        self.page_rows = max(1, page_rows)
+        self.headers = ["#", "Title", "Authors", "Year", "Source", "Citations"]
+        if saved is not None:
+            self.headers.append("Saved")
+
+        self.widths = [len(h) for h in self.headers]
+        for index in range(min(sample, len(papers))):
+            for column, cell in enumerate(self._cells(index)):
+                self.widths[column] = max(self.widths[column], len(cell))
+        # row numbers are known up front, so they are never cut
+        self.widths[0] = max(self.widths[0], len(str(len(papers))))
+        self.widths[2] = min(self.widths[2], _AUTHORS_WIDTH)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, math.ceil(len(self.papers) / self.page_rows))
+
+    def _cells(self, index: int) -> List[str]:
+        paper = self.papers[index]
+        # rows are one line high, so line breaks in titles become spaces
+        title = " ".join(paper.title.split())
         authors = ", ".join(paper.authors[:2])
         if len(paper.authors) > 2:
             authors += " et al."
+        cells = [
+            str(index + 1),
+            title[:60] + ("..." if len(title) > 60 else ""),
+            authors,
+            str(paper.publication_date.year) if paper.publication_date else "N/A",
+            paper.source or "Unknown",
+            str(paper.citation_count or 0),
+        ]
+        if self.saved is not None:
+            cells.append(f"[{SAVED_BADGE}]" if paper.id in self.saved else "")
+        return cells
 
-        year = paper.publication_date.year if paper.publication_date else "N/A"
+    def _line(self, fill: str) -> str:
+        return "+" + "+".join(fill * (width + 2) for width in self.widths) + "+"
 
-        rows.append(
-            [
-                idx,
-                click.style(
-                    paper.title[:60] + ("..." if len(paper.title) > 60 else ""),
-                    bold=True,
-                ),
-                authors,
-                year,
-                paper.source or "Unknown",
-                paper.citation_count or 0,
-            ]
-        )
+    def _row(self, cells: List[str], styled: bool) -> str:
+        out = []
+        for column, (cell, width) in enumerate(zip(cells, self.widths)):
+            if len(cell) > width:
+                cell = cell[: max(width - 3, 0)] + "..."[:width]
+            numeric = self.headers[column] in ("#", "Year", "Citations")
+            cell = cell.rjust(width) if numeric else cell.ljust(width)
+            # styles go on after padding, which must not count escape codes
+            if styled and self.headers[column] == "Title":
+                cell = click.style(cell, bold=True)
+            elif styled and self.headers[column] == "Saved" and cell.strip():
+                cell = click.style(cell, fg="green")
+            out.append(cell)
+        return "| " + " | ".join(out) + " |"
+
+    def render_page(self, page: int, header: bool = True) -> str:
+        """One page of rows, with the table header unless ``header`` is False."""
+        lines = []
+        if header:
+            lines += [self._line("-"), self._row(self.headers, False), self._line("=")]
+        start = page * self.page_rows
+        for index in range(start, min(start + self.page_rows, len(self.papers))):
+            lines += [self._row(self._cells(index), True), self._line("-")]
+        return "\n".join(lines)
 
-    click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+    def iter_pages(self) -> Iterator[str]:
+        """Every page as one continuous table, rendered as it is consumed."""
+        for page in range(self.page_count):
+            yield self.render_page(page, header=page == 0) + "\n"
 
 
-def _display_minimal(papers: List[Paper]) -> None:
+def _display_table(papers: List[Paper], saved: Optional[AbstractSet[str]]) -> None:
+    """Display papers in a formatted table, through the pager if it spans pages"""
+    table = PagedTable(papers, saved)
+    if table.page_count > 1:
+        # the pager pulls pages as it scrolls, so only what it shows is rendered
+        click.echo_via_pager(table.iter_pages())
+    else:
+        click.echo(table.render_page(0))
+
+
+def _display_minimal(papers: List[Paper], saved: Optional[AbstractSet[str]]) -> None:
     """Display minimal compact output"""
     for idx, paper in enumerate(papers, 1):
         authors = ", ".join(a.split()[0] for a in paper.authors[:2])
         year = paper.publication_date.year if paper.publication_date else "N/A"
+        badge = saved_badge(paper, saved)
         click.echo(
             f"{idx}. {click.style(paper.title[:80], bold=True)} ({authors}, {year})"
+            + (f" {badge}" if badge else "")
+        )
+
+
+def paper_record(
+    paper: Paper, saved: Optional[AbstractSet[str]] = None
+) -> Dict[str, Any]:
+    """Machine-readable fields of a paper, as written by the JSON-like formats."""
+    record: Dict[str, Any] = {
+        "id": paper.id,
+        "title": paper.title,
+        "authors": paper.authors,
+        "year": paper.publication_date.year if paper.publication_date else None,
+        "source": paper.source,
+        "doi": paper.doi,
+        "citations": paper.citation_count,
+        "url": paper.pdf_url or (f"https://doi.org/{paper.doi}" if paper.doi else None),
+    }
+    if saved is not None:
+        record["saved"] = paper.id in saved
+    return record
+
+
+def _cell(value: Any, single_line: bool) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        value = "; ".join(value)
+    text = str(value)
+    # TSV has no quoting, so tabs and newlines are folded into spaces
+    return " ".join(text.split()) if single_line else text
+
+
+def stream_papers(
+    papers: Iterable[Paper],
+    format: DisplayFormat,
+    saved: Optional[AbstractSet[str]] = None,
+) -> Iterator[str]:
+    """
+    Lazily render papers as NDJSON, CSV or TSV.
+
+    Yields one newline-terminated row per paper (the CSV/TSV header comes
+    with the first), so output starts before the input is exhausted and
+    memory does not grow with the number of papers.
+    """
+    if format == "ndjson":
+        for paper in papers:
+            yield json.dumps(paper_record(paper, saved), ensure_ascii=False) + "\n"
+        return
+
+    fields = list(RECORD_FIELDS) + (["saved"] if saved is not None else [])
+    tsv = format == "tsv"
+    buffer = io.StringIO()
+    if tsv:
+        writer = csv.writer(
+            buffer,
+            delimiter="\t",
+            quoting=csv.QUOTE_NONE,
+            quotechar=None,
+            lineterminator="\n",
         )
+    else:
+        writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    for paper in papers:
+        record = paper_record(paper, saved)
+        writer.writerow([_cell(record[field], tsv) for field in fields])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
 
 
-def _display_json(papers: List[Paper]) -> None:
+def _display_json(papers: List[Paper], saved: Optional[AbstractSet[str]]) -> None:
     """Display papers as JSON output"""
-    import json
-
-    output = [
-        {
-            "id": paper.id,
-            "title": paper.title,
-            "authors": paper.authors,
-            "year": paper.publication_date.year if paper.publication_date else None,
-            "source": paper.source,
-            "citations": paper.citation_count,
-            "url": paper.pdf_url or f"https://doi.org/{paper.doi}"
-            if paper.doi
-            else None,
-        }
-        for paper in papers
-    ]
+    output = [paper_record(paper, saved) for paper in papers]
     click.echo(json.dumps(output, indent=2))
 
 
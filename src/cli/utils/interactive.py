@@ -1,31 +1,95 @@
-from typing import List, Optional
+import math
+from typing import AbstractSet, List, Optional, Tuple
 import click
 from src.api.base_api import Paper
+from src.cli.utils.display import saved_badge
 
+# papers listed at a time while selecting (each takes three lines)
+DEFAULT_SELECTION_PAGE_SIZE = 10
 
-def prompt_paper_selection(papers: List[Paper]) -> Optional[List[Paper]]:
-    """Interactive paper selection prompt."""
-    if not papers:
-        click.secho("No papers found to select.", fg="red")
-        return None
 
-    # Display papers with numbering
-    for idx, paper in enumerate(papers, start=1):
+def _matches(paper: Paper, needle: str) -> bool:
+    return needle in paper.title.lower() or any(
+        needle in author.lower() for author in paper.authors
+    )
+
+
+def _show_entries(
+    entries: List[Tuple[int, Paper]], saved: Optional[AbstractSet[str]]
+) -> None:
+    for idx, paper in entries:
+        badge = saved_badge(paper, saved)
         click.echo(
-            f"{idx}. {click.style(paper.title, bold=True)}\n"
+            f"{idx}. {click.style(paper.title, bold=True)}"
+            f"{' ' + badge if badge else ''}\n"
             f"   Authors: {', '.join(paper.authors[:3])}"
             f"{'...' if len(paper.authors) > 3 else ''}\n"
             f"   Year: {paper.publication_date.year if paper.publication_date else 'N/A'}"
         )
 
-    # Prompt with validation
+
+def prompt_paper_selection(
+    papers: List[Paper],
+    saved: Optional[AbstractSet[str]] = None,
+    page_size: int = DEFAULT_SELECTION_PAGE_SIZE,
+) -> Optional[List[Paper]]:
+    """
+    Interactive paper selection prompt; ``saved`` IDs get a badge.
+
+    Papers are listed one page at a time. Besides numbers and 'all', the
+    prompt takes 'n'/'p' to page and '/text' to list only papers whose
+    title or authors contain the text ('/' alone clears it). Papers keep
+    their numbers while filtered, and 'all' takes the listed papers.
+    """
+    if not papers:
+        click.secho("No papers found to select.", fg="red")
+        return None
+
+    numbered = list(enumerate(papers, start=1))
+    listed, needle, page = numbered, "", 0
+    show = True
     while True:
+        pages = max(1, math.ceil(len(listed) / page_size))
+        if show:
+            _show_entries(listed[page * page_size : (page + 1) * page_size], saved)
+            if pages > 1 or needle:
+                status = (
+                    f"Page {page + 1}/{pages}, {len(listed)} of {len(papers)} papers"
+                )
+                click.secho(
+                    status + (f" matching '{needle}'" if needle else ""), dim=True
+                )
+        show = False
+
+        hint = "n/p to page, " if pages > 1 else ""
         selected = click.prompt(
-            "Select papers to save (comma-separated numbers or 'all')", default="all"
-        )
+            "Select papers to save (comma-separated numbers or 'all'; "
+            f"{hint}/text to filter)",
+            default="all",
+        ).strip()
+        command = selected.lower()
+
+        if command in ("n", "p"):
+            step = 1 if command == "n" else -1
+            if 0 <= page + step < pages:
+                page, show = page + step, True
+            else:
+                click.secho("No more pages that way.", fg="yellow")
+            continue
+
+        if selected.startswith("/"):
+            text = selected[1:].strip().lower()
+            matching = (
+                [e for e in numbered if _matches(e[1], text)] if text else numbered
+            )
+            if not matching:
+                click.secho(f"No papers match '{text}'.", fg="yellow")
+                continue
+            listed, needle, page, show = matching, text, 0, True
+            continue
 
-        if selected.lower() == "all":
-            return papers
+        if command == "all":
+            return [paper for _, paper in listed]
 
         try:
             indices = [int(i.strip()) for i in selected.split(",")]
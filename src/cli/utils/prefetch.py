@@ -0,0 +1,142 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, List, Mapping, Optional, Type, TypeVar
+import requests
+from src.api.base_api import Paper, ResearchAPI
+from src.storage.locks import move_into_place
+from src.cli.project import pdf_filename
+
+# Overridable from the environment (or a local .env) so users can tune how
+# aggressively search results are downloaded while the selection prompt waits.
+DEFAULT_PREFETCH_K = int(os.getenv("IWADI_PREFETCH_K", "3"))
+DEFAULT_PREFETCH_KBPS = int(os.getenv("IWADI_PREFETCH_KBPS", "0"))  # 0 = uncapped
+
+CHUNK_SIZE = 64 * 1024
+
+_Self = TypeVar("_Self", bound="Prefetcher")
+
+
+class _Throttle:
+    """Token bucket shared by all prefetch workers to enforce a bandwidth cap."""
+
+    def __init__(self, bytes_per_sec: int) -> None:
+        self.rate = bytes_per_sec
+        self.allowance = float(bytes_per_sec)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, nbytes: int) -> None:
+        if self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.allowance = min(
+                float(self.rate), self.allowance + (now - self.last) * self.rate
+            )
+            self.last = now
+            self.allowance -= nbytes
+            wait = -self.allowance / self.rate if self.allowance < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class Prefetcher:
+    """
+    Speculatively download the top search results into a temporary cache.
+
+    Downloads run in the background while the user is choosing papers.
+    Selected papers are then moved into the project with :meth:`promote`,
+    and :meth:`close` cancels outstanding work and evicts everything else.
+    """
+
+    def __init__(
+        self,
+        apis: Mapping[str, ResearchAPI],
+        top_k: int = DEFAULT_PREFETCH_K,
+        max_kbps: int = DEFAULT_PREFETCH_KBPS,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        self.apis = apis
+        self.top_k = top_k
+        self.cache_dir = Path(tempfile.mkdtemp(prefix="iwadi-prefetch-", dir=cache_dir))
+        self._throttle = _Throttle(max_kbps * 1024)
+        self._cancelled = threading.Event()
+        self._session = requests.Session()
+        self._futures: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, min(top_k, 4)))
+
+    def __enter__(self: _Self) -> _Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def start(self, papers: List[Paper]) -> None:
+        """Queue downloads for the first ``top_k`` papers."""
+        for paper in papers[: self.top_k]:
+            if paper.id not in self._futures:
+                self._futures[paper.id] = self._executor.submit(self._fetch, paper)
+
+    def _fetch(self, paper: Paper) -> Optional[Path]:
+        target = self.cache_dir / pdf_filename(paper.id)
+        if paper.pdf_url:
+            with self._session.get(paper.pdf_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(target, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        if self._cancelled.is_set():
+                            return None
+                        self._throttle.consume(len(chunk))
+                        f.write(chunk)
+        else:
+            # no direct link, so let the source API resolve it (uncapped)
+            api = self.apis.get((paper.source or "").lower())
+            if api is None:
+                return None
+            api.download_paper(
+                paper.id, dirpath=str(self.cache_dir), filename=target.name
+            )
+
+        if not target.exists() or target.stat().st_size == 0:
+            return None
+        return target
+
+    def promote(self, paper: Paper, dest: Path) -> bool:
+        """
+        Move a prefetched PDF to ``dest``, waiting for it if still in flight.
+
+        Returns:
+            True if the PDF was promoted, False if it has to be downloaded normally.
+        """
+        future = self._futures.get(paper.id)
+        if future is None:
+            return False
+        try:
+            path = future.result()
+        except Exception:
+            return False
+        if path is None:
+            return False
+
+        move_into_place(path, dest)
+        return True
+
+    def close(self) -> None:
+        """Cancel pending downloads and evict all unpromoted PDFs."""
+        self._cancelled.set()
+        for future in self._futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
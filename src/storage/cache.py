@@ -0,0 +1,92 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+DEFAULT_TTL = int(os.getenv("IWADI_METADATA_TTL", str(7 * 24 * 3600)))  # one week
+# misses (stored as None) expire sooner, so newly indexed papers are found
+DEFAULT_NEGATIVE_TTL = int(os.getenv("IWADI_METADATA_NEGATIVE_TTL", str(24 * 3600)))
+
+# a row is fresh if it is younger than the TTL for its kind of value
+_FRESH = "fetched_at >= CASE WHEN value = 'null' THEN ? ELSE ? END"
+
+# Values are small JSON documents (PaperMetadata fields, trend counts, None
+# for misses) rather than Papers, so they are not stored with the codec.
+CREATE_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Directory for caches shared by all projects."""
+    return Path(os.getenv("IWADI_CACHE_DIR", str(Path.home() / ".iwadi" / "cache")))
+
+
+class MetadataCache:
+    """
+    Persistent key/value cache of remote metadata with a time-to-live.
+
+    A ``None`` value records a negative result and is kept for
+    ``negative_ttl`` seconds instead of ``ttl``.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl: int = DEFAULT_TTL,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+    ) -> None:
+        self.db_path = db_path or default_cache_dir() / "metadata.db"
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(CREATE_CACHE_TABLE)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the unexpired cached values for ``keys``; misses are omitted."""
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        cutoffs = self._cutoffs()
+
+        with sqlite3.connect(self.db_path) as conn:
+            # stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value FROM metadata_cache "
+                    f"WHERE {_FRESH} AND key IN ({placeholders})",
+                    [*cutoffs, *chunk],
+                )
+                found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def put_many(self, values: Dict[str, Any]) -> None:
+        """Store values, refreshing their timestamps, in one transaction."""
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata_cache (key, value, fetched_at) "
+                "VALUES (?, ?, ?)",
+                [(key, json.dumps(value), now) for key, value in values.items()],
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                f"DELETE FROM metadata_cache WHERE NOT ({_FRESH})", self._cutoffs()
+            )
+            return cursor.rowcount
+
+    def _cutoffs(self) -> Tuple[float, float]:
+        """Oldest fresh ``fetched_at`` for negative and positive entries."""
+        now = time.time()
+        return now - self.negative_ttl, now - self.ttl
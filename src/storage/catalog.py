@@ -0,0 +1,229 @@
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from src.cli.project import Project
+
+CATALOG_FILENAME = "catalog.db"
+
+CREATE_CATALOG_TABLE = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created TEXT,
+    paper_count INTEGER NOT NULL DEFAULT 0,
+    pdf_bytes INTEGER NOT NULL DEFAULT 0,
+    modified_at TEXT
+);
+"""
+CREATE_CATALOG_NAME_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name)"
+)
+# scanned_at: when the root's directories were last catalogued
+CREATE_CATALOG_META_TABLE = """
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+SELECT_SCANNED_AT = "SELECT value FROM catalog_meta WHERE key = 'scanned_at'"
+RECORD_SCANNED_AT = (
+    "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('scanned_at', ?)"
+)
+REGISTER_PROJECT = """
+INSERT INTO projects (path, name, created, modified_at) VALUES (?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET name = excluded.name
+"""
+# both totals are absolute: project databases keep them current, so
+# recording a save never has to stat the whole papers/ directory
+RECORD_CHANGE = """
+INSERT INTO projects (path, name, paper_count, pdf_bytes, modified_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    paper_count = excluded.paper_count,
+    pdf_bytes = excluded.pdf_bytes,
+    modified_at = excluded.modified_at
+"""
+REPLACE_ENTRY = """
+INSERT OR REPLACE INTO projects
+    (path, name, created, paper_count, pdf_bytes, modified_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+SELECT_ENTRIES = """
+SELECT name, path, created, paper_count, pdf_bytes, modified_at
+FROM projects ORDER BY name
+"""
+
+
+@dataclass
+class CatalogEntry:
+    name: str
+    path: Path
+    created: Optional[str]
+    paper_count: int
+    pdf_bytes: int
+    modified_at: Optional[str]
+
+
+class ProjectCatalog:
+    """
+    Index of the projects under a projects root, kept in ``<root>/catalog.db``.
+
+    Each write is a single transaction, so listings never see a half-updated
+    entry, and listing all projects is one query instead of a directory walk.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.db_path = root / CATALOG_FILENAME
+        root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(CREATE_CATALOG_TABLE)
+            conn.execute(CREATE_CATALOG_NAME_INDEX)
+            conn.execute(CREATE_CATALOG_META_TABLE)
+
+    def _connect(self) -> sqlite3.Connection:
+        # several processes (search, import) may record changes at once
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def register(self, project: Project) -> None:
+        """Add a newly created project."""
+        with self._connect() as conn:
+            conn.execute(
+                REGISTER_PROJECT,
+                (str(project.path), project.name, project.created, _now()),
+            )
+
+    def record_change(
+        self, project_path: Path, paper_count: int, pdf_bytes: int
+    ) -> None:
+        """
+        Record a write to a project.
+
+        Args:
+            project_path: Project directory
+            paper_count: Papers now stored in the project
+            pdf_bytes: Bytes of local PDFs now stored in the project
+        """
+        with self._connect() as conn:
+            conn.execute(
+                RECORD_CHANGE,
+                (str(project_path), project_path.name, paper_count, pdf_bytes, _now()),
+            )
+
+    def entries(self) -> List[CatalogEntry]:
+        with self._connect() as conn:
+            rows = conn.execute(SELECT_ENTRIES).fetchall()
+        return [
+            CatalogEntry(
+                name=row[0],
+                path=Path(row[1]),
+                created=row[2],
+                paper_count=row[3],
+                pdf_bytes=row[4],
+                modified_at=row[5],
+            )
+            for row in rows
+        ]
+
+    def find(self, name: str) -> Optional[Path]:
+        """Directory of the project with this name, if catalogued."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT path FROM projects WHERE name = ? ORDER BY path LIMIT 1",
+                (name,),
+            ).fetchone()
+        return Path(row[0]) if row else None
+
+    def ensure_scanned(self) -> bool:
+        """
+        Catalogue the root's project directories once.
+
+        Projects created before the catalog existed are only found by a
+        scan, and registering or saving to any other project first must
+        not hide them, so the scan is keyed on a flag rather than on the
+        catalog being empty.
+
+        Returns:
+            Whether the root was scanned now
+        """
+        with self._connect() as conn:
+            scanned = conn.execute(SELECT_SCANNED_AT).fetchone()
+        if scanned:
+            return False
+        self.rebuild()
+        return True
+
+    def rebuild(self) -> int:
+        """
+        Re-scan the projects root and replace its catalog entries.
+
+        This is the slow path (one directory walk and stat per PDF), used to
+        catalogue projects created before the catalog existed.
+
+        Returns:
+            Number of projects found
+        """
+        entries = [
+            _scan_project(meta.parent)
+            for meta in sorted(self.root.glob("*/project_meta.json"))
+        ]
+        with self._connect() as conn:
+            prefix = os.path.join(self.root, "")  # root plus separator
+            conn.execute(
+                "DELETE FROM projects WHERE substr(path, 1, length(?)) = ?",
+                (prefix, prefix),
+            )
+            conn.executemany(
+                REPLACE_ENTRY,
+                [
+                    (
+                        str(e.path),
+                        e.name,
+                        e.created,
+                        e.paper_count,
+                        e.pdf_bytes,
+                        e.modified_at,
+                    )
+                    for e in entries
+                ],
+            )
+            conn.execute(RECORD_SCANNED_AT, (_now(),))
+        return len(entries)
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _scan_project(path: Path) -> CatalogEntry:
+    meta_path = path / "project_meta.json"
+    db_path = path / "iwadi.db"
+    created = json.loads(meta_path.read_text()).get("created")
+
+    paper_count = 0
+    if db_path.exists():
+        # read-only, so scanning never migrates or locks a project database
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+        try:
+            paper_count = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            conn.close()
+
+    pdf_bytes = sum(p.stat().st_size for p in (path / "papers").glob("*.pdf"))
+    mtimes = [p.stat().st_mtime for p in (meta_path, db_path) if p.exists()]
+    return CatalogEntry(
+        name=path.name,
+        path=path,
+        created=created,
+        paper_count=paper_count,
+        pdf_bytes=pdf_bytes,
+        modified_at=datetime.fromtimestamp(max(mtimes)).isoformat(),
+    )
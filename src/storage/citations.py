@@ -0,0 +1,51 @@
+from typing import Any, Callable, Dict, Iterator, Optional
+from src.api.base_api import Citation
+from src.api.citations import CITATION_FORMATS, format_citations
+from src.cli.project import Project
+from src.storage.store import get_store
+
+# fetched citations are written to the cache every this many
+DEFAULT_CACHE_FLUSH_SIZE = 100
+
+
+def iter_citations(
+    project: Project,
+    format: int = 0,
+    fetch: Optional[Callable[[Citation], Optional[str]]] = None,
+    flush_size: int = DEFAULT_CACHE_FLUSH_SIZE,
+    **filters: Any,
+) -> Iterator[str]:
+    """
+    Stream citations for a project's papers, in ID order.
+
+    Citations are formatted from stored metadata unless the ``citations``
+    table holds one fetched from the paper's source API. With ``fetch``,
+    papers without a cached citation are offered to it (with their local
+    citation) and any string it returns is used and cached.
+
+    Args:
+        project: Project to cite
+        format: Index into ``CITATION_FORMATS``
+        fetch: Optional remote lookup; returns None to keep the local citation
+        flush_size: Fetched citations written to the cache per transaction
+        **filters: Filters accepted by ``ProjectStore.iter_papers``
+    """
+    store = get_store(project)
+    name = CITATION_FORMATS[format]
+    cached = store.cached_citations(name)
+    fetched: Dict[str, str] = {}
+    try:
+        for citation in format_citations(store.iter_papers(**filters), format):
+            text = cached.get(citation.id)
+            if text is None and fetch is not None:
+                text = fetch(citation)
+                if text is not None:
+                    fetched[citation.id] = text
+                    if len(fetched) >= flush_size:
+                        store.cache_citations(name, fetched)
+                        fetched = {}
+            yield citation.citation_str if text is None else text
+    finally:
+        # also runs when the consumer stops early, so fetches are kept
+        if fetched:
+            store.cache_citations(name, fetched)
@@ -0,0 +1,426 @@
+import struct
+from datetime import date
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+from src.api.base_api import Citation, Paper
+
+# Version 3 stores each field as (tag, length, payload), so readers skip
+# tags they don't know and default tags that are missing: fields can be
+# added or retired without a new version.
+CODEC_VERSION = 3
+
+_KIND_PAPER = 0
+_KIND_CITATION = 1
+_KIND_PAPER_BATCH = 2
+_KIND_CITATION_BATCH = 3
+
+_HEADER = struct.Struct("<B")  # format version
+_KIND = struct.Struct("<B")
+_LENGTH = struct.Struct("<I")
+_FIELD = struct.Struct("<BI")  # tag, payload length
+_INT = struct.Struct("<q")
+_DATE = struct.Struct("<i")  # ordinal
+
+# (tag, attribute, kind, interned); kinds are str, int, date and strs (a
+# list of str), and interned values go through the batch string table.
+# Tags are permanent: never reuse a retired tag for a different field.
+_Field = Tuple[int, str, str, bool]
+
+PAPER_FIELDS: Tuple[_Field, ...] = (
+    (1, "id", "str", False),
+    (2, "title", "str", False),
+    (3, "authors", "strs", True),
+    (4, "abstract", "str", False),
+    (5, "pdf_url", "str", False),
+    (6, "publication_date", "date", False),
+    (7, "source", "str", True),
+    (8, "doi", "str", False),
+    (9, "citation_count", "int", False),
+    (10, "version", "int", False),
+    (11, "venue", "str", True),
+)
+CITATION_FIELDS: Tuple[_Field, ...] = (
+    (1, "id", "str", False),
+    (2, "title", "str", False),
+    (3, "citation_format", "str", True),
+    (4, "citation_str", "str", False),
+    (5, "authors", "strs", True),
+    (6, "year", "int", False),
+    (7, "source", "str", True),
+    (8, "url", "str", False),
+)
+# values for required fields whose tag is absent; optional ones become None
+_REQUIRED_DEFAULTS: Dict[str, Callable[[], Any]] = {
+    "id": str,
+    "title": str,
+    "abstract": str,
+    "authors": list,
+    "citation_format": str,
+    "citation_str": str,
+}
+
+
+class StringTable:
+    """Strings shared by a batch (authors, sources), each stored once."""
+
+    def __init__(self, strings: Optional[List[str]] = None) -> None:
+        self.strings: List[str] = strings or []
+        self._index = {s: i for i, s in enumerate(self.strings)}
+
+    def add(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def encode(self) -> bytes:
+        out = [_LENGTH.pack(len(self.strings))]
+        for value in self.strings:
+            data = value.encode("utf-8")
+            out += [_LENGTH.pack(len(data)), data]
+        return b"".join(out)
+
+    @classmethod
+    def decode(cls, data: bytes, pos: int) -> Tuple["StringTable", int]:
+        (count,) = _LENGTH.unpack_from(data, pos)
+        pos += _LENGTH.size
+        strings = []
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(data, pos)
+            pos += _LENGTH.size
+            strings.append(data[pos : pos + length].decode("utf-8"))
+            pos += length
+        return cls(strings), pos
+
+
+def _encode_value(kind: str, value: Any, table: Optional[StringTable]) -> bytes:
+    if kind == "int":
+        return _INT.pack(value)
+    if kind == "date":
+        return _DATE.pack(value.toordinal())
+    if kind == "strs":
+        if table is not None:
+            return struct.pack(
+                f"<I{len(value)}I", len(value), *[table.add(v) for v in value]
+            )
+        parts = [_LENGTH.pack(len(value))]
+        for item in value:
+            data = item.encode("utf-8")
+            parts += [_LENGTH.pack(len(data)), data]
+        return b"".join(parts)
+    if table is not None:
+        return _LENGTH.pack(table.add(value))
+    return str(value).encode("utf-8")
+
+
+def _decode_value(
+    kind: str, data: bytes, start: int, end: int, table: Optional[StringTable]
+) -> Any:
+    if kind == "str":
+        if table is not None:
+            return table.strings[_LENGTH.unpack_from(data, start)[0]]
+        return data[start:end].decode("utf-8")
+    if kind == "int":
+        return _INT.unpack_from(data, start)[0]
+    if kind == "date":
+        return date.fromordinal(_DATE.unpack_from(data, start)[0])
+    (count,) = _LENGTH.unpack_from(data, start)
+    if table is not None:
+        strings = table.strings
+        return [strings[i] for i in struct.unpack_from(f"<{count}I", data, start + 4)]
+    values, pos = [], start + _LENGTH.size
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(data, pos)
+        pos += _LENGTH.size
+        values.append(data[pos : pos + length].decode("utf-8"))
+        pos += length
+    return values
+
+
+def _encode_fields(
+    record: Any, fields: Sequence[_Field], strings: Optional[StringTable]
+) -> bytes:
+    out = []
+    for tag, name, kind, interned in fields:
+        value = getattr(record, name)
+        if value is None:
+            continue  # absent tags decode as None
+        payload = _encode_value(kind, value, strings if interned else None)
+        out += [_FIELD.pack(tag, len(payload)), payload]
+    return b"".join(out)
+
+
+def _default(name: str) -> Any:
+    default = _REQUIRED_DEFAULTS.get(name)
+    return default() if default else None
+
+
+class _Schema:
+    """Lookup tables for decoding one record type."""
+
+    def __init__(self, cls: Type[Any], fields: Sequence[_Field]) -> None:
+        self.cls = cls
+        self.fields = {f[1]: f for f in fields}
+        self.by_tag = {f[0]: f for f in fields}
+
+    def decode(
+        self, data: bytes, start: int, end: int, strings: Optional[StringTable]
+    ) -> Any:
+        # the hot loop of bulk decoding, so the common kinds are inlined
+        by_tag = self.by_tag
+        table = strings.strings if strings is not None else []
+        unpack_field, unpack_length = _FIELD.unpack_from, _LENGTH.unpack_from
+        header = _FIELD.size
+        values: Dict[str, Any] = {}
+        pos = start
+        while pos < end:
+            tag, length = unpack_field(data, pos)
+            pos += header
+            field = by_tag.get(tag)
+            if field is not None:  # unknown tags come from newer writers
+                _, name, kind, interned = field
+                if kind == "str":
+                    values[name] = (
+                        table[unpack_length(data, pos)[0]]
+                        if interned and strings is not None
+                        else data[pos : pos + length].decode("utf-8")
+                    )
+                elif kind == "strs" and interned and strings is not None:
+                    values[name] = [
+                        table[i]
+                        for i in struct.unpack_from(
+                            f"<{length // 4 - 1}I", data, pos + 4
+                        )
+                    ]
+                elif kind == "int":
+                    values[name] = _INT.unpack_from(data, pos)[0]
+                else:
+                    values[name] = _decode_value(kind, data, pos, pos + length, None)
+            pos += length
+        if len(values) < len(self.fields):
+            for name in self.fields:
+                if name not in values:
+                    values[name] = _default(name)
+        return self.cls(**values)
+
+
+_PAPER_SCHEMA = _Schema(Paper, PAPER_FIELDS)
+_CITATION_SCHEMA = _Schema(Citation, CITATION_FIELDS)
+
+
+class LazyRecord:
+    """
+    One encoded paper or citation whose fields are decoded on first access.
+
+    Field headers are only scanned as far as the field being read, so
+    reading e.g. the ``id`` of every paper in a large batch never looks at
+    titles or abstracts.
+    """
+
+    __slots__ = ("_cache", "_data", "_end", "_scanned", "_schema", "_spans", "_strings")
+
+    def __init__(
+        self,
+        data: bytes,
+        start: int,
+        end: int,
+        schema: _Schema,
+        strings: Optional[StringTable] = None,
+    ) -> None:
+        self._data = data
+        self._schema = schema
+        self._strings = strings
+        self._end = end
+        self._scanned = start  # field headers before this offset are in _spans
+        self._spans: Dict[int, Tuple[int, int]] = {}
+        self._cache: Dict[str, Any] = {}
+
+    def _span(self, tag: int) -> Optional[Tuple[int, int]]:
+        spans = self._spans
+        while tag not in spans and self._scanned < self._end:
+            found, length = _FIELD.unpack_from(self._data, self._scanned)
+            start = self._scanned + _FIELD.size
+            spans[found] = (start, start + length)
+            self._scanned = start + length
+        return spans.get(tag)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            tag, _, kind, interned = self._schema.fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        cache = self._cache
+        if name not in cache:
+            span = self._span(tag)
+            table = self._strings if interned else None
+            cache[name] = (
+                _default(name)
+                if span is None
+                else _decode_value(kind, self._data, span[0], span[1], table)
+            )
+        return cache[name]
+
+    def materialize(self) -> Any:
+        """The full Paper or Citation."""
+        return self._schema.cls(
+            **{name: getattr(self, name) for name in self._schema.fields}
+        )
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._schema.cls.__name__} {self.id!r}>"
+
+
+# --------------------------
+# Single records
+# --------------------------
+
+
+def _encode_record(kind: int, record: Any, fields: Sequence[_Field]) -> bytes:
+    return (
+        _HEADER.pack(CODEC_VERSION)
+        + _KIND.pack(kind)
+        + _encode_fields(record, fields, None)
+    )
+
+
+def _check_header(data: bytes, kind: int) -> int:
+    """Validate the header and return where the body starts."""
+    (version,) = _HEADER.unpack_from(data, 0)
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported encoding version: {version}")
+    (found,) = _KIND.unpack_from(data, _HEADER.size)
+    if found != kind:
+        raise ValueError(f"Expected record kind {kind}, found {found}")
+    return _HEADER.size + _KIND.size
+
+
+def encode_paper(paper: Paper) -> bytes:
+    """Serialize a paper to tagged, length-prefixed binary fields."""
+    return _encode_record(_KIND_PAPER, paper, PAPER_FIELDS)
+
+
+def decode_paper(data: bytes) -> Paper:
+    """
+    Inverse of :func:`encode_paper`.
+
+    Raises:
+        ValueError: If the data was written by an unknown codec version
+    """
+    start = _check_header(data, _KIND_PAPER)
+    paper: Paper = _PAPER_SCHEMA.decode(data, start, len(data), None)
+    return paper
+
+
+def lazy_paper(data: bytes) -> LazyRecord:
+    """
+    A paper whose fields are decoded as they are read.
+
+    Raises:
+        ValueError: If the data is not a paper of this codec version
+    """
+    start = _check_header(data, _KIND_PAPER)
+    return LazyRecord(data, start, len(data), _PAPER_SCHEMA)
+
+
+def encode_citation(citation: Citation) -> bytes:
+    """Serialize a citation to tagged, length-prefixed binary fields."""
+    return _encode_record(_KIND_CITATION, citation, CITATION_FIELDS)
+
+
+def decode_citation(data: bytes) -> Citation:
+    """
+    Inverse of :func:`encode_citation`.
+
+    Raises:
+        ValueError: If the data is not a citation in a known version
+    """
+    start = _check_header(data, _KIND_CITATION)
+    citation: Citation = _CITATION_SCHEMA.decode(data, start, len(data), None)
+    return citation
+
+
+# --------------------------
+# Batches
+# --------------------------
+
+
+def _encode_batch(kind: int, records: Iterable[Any], fields: Sequence[_Field]) -> bytes:
+    strings = StringTable()
+    bodies = [_encode_fields(record, fields, strings) for record in records]
+    out = [
+        _HEADER.pack(CODEC_VERSION),
+        _KIND.pack(kind),
+        strings.encode(),
+        _LENGTH.pack(len(bodies)),
+    ]
+    for body in bodies:
+        out += [_LENGTH.pack(len(body)), body]
+    return b"".join(out)
+
+
+def _batch_spans(
+    data: bytes, kind: int
+) -> Tuple[StringTable, Iterator[Tuple[int, int]]]:
+    """The batch's string table and the (start, end) of each record."""
+    strings, pos = StringTable.decode(data, _check_header(data, kind))
+    (count,) = _LENGTH.unpack_from(data, pos)
+
+    def spans(pos: int) -> Iterator[Tuple[int, int]]:
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(data, pos)
+            pos += _LENGTH.size
+            yield pos, pos + length
+            pos += length
+
+    return strings, spans(pos + _LENGTH.size)
+
+
+def encode_papers(papers: Iterable[Paper]) -> bytes:
+    """
+    Serialize many papers into one buffer.
+
+    Author names and sources are written once to a shared string table and
+    referenced by index, which is where most of a library's repetition is.
+    """
+    return _encode_batch(_KIND_PAPER_BATCH, papers, PAPER_FIELDS)
+
+
+def decode_papers(data: bytes) -> List[Paper]:
+    """
+    Inverse of :func:`encode_papers`.
+
+    Raises:
+        ValueError: If the data is not a paper batch of this codec version
+    """
+    strings, spans = _batch_spans(data, _KIND_PAPER_BATCH)
+    return [_PAPER_SCHEMA.decode(data, start, end, strings) for start, end in spans]
+
+
+def lazy_papers(data: bytes) -> List[LazyRecord]:
+    """Papers of a batch, each decoding its fields only when read."""
+    strings, spans = _batch_spans(data, _KIND_PAPER_BATCH)
+    return [
+        LazyRecord(data, start, end, _PAPER_SCHEMA, strings) for start, end in spans
+    ]
+
+
+def encode_citations(citations: Iterable[Citation]) -> bytes:
+    """Serialize many citations into one buffer with a shared string table."""
+    return _encode_batch(_KIND_CITATION_BATCH, citations, CITATION_FIELDS)
+
+
+def decode_citations(data: bytes) -> List[Citation]:
+    """Inverse of :func:`encode_citations`."""
+    strings, spans = _batch_spans(data, _KIND_CITATION_BATCH)
+    return [_CITATION_SCHEMA.decode(data, start, end, strings) for start, end in spans]
@@ -1,68 +1,68 @@
-import sqlite3
-import json
 from pathlib import Path
-from typing import List
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 from src.api.base_api import Paper
 from src.cli.project import Project
-from src.storage.init_db import create_tables
+from src.storage.store import get_store
 
 
-# TODO: add tests
+# Thin wrappers over the shared ProjectStore, kept for existing callers.
 def get_db_path(project: Project) -> Path:
     return project.path / "iwadi.db"
 
 
-def save_paper_in_db(paper: Paper, project: Project, pdf_path: Path) -> None:
-    db_path = get_db_path(project)
-    create_tables(db_path)  # auto-init if not present
-
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO papers (
-                id, title, authors, abstract,
-                pdf_path, publication_date,
-                source, doi, citation_count
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                paper.id,
-                paper.title,
-                json.dumps(paper.authors),
-                paper.abstract,
-                str(pdf_path),
-                paper.publication_date.isoformat() if paper.publication_date else None,
-                paper.source,
-                paper.doi,
-                paper.citation_count or 0,
-            ),
-        )
-        conn.commit()
+def save_paper_in_db(
+    paper: Paper,
+    project: Project,
+    pdf_path: Optional[Path],
+    pdf_state: Optional[str] = None,
+) -> None:
+    get_store(project).save_paper(paper, pdf_path, pdf_state)
+
+
+def update_citation_counts(project: Project, counts: Dict[str, int]) -> int:
+    """Update stored citation counts in one transaction; returns rows changed."""
+    return get_store(project).update_citation_counts(counts)
+
+
+def set_pdf_paths(project: Project, pdf_paths: Dict[str, Path]) -> None:
+    """Record downloaded PDF locations in one transaction."""
+    get_store(project).set_pdf_paths(pdf_paths)
+
+
+def saved_versions(project: Project, paper_ids: Sequence[str]) -> Dict[str, int]:
+    """Newest saved arXiv version of each paper that has one."""
+    return get_store(project).saved_versions(paper_ids)
 
 
 def get_papers(project: Project) -> List[Paper]:
-    db_path = get_db_path(project)
-    create_tables(db_path)
-
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM papers")
-        rows = cursor.fetchall()
-
-    papers = []
-    for row in rows:
-        papers.append(
-            Paper(
-                id=row[0],
-                title=row[1],
-                authors=json.loads(row[2]),
-                abstract=row[3],
-                pdf_url=None,  # not stored, only local path
-                publication_date=None if not row[5] else row[5],
-                source=row[6],
-                doi=row[7],
-                citation_count=row[8],
-            )
-        )
-    return papers
+    return get_store(project).get_papers()
+
+
+def iter_papers(
+    project: Project,
+    source: Optional[str] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    author: Optional[str] = None,
+    saved_since: Optional[Union[date, datetime]] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Iterator[Paper]:
+    """Stream a project's papers with filters applied in SQL (see ProjectStore)."""
+    return get_store(project).iter_papers(
+        source=source,
+        year_from=year_from,
+        year_to=year_to,
+        author=author,
+        saved_since=saved_since,
+        columns=columns,
+    )
+
+
+def save_paper_text(project: Project, paper_id: str, text: str, origin: str) -> None:
+    """Store the extracted text of a paper ('fulltext' or 'pdf' origin)."""
+    get_store(project).save_paper_text(paper_id, text, origin)
+
+
+def get_paper_text(project: Project, paper_id: str) -> Optional[str]:
+    return get_store(project).get_paper_text(paper_id)
@@ -0,0 +1,157 @@
+import json
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence, Tuple
+from src.cli.project import Project
+from src.storage.store import get_store, select_fields
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# rows per Arrow record batch, and so per Parquet row group
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+
+def _require_pyarrow() -> Any:
+    # imported lazily so the rest of the CLI works without pyarrow installed
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise RuntimeError(
+            "Arrow export needs pyarrow; install it with 'pip install pyarrow'"
+        ) from e
+    return pyarrow
+
+
+def arrow_schema(columns: Optional[Sequence[str]] = None) -> "pa.Schema":
+    """
+    Arrow schema for exported papers.
+
+    ``source`` and author names are dictionary encoded: a library repeats a
+    handful of sources and far fewer authors than author slots.
+    """
+    pa = _require_pyarrow()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    types = {
+        "id": pa.string(),
+        "title": pa.string(),
+        "authors": pa.list_(dictionary),
+        "abstract": pa.string(),
+        "publication_date": pa.date32(),
+        "source": dictionary,
+        "doi": pa.string(),
+        "citation_count": pa.int64(),
+        "venue": pa.string(),
+    }
+    return pa.schema([(name, types[name]) for name in select_fields(columns)])
+
+
+def _column_array(pa: Any, name: str, values: List[Any]) -> "pa.Array":
+    if name == "source":
+        return pa.array(values, pa.string()).dictionary_encode()
+    if name == "authors":
+        offsets = [0]
+        names: List[str] = []
+        for authors in values:
+            names.extend(json.loads(authors))
+            offsets.append(len(names))
+        return pa.ListArray.from_arrays(
+            pa.array(offsets, pa.int32()),
+            pa.array(names, pa.string()).dictionary_encode(),
+        )
+    if name == "publication_date":
+        return pa.array(
+            [date.fromisoformat(v[:10]) if v else None for v in values], pa.date32()
+        )
+    if name == "citation_count":
+        return pa.array(values, pa.int64())
+    return pa.array(values, pa.string())
+
+
+def iter_record_batches(
+    project: Project,
+    columns: Optional[Sequence[str]] = None,
+    batch_rows: int = DEFAULT_ROW_GROUP_SIZE,
+    **filters: Any,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Stream a project's papers as Arrow record batches, built column by column
+    from raw SQL pages without creating ``Paper`` objects.
+
+    Args:
+        project: Project to read
+        columns: Paper fields to export (default: all; ``id`` is always included)
+        batch_rows: Rows per record batch
+        **filters: Filters accepted by ``ProjectStore.iter_papers``
+    """
+    pa = _require_pyarrow()
+    schema = arrow_schema(columns)
+    pages = get_store(project).iter_pages(
+        columns=schema.names, page_size=batch_rows, **filters
+    )
+    for rows in pages:
+        columns_data: List[Tuple[Any, ...]] = list(zip(*rows))
+        arrays = [
+            _column_array(pa, name, list(values))
+            for name, values in zip(schema.names, columns_data)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_arrow_table(
+    project: Project, columns: Optional[Sequence[str]] = None, **filters: Any
+) -> "pa.Table":
+    """Load a project's papers into an Arrow table (filters as in iter_papers)."""
+    pa = _require_pyarrow()
+    batches = list(iter_record_batches(project, columns, **filters))
+    if not batches:
+        return arrow_schema(columns).empty_table()
+    # batches carry their own dictionaries; unify them into one per column
+    return pa.Table.from_batches(batches).unify_dictionaries()
+
+
+def to_dataframe(
+    project: Project, columns: Optional[Sequence[str]] = None, **filters: Any
+) -> "pd.DataFrame":
+    """
+    Load a project's papers into a pandas DataFrame.
+
+    Dictionary columns become categoricals, so sources are not repeated per row.
+    """
+    return to_arrow_table(project, columns, **filters).to_pandas()
+
+
+def export_parquet(
+    project: Project,
+    dest: Path,
+    columns: Optional[Sequence[str]] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    **filters: Any,
+) -> int:
+    """
+    Stream a project's papers into a Parquet file, one row group per batch.
+
+    Args:
+        project: Project to export
+        dest: Output file
+        columns: Paper fields to export (default: all)
+        row_group_size: Rows per row group
+        compression: Parquet compression codec
+        **filters: Filters accepted by ``ProjectStore.iter_papers``
+
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    rows = 0
+    with pq.ParquetWriter(
+        dest, arrow_schema(columns), compression=compression
+    ) as writer:
+        for batch in iter_record_batches(project, columns, row_group_size, **filters):
+            writer.write_batch(batch, row_group_size=row_group_size)
+            rows += batch.num_rows
+    return rows
@@ -0,0 +1,245 @@
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+from src.api.base_api import Paper
+from src.storage.catalog import ProjectCatalog
+from src.storage.saved_filter import BloomFilter, SavedFilter, filter_keys
+from src.storage.store import PAPER_COLUMNS, _like_pattern, _row_to_paper
+
+# SQLite refuses more than 10 attached databases per connection by default
+DEFAULT_ATTACH_GROUP_SIZE = int(os.getenv("IWADI_ATTACH_GROUP_SIZE", "10"))
+DEFAULT_FEDERATED_WORKERS = int(os.getenv("IWADI_FEDERATED_WORKERS", "4"))
+DEFAULT_SEARCH_LIMIT = 50
+
+# Templates are run once per attached database; {schema} is its alias. Only
+# columns from the first schema version are used, since project databases
+# are attached read-only and may not have been migrated yet.
+SEARCH_TEMPLATE = f"""
+SELECT {PAPER_COLUMNS} FROM {{schema}}.papers
+WHERE {{conditions}}
+ORDER BY publication_date DESC, id
+LIMIT :limit
+"""
+CONTAINS_TEMPLATE = """
+SELECT id FROM {schema}.papers WHERE id IN (SELECT value FROM json_each(:ids))
+"""
+MATCH_TEMPLATE = """
+SELECT id, doi FROM {schema}.papers
+WHERE id IN (SELECT value FROM json_each(:ids))
+    OR doi IN (SELECT value FROM json_each(:dois))
+"""
+ALL_KEYS_TEMPLATE = "SELECT id, doi FROM {schema}.papers"
+AUTHOR_CONDITION = """
+EXISTS (SELECT 1 FROM json_each(papers.authors) WHERE value LIKE :author ESCAPE '\\')
+"""
+
+
+class FederatedQuery:
+    """
+    Runs one query across many project databases and merges the rows.
+
+    Databases are attached read-only to in-memory connections in groups of
+    ``group_size`` (SQLite caps attachments per connection), each group runs
+    a single ``UNION ALL`` query, and groups run in parallel threads.
+    Projects without a database, or with an unreadable one, are skipped.
+    """
+
+    def __init__(
+        self,
+        databases: Sequence[Tuple[str, Path]],
+        group_size: int = DEFAULT_ATTACH_GROUP_SIZE,
+        workers: int = DEFAULT_FEDERATED_WORKERS,
+    ) -> None:
+        self.databases = [(name, path) for name, path in databases if path.exists()]
+        self.group_size = max(1, group_size)
+        self.workers = max(1, workers)
+
+    @classmethod
+    def from_root(cls, root: Path, **kwargs: Any) -> "FederatedQuery":
+        """Every project catalogued under a projects root."""
+        catalog = ProjectCatalog(root)
+        catalog.ensure_scanned()
+        entries = catalog.entries()
+        return cls([(e.name, e.path / "iwadi.db") for e in entries], **kwargs)
+
+    def execute(
+        self, template: str, params: Mapping[str, Any]
+    ) -> List[Tuple[str, Tuple]]:
+        """
+        Run ``template`` against every database.
+
+        Args:
+            template: SELECT with a ``{schema}`` placeholder for the database
+            params: Named parameters shared by every database
+
+        Returns:
+            (project name, row) pairs, grouped by database in catalog order
+        """
+        groups = [
+            self.databases[start : start + self.group_size]
+            for start in range(0, len(self.databases), self.group_size)
+        ]
+        if not groups:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(groups))) as pool:
+            results = pool.map(lambda g: _run_group(g, template, params), groups)
+            return [row for rows in results for row in rows]
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        author: Optional[str] = None,
+        after: Optional[date] = None,
+        before: Optional[date] = None,
+    ) -> List[Tuple[Paper, List[str]]]:
+        """
+        Saved papers whose title or abstract contains every query term.
+
+        Returns:
+            Up to ``limit`` papers, newest first, each with the projects it
+            is saved in
+        """
+        conditions = []
+        params: Dict[str, Any] = {"limit": limit}
+        for i, term in enumerate(query.split()):
+            conditions.append(
+                f"(title LIKE :t{i} ESCAPE '\\' OR abstract LIKE :t{i} ESCAPE '\\')"
+            )
+            params[f"t{i}"] = _like_pattern(term)
+        if author:
+            conditions.append(AUTHOR_CONDITION)
+            params["author"] = _like_pattern(author)
+        if after:
+            conditions.append("publication_date >= :after")
+            params["after"] = after.isoformat()
+        if before:
+            conditions.append("publication_date <= :before")
+            params["before"] = before.isoformat()
+        template = SEARCH_TEMPLATE.replace(
+            "{conditions}", " AND ".join(conditions) or "1"
+        )
+
+        merged: Dict[str, Tuple[Paper, List[str]]] = {}
+        for project, row in self.execute(template, params):
+            if row[0] in merged:
+                merged[row[0]][1].append(project)
+            else:
+                merged[row[0]] = (_row_to_paper(row), [project])
+        results = sorted(
+            merged.values(),
+            key=lambda m: (m[0].publication_date or date.min, m[0].id),
+            reverse=True,
+        )
+        return results[:limit]
+
+    def projects_containing(self, paper_ids: Sequence[str]) -> Dict[str, List[str]]:
+        """Projects each paper is saved in; unsaved papers are omitted."""
+        found: Dict[str, List[str]] = {}
+        for project, row in self.execute(
+            CONTAINS_TEMPLATE, {"ids": json.dumps(list(paper_ids))}
+        ):
+            found.setdefault(row[0], []).append(project)
+        return found
+
+    def saved_matches(self, papers: Sequence[Paper]) -> Dict[str, List[str]]:
+        """
+        Projects holding each paper, matched by ID or DOI.
+
+        Returns:
+            Project names keyed by the given papers' IDs; unsaved papers are
+            omitted
+        """
+        by_key = {key: paper.id for paper in papers for key in filter_keys(paper)}
+        params = {
+            "ids": json.dumps([p.id for p in papers]),
+            # DOIs compare case-insensitively, but the unique index is
+            # binary; the common spellings keep the lookup on the index
+            "dois": json.dumps(
+                [
+                    v
+                    for p in papers
+                    if p.doi
+                    for v in (p.doi, p.doi.lower(), p.doi.upper())
+                ]
+            ),
+        }
+        found: Dict[str, List[str]] = {}
+        for project, (paper_id, doi) in self.execute(MATCH_TEMPLATE, params):
+            keys = [f"id:{paper_id}"] + ([f"doi:{doi.lower()}"] if doi else [])
+            for key in keys:
+                if key in by_key:
+                    projects = found.setdefault(by_key[key], [])
+                    if project not in projects:
+                        projects.append(project)
+        return found
+
+
+def build_saved_filter(root: Path) -> BloomFilter:
+    """Rebuild a root's saved-paper filter from every project database."""
+    federated = FederatedQuery.from_root(root)
+
+    def all_keys() -> Set[str]:
+        rows = federated.execute(ALL_KEYS_TEMPLATE, {})
+        return {f"id:{paper_id}" for _, (paper_id, _) in rows} | {
+            f"doi:{doi.lower()}" for _, (_, doi) in rows if doi
+        }
+
+    return SavedFilter(root).rebuild(all_keys)
+
+
+def saved_paper_ids(papers: Sequence[Paper], root: Path) -> Set[str]:
+    """
+    IDs of papers already saved in some project under ``root``.
+
+    Each paper is first checked against the Bloom filter, which rules out
+    almost every unsaved one without touching a database; only the hits are
+    confirmed with one federated query. The filter is built on first use and
+    rebuilt larger once it fills up.
+    """
+    bloom = SavedFilter(root).load()
+    if bloom is None or bloom.saturated:
+        bloom = build_saved_filter(root)
+    candidates = [p for p in papers if any(k in bloom for k in filter_keys(p))]
+    if not candidates:
+        return set()
+    return set(FederatedQuery.from_root(root).saved_matches(candidates))
+
+
+def _run_group(
+    group: Sequence[Tuple[str, Path]], template: str, params: Mapping[str, Any]
+) -> List[Tuple[str, Tuple]]:
+    """Attach one group of databases and run the template over all of them."""
+    conn = sqlite3.connect(":memory:", uri=True)
+    try:
+        names: List[str] = []
+        selects: List[str] = []
+        for index, (name, path) in enumerate(group):
+            schema = f"p{index}"
+            try:
+                conn.execute(
+                    f"ATTACH DATABASE ? AS {schema}",
+                    (f"{path.resolve().as_uri()}?mode=ro",),
+                )
+                has_papers = conn.execute(
+                    f"SELECT 1 FROM {schema}.sqlite_master "
+                    "WHERE type = 'table' AND name = 'papers'"
+                ).fetchone()
+            except sqlite3.DatabaseError:
+                continue
+            if not has_papers:
+                continue
+            selects.append(
+                f"SELECT {len(names)}, * FROM ({template.format(schema=schema)})"
+            )
+            names.append(name)
+        if not selects:
+            return []
+        rows = conn.execute(" UNION ALL ".join(selects), dict(params))
+        return [(names[row[0]], row[1:]) for row in rows]
+    finally:
+        conn.close()
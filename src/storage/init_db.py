@@ -1,5 +1,11 @@
+import json
+import os
+import re
 import sqlite3
+import unicodedata
 from pathlib import Path
+from typing import List, Optional, Sequence, Set
+from src.api.arxiv_ids import arxiv_base_id, arxiv_version
 
 CREATE_PAPERS_TABLE = """
 CREATE TABLE IF NOT EXISTS papers (
@@ -15,10 +21,424 @@ CREATE TABLE IF NOT EXISTS papers (
 );
 """
 
+# origin is 'fulltext' (structured text from the source API) or 'pdf' (extracted)
+CREATE_PAPER_TEXT_TABLE = """
+CREATE TABLE IF NOT EXISTS paper_text (
+    paper_id TEXT PRIMARY KEY REFERENCES papers(id),
+    text TEXT NOT NULL,
+    origin TEXT NOT NULL
+);
+"""
+
+
+def normalize_author(name: str) -> str:
+    """Matching key for an author name: accent-free, lowercase, punctuation-free."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w\s]", " ", ascii_name.lower()).split())
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct trigrams of each normalized word, padded as in pg_trgm."""
+    grams: Set[str] = set()
+    for word in normalize_author(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return sorted(grams)
+
+
+def _trigrams_json(text: Optional[str]) -> str:
+    return json.dumps(trigrams(text or ""))
+
+
+def _file_size(path: Optional[str]) -> Optional[int]:
+    try:
+        return os.path.getsize(path) if path else None
+    except OSError:
+        return None
+
+
+# bytes a paper's PDF takes on disk; only local PDFs count
+_LOCAL_PDF_SIZE = """(
+    CASE WHEN {row}.pdf_state = 'local' THEN COALESCE({row}.pdf_size, 0) ELSE 0 END
+)"""
+
+
+# Each entry upgrades the schema by one version; the database records the
+# version it is at in PRAGMA user_version. Never edit a released migration,
+# append a new one instead. Migrations only change the database: PDFs of
+# papers they drop are listed in orphaned_pdfs for 'iwadi storage --prune'.
+MIGRATIONS: List[Sequence[str]] = [
+    # 1: baseline tables (already present in databases created before versioning)
+    [CREATE_PAPERS_TABLE, CREATE_PAPER_TEXT_TABLE],
+    # 2: indexes for DOI, date and source lookups
+    [
+        # the same DOI saved under two IDs would block the unique index, so
+        # later rows are merged into the first one: it keeps its metadata
+        # and gains their PDF, abstract, text and best citation count
+        """
+        CREATE TEMP TABLE doi_duplicates AS
+        SELECT dup.id AS old_id, kept.id AS kept_id
+        FROM papers AS dup JOIN papers AS kept ON kept.rowid = (
+            SELECT MIN(rowid) FROM papers WHERE doi = dup.doi
+        )
+        WHERE dup.doi IS NOT NULL AND dup.rowid != kept.rowid
+        """,
+        """
+        UPDATE papers SET
+            pdf_path = COALESCE(pdf_path, (
+                SELECT dup.pdf_path FROM temp.doi_duplicates AS d
+                JOIN papers AS dup ON dup.id = d.old_id
+                WHERE d.kept_id = papers.id AND dup.pdf_path IS NOT NULL
+            )),
+            abstract = COALESCE(NULLIF(abstract, ''), (
+                SELECT dup.abstract FROM temp.doi_duplicates AS d
+                JOIN papers AS dup ON dup.id = d.old_id
+                WHERE d.kept_id = papers.id AND dup.abstract != ''
+            ), ''),
+            citation_count = MAX(COALESCE(citation_count, 0), (
+                SELECT COALESCE(MAX(dup.citation_count), 0)
+                FROM temp.doi_duplicates AS d
+                JOIN papers AS dup ON dup.id = d.old_id
+                WHERE d.kept_id = papers.id
+            ))
+        WHERE id IN (SELECT kept_id FROM temp.doi_duplicates)
+        """,
+        """
+        UPDATE OR IGNORE paper_text SET paper_id = (
+            SELECT kept_id FROM temp.doi_duplicates WHERE old_id = paper_id
+        ) WHERE paper_id IN (SELECT old_id FROM temp.doi_duplicates)
+        """,
+        """
+        DELETE FROM paper_text
+        WHERE paper_id IN (SELECT old_id FROM temp.doi_duplicates)
+        """,
+        "DELETE FROM papers WHERE id IN (SELECT old_id FROM temp.doi_duplicates)",
+        "DROP TABLE temp.doi_duplicates",
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_papers_doi
+        ON papers(doi) WHERE doi IS NOT NULL
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_papers_date ON papers(publication_date, id)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_papers_source_date
+        ON papers(source, publication_date, id)
+        """,
+    ],
+    # 3: normalized authors, backfilled from the JSON authors column (which stays)
+    [
+        """
+        CREATE TABLE IF NOT EXISTS authors (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            normalized_name TEXT NOT NULL UNIQUE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS paper_authors (
+            paper_id TEXT NOT NULL REFERENCES papers(id),
+            author_id INTEGER NOT NULL REFERENCES authors(id),
+            position INTEGER NOT NULL,
+            PRIMARY KEY (paper_id, position)
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_paper_authors_author
+        ON paper_authors(author_id, paper_id)
+        """,
+        """
+        INSERT OR IGNORE INTO authors (name, normalized_name)
+        SELECT authors.value, normalize_author(authors.value)
+        FROM papers, json_each(papers.authors) AS authors
+        WHERE normalize_author(authors.value) != ''
+        """,
+        """
+        INSERT OR IGNORE INTO paper_authors (paper_id, author_id, position)
+        SELECT papers.id, a.id, names.key
+        FROM papers, json_each(papers.authors) AS names
+        JOIN authors AS a ON a.normalized_name = normalize_author(names.value)
+        """,
+    ],
+    # 4: when each paper was first saved (unknown, NULL, for older rows)
+    [
+        "ALTER TABLE papers ADD COLUMN saved_at TEXT",
+        "CREATE INDEX IF NOT EXISTS idx_papers_saved_at ON papers(saved_at)",
+    ],
+    # 5: when each paper last changed, for incremental snapshots
+    [
+        "ALTER TABLE papers ADD COLUMN updated_at TEXT",
+        "CREATE INDEX IF NOT EXISTS idx_papers_updated_at ON papers(updated_at)",
+    ],
+    # 6: trigram index for fuzzy lookup; field is -1 for the title or the
+    # author's position, and sizes hold each field's trigram count
+    [
+        """
+        CREATE TABLE IF NOT EXISTS paper_trigrams (
+            trigram TEXT NOT NULL,
+            paper_id TEXT NOT NULL,
+            field INTEGER NOT NULL,
+            PRIMARY KEY (trigram, paper_id, field)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS paper_trigram_sizes (
+            paper_id TEXT NOT NULL,
+            field INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            PRIMARY KEY (paper_id, field)
+        ) WITHOUT ROWID
+        """,
+        """
+        INSERT OR IGNORE INTO paper_trigrams (trigram, paper_id, field)
+        SELECT grams.value, papers.id, -1
+        FROM papers, json_each(trigrams_json(papers.title)) AS grams
+        UNION ALL
+        SELECT grams.value, papers.id, names.key
+        FROM papers, json_each(papers.authors) AS names,
+            json_each(trigrams_json(names.value)) AS grams
+        """,
+        """
+        INSERT OR IGNORE INTO paper_trigram_sizes (paper_id, field, size)
+        SELECT papers.id, -1, json_array_length(trigrams_json(papers.title))
+        FROM papers
+        UNION ALL
+        SELECT papers.id, names.key, json_array_length(trigrams_json(names.value))
+        FROM papers, json_each(papers.authors) AS names
+        """,
+    ],
+    # 7: arXiv papers are stored under their versionless ID with a version
+    # history; rows saved per version are folded into the newest one
+    [
+        """
+        CREATE TABLE IF NOT EXISTS paper_versions (
+            paper_id TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            pdf_url TEXT,
+            seen_at TEXT,
+            PRIMARY KEY (paper_id, version)
+        ) WITHOUT ROWID
+        """,
+        # version 0 stands for an unversioned row (e.g. an imported reference)
+        """
+        CREATE TEMP TABLE arxiv_ids AS
+        SELECT id AS old_id, arxiv_base_id(id) AS base_id,
+            COALESCE(arxiv_version(id), 0) AS version, saved_at
+        FROM papers WHERE source = 'arXiv' AND arxiv_base_id(id) IS NOT NULL
+        """,
+        "CREATE INDEX temp.idx_arxiv_ids_base ON arxiv_ids(base_id, version)",
+        """
+        INSERT OR IGNORE INTO paper_versions (paper_id, version, seen_at)
+        SELECT base_id, version, saved_at FROM temp.arxiv_ids WHERE version > 0
+        """,
+        """
+        CREATE TEMP TABLE stale_ids AS
+        SELECT old_id FROM temp.arxiv_ids AS a WHERE EXISTS (
+            SELECT 1 FROM temp.arxiv_ids AS b
+            WHERE b.base_id = a.base_id AND b.version > a.version
+        )
+        """,
+        # the newest version takes an older version's PDF if it has none;
+        # the other old PDFs are left on disk and listed as orphaned
+        """
+        UPDATE papers SET pdf_path = (
+            SELECT old.pdf_path FROM temp.arxiv_ids AS kept
+            JOIN temp.arxiv_ids AS stale ON stale.base_id = kept.base_id
+            JOIN papers AS old ON old.id = stale.old_id
+            WHERE kept.old_id = papers.id AND old.pdf_path IS NOT NULL
+            ORDER BY stale.version DESC LIMIT 1
+        )
+        WHERE pdf_path IS NULL AND id IN (
+            SELECT old_id FROM temp.arxiv_ids WHERE old_id NOT IN temp.stale_ids
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS orphaned_pdfs (
+            path TEXT PRIMARY KEY,
+            paper_id TEXT NOT NULL,
+            orphaned_at TEXT NOT NULL
+        ) WITHOUT ROWID
+        """,
+        """
+        INSERT OR IGNORE INTO orphaned_pdfs (path, paper_id, orphaned_at)
+        SELECT pdf_path, id, strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')
+        FROM papers
+        WHERE id IN temp.stale_ids AND pdf_path IS NOT NULL AND pdf_path NOT IN (
+            SELECT pdf_path FROM papers
+            WHERE id NOT IN temp.stale_ids AND pdf_path IS NOT NULL
+        )
+        """,
+        "DELETE FROM papers WHERE id IN temp.stale_ids",
+        "DELETE FROM paper_authors WHERE paper_id IN temp.stale_ids",
+        "DELETE FROM paper_text WHERE paper_id IN temp.stale_ids",
+        "DELETE FROM paper_trigrams WHERE paper_id IN temp.stale_ids",
+        "DELETE FROM paper_trigram_sizes WHERE paper_id IN temp.stale_ids",
+        """
+        CREATE TEMP TABLE renamed_ids AS
+        SELECT old_id, base_id FROM temp.arxiv_ids
+        WHERE old_id != base_id AND old_id NOT IN temp.stale_ids
+        """,
+        # updated_at moves so incremental snapshots pick up the new IDs
+        """
+        UPDATE OR REPLACE papers SET
+            id = (SELECT base_id FROM temp.renamed_ids WHERE old_id = papers.id),
+            updated_at = strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')
+        WHERE id IN (SELECT old_id FROM temp.renamed_ids)
+        """,
+        """
+        UPDATE OR REPLACE paper_authors SET paper_id = (
+            SELECT base_id FROM temp.renamed_ids WHERE old_id = paper_id
+        ) WHERE paper_id IN (SELECT old_id FROM temp.renamed_ids)
+        """,
+        """
+        UPDATE OR REPLACE paper_text SET paper_id = (
+            SELECT base_id FROM temp.renamed_ids WHERE old_id = paper_id
+        ) WHERE paper_id IN (SELECT old_id FROM temp.renamed_ids)
+        """,
+        """
+        UPDATE OR REPLACE paper_trigrams SET paper_id = (
+            SELECT base_id FROM temp.renamed_ids WHERE old_id = paper_id
+        ) WHERE paper_id IN (SELECT old_id FROM temp.renamed_ids)
+        """,
+        """
+        UPDATE OR REPLACE paper_trigram_sizes SET paper_id = (
+            SELECT base_id FROM temp.renamed_ids WHERE old_id = paper_id
+        ) WHERE paper_id IN (SELECT old_id FROM temp.renamed_ids)
+        """,
+        "DROP TABLE temp.renamed_ids",
+        "DROP TABLE temp.stale_ids",
+        "DROP TABLE temp.arxiv_ids",
+    ],
+    # 8: citations fetched from source APIs, by paper and format name;
+    # citations formatted locally from metadata are never stored
+    [
+        """
+        CREATE TABLE IF NOT EXISTS citations (
+            paper_id TEXT NOT NULL,
+            format TEXT NOT NULL,
+            citation_str TEXT NOT NULL,
+            fetched_at TEXT NOT NULL,
+            PRIMARY KEY (paper_id, format)
+        ) WITHOUT ROWID
+        """,
+    ],
+    # 9: state of each paper's PDF ('local', 'queued' for a lazy save not yet
+    # fetched, 'evicted' to stay under the disk budget) and when it was last
+    # opened, for least-recently-used eviction
+    [
+        "ALTER TABLE papers ADD COLUMN pdf_state TEXT",
+        "ALTER TABLE papers ADD COLUMN pdf_accessed_at TEXT",
+        "UPDATE papers SET pdf_state = 'local' WHERE pdf_path IS NOT NULL",
+        """
+        CREATE INDEX IF NOT EXISTS idx_papers_pdf_lru
+        ON papers(pdf_state, pdf_accessed_at)
+        """,
+    ],
+    # 10: journal or proceedings of a paper; imports used to store it as
+    # the source, which selects the API that PDFs are fetched from
+    [
+        "ALTER TABLE papers ADD COLUMN venue TEXT",
+        """
+        UPDATE papers SET venue = source, source = 'import'
+        WHERE (id LIKE 'doi:%' OR id LIKE 'ref:%')
+            AND source NOT IN ('import', 'arXiv')
+        """,
+    ],
+    # 11: size of each local PDF, and library totals that triggers keep
+    # current, so recording a write in the catalog neither counts rows nor
+    # counts a re-saved PDF twice
+    [
+        "ALTER TABLE papers ADD COLUMN pdf_size INTEGER",
+        "UPDATE papers SET pdf_size = file_size(pdf_path) WHERE pdf_state = 'local'",
+        """
+        CREATE TABLE IF NOT EXISTS library_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            paper_count INTEGER NOT NULL,
+            pdf_bytes INTEGER NOT NULL
+        )
+        """,
+        f"""
+        INSERT OR REPLACE INTO library_stats (id, paper_count, pdf_bytes)
+        SELECT 0, COUNT(*), COALESCE(SUM({_LOCAL_PDF_SIZE.format(row="papers")}), 0)
+        FROM papers
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS papers_stats_insert AFTER INSERT ON papers
+        BEGIN
+            UPDATE library_stats SET
+                paper_count = paper_count + 1,
+                pdf_bytes = pdf_bytes + {_LOCAL_PDF_SIZE.format(row="NEW")};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS papers_stats_delete AFTER DELETE ON papers
+        BEGIN
+            UPDATE library_stats SET
+                paper_count = paper_count - 1,
+                pdf_bytes = pdf_bytes - {_LOCAL_PDF_SIZE.format(row="OLD")};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS papers_stats_update
+        AFTER UPDATE OF pdf_state, pdf_size ON papers
+        BEGIN
+            UPDATE library_stats SET pdf_bytes = pdf_bytes
+                - {_LOCAL_PDF_SIZE.format(row="OLD")}
+                + {_LOCAL_PDF_SIZE.format(row="NEW")};
+        END
+        """,
+    ],
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    """SQL functions used by migrations and queries."""
+    conn.create_function("normalize_author", 1, normalize_author, deterministic=True)
+    conn.create_function("trigrams_json", 1, _trigrams_json, deterministic=True)
+    conn.create_function("arxiv_base_id", 1, arxiv_base_id, deterministic=True)
+    conn.create_function("arxiv_version", 1, arxiv_version, deterministic=True)
+    conn.create_function("file_size", 1, _file_size)
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Apply all pending migrations atomically.
+
+    Returns:
+        The schema version the database is at afterwards.
+    """
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return SCHEMA_VERSION
+    register_functions(conn)
+
+    # IMMEDIATE takes the write lock up front so concurrent openers queue
+    # here and then see the version the first one wrote
+    conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        current = get_schema_version(conn)
+        for version in range(current + 1, SCHEMA_VERSION + 1):
+            for statement in MIGRATIONS[version - 1]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return get_schema_version(conn)
+
+
+def init_schema(conn: sqlite3.Connection) -> None:
+    """Bring a project database up to the current schema version."""
+    migrate(conn)
+
 
 def create_tables(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute(CREATE_PAPERS_TABLE)
-        conn.commit()
+        init_schema(conn)
@@ -0,0 +1,71 @@
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+LOCK_FILENAME = ".iwadi.lock"
+
+
+def _try_lock(f: IO, blocking: bool) -> bool:
+    if fcntl is not None:
+        flags = fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB)
+        try:
+            fcntl.flock(f.fileno(), flags)
+        except BlockingIOError:
+            return False
+        return True
+
+    # LK_LOCK retries for ~10 seconds before raising, so loop for blocking
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return True
+
+
+@contextmanager
+def file_lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold an exclusive advisory lock on ``path`` across processes.
+
+    Yields:
+        Whether the lock was acquired (always True when ``blocking``)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        acquired = _try_lock(f, blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def move_into_place(src: Path, dest: Path) -> None:
+    """
+    Move a finished file to ``dest`` under the destination directory's lock.
+
+    The file is first moved next to ``dest`` and then renamed over it, so
+    other processes only ever see no file or a complete one, even when
+    ``src`` is on another filesystem.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    staging = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    with file_lock(dest.parent / LOCK_FILENAME):
+        shutil.move(str(src), str(staging))
+        os.replace(staging, dest)
@@ -0,0 +1,124 @@
+import os
+import re
+from pathlib import Path
+from typing import Collection, List, Optional, Tuple
+from src.cli.project import Project
+from src.storage.locks import LOCK_FILENAME, file_lock
+from src.storage.store import get_store
+
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$", re.IGNORECASE)
+
+
+def parse_size(text: str) -> Optional[int]:
+    """
+    Bytes for a size such as ``500M``, ``2GB`` or ``750000``; ``none`` or
+    ``0`` mean no budget.
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    if text.strip().lower() in ("none", "0"):
+        return None
+    match = _SIZE.match(text)
+    if not match:
+        raise ValueError(f"Invalid size: {text!r}")
+    power = " KMGT".index(match.group(2).upper() or " ")
+    return int(float(match.group(1)) * 1024**power)
+
+
+def papers_usage(papers_path: Path) -> int:
+    """
+    Bytes of PDFs under a project's papers directory.
+
+    Dot files are skipped: the directory's ``.iwadi.lock`` and the partial
+    downloads and staging files of writers still in progress.
+    """
+    try:
+        entries = os.scandir(papers_path)
+    except FileNotFoundError:
+        return 0
+    with entries:
+        return sum(
+            entry.stat().st_size
+            for entry in entries
+            if not entry.name.startswith(".") and entry.is_file()
+        )
+
+
+def evict_pdfs(
+    project: Project, budget: Optional[int] = None, keep: Collection[str] = ()
+) -> List[str]:
+    """
+    Delete least recently used PDFs until ``papers/`` fits the budget.
+
+    Only PDFs the database tracks as local are deleted, under the directory
+    lock that PDFs are moved into place with. Their papers are marked
+    evicted and keep their metadata and extracted text, so the PDF is simply
+    fetched again the next time it is opened.
+
+    Args:
+        project: Project to trim
+        budget: Byte budget (default: the project's ``pdf_budget``)
+        keep: Paper IDs never to evict, e.g. a PDF about to be opened
+
+    Returns:
+        IDs of the evicted papers, least recently used first
+    """
+    budget = project.pdf_budget if budget is None else budget
+    if budget is None:
+        return []
+
+    store = get_store(project)
+    evicted: List[str] = []
+    freed = 0
+    with file_lock(project.papers_path / LOCK_FILENAME):
+        usage = papers_usage(project.papers_path)
+        if usage <= budget:
+            return []
+        for paper_id, pdf_path in store.local_pdfs_lru():
+            if usage - freed <= budget:
+                break
+            if paper_id in keep:
+                continue
+            path = Path(pdf_path)
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                size = 0  # already gone; the state is corrected below
+            freed += size
+            evicted.append(paper_id)
+        store.mark_pdfs_evicted(evicted)
+    return evicted
+
+
+def prune_orphaned_pdfs(project: Project) -> Tuple[List[Path], List[Path]]:
+    """
+    Delete PDFs left behind by papers that a schema upgrade removed.
+
+    Upgrades never delete files themselves; they list the PDFs of the
+    papers they fold away (e.g. older arXiv versions) in the database.
+    Only listed files inside the project's ``papers/`` directory are
+    deleted; anything elsewhere is reported and left alone.
+
+    Returns:
+        (deleted, skipped): listed PDFs inside ``papers/`` and those outside it
+    """
+    store = get_store(project)
+    papers_dir = project.papers_path.resolve()
+    deleted: List[Path] = []
+    skipped: List[Path] = []
+    with file_lock(project.papers_path / LOCK_FILENAME):
+        for pdf_path, _ in store.orphaned_pdfs():
+            path = Path(pdf_path)
+            # relative paths would resolve against the working directory
+            if not path.is_absolute() or papers_dir not in path.resolve().parents:
+                skipped.append(path)
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass  # removed by hand; only the listing is left
+            deleted.append(path)
+        store.forget_orphaned_pdfs([str(path) for path in deleted])
+    return deleted, skipped
@@ -0,0 +1,372 @@
+from dataclasses import dataclass, field
+from datetime import date
+from hashlib import sha1
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import re
+from src.api.base_api import Paper
+from src.api.metadata_api import MetadataProvider, lookup_cached, title_identifier
+from src.cli.project import Project
+from src.storage.cache import MetadataCache
+from src.storage.store import get_store
+from src.storage.write_queue import WriteQueue
+
+_ARXIV_ID = re.compile(
+    r"(?:arxiv\.org/(?:abs|pdf)/|arXiv:\s*)"
+    r"(?P<id>\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})",
+    re.IGNORECASE,
+)
+_BARE_ARXIV_ID = re.compile(r"^(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(v\d+)?$")
+_DOI = re.compile(r"10\.\d{4,9}/\S+")
+_YEAR = re.compile(r"\d{4}")
+_BIBTEX_START = re.compile(r"@\s*(\w+)\s*([{(])")
+_BIBTEX_DELIMITERS = {"{": re.compile(r"[{}]"), "(": re.compile(r"[()]")}
+_BIBTEX_FIELD = re.compile(r"\s*,?\s*([\w\-:.]+)\s*=\s*")
+_RIS_LINE = re.compile(r"^([A-Z][A-Z0-9])  -\s?(.*)$")
+
+# source of imported references that are not arXiv papers; the journal or
+# proceedings goes in the paper's venue, since source selects the API
+IMPORT_SOURCE = "import"
+
+
+@dataclass
+class ReferenceEntry:
+    """One entry from a BibTeX or RIS library."""
+
+    key: str
+    title: str = ""
+    authors: List[str] = field(default_factory=list)
+    abstract: str = ""
+    year: Optional[int] = None
+    venue: Optional[str] = None
+    doi: Optional[str] = None
+    arxiv_id: Optional[str] = None
+    citation_count: Optional[int] = None
+
+    @property
+    def identifier(self) -> Optional[str]:
+        """
+        Identifier understood by metadata providers (see ``paper_identifier``);
+        entries with neither a DOI nor an arXiv ID are looked up by title.
+        """
+        if self.doi:
+            return f"DOI:{self.doi}"
+        if self.arxiv_id:
+            return f"ARXIV:{self.arxiv_id}"
+        return title_identifier(self.title)
+
+    def to_paper(self) -> Paper:
+        if self.arxiv_id:
+            paper_id = f"http://arxiv.org/abs/{self.arxiv_id}"
+            source = "arXiv"
+            pdf_url: Optional[str] = f"https://arxiv.org/pdf/{self.arxiv_id}"
+        else:
+            # stable across re-imports of the same library
+            digest = sha1(f"{self.doi or self.title.lower()}|{self.year}".encode())
+            paper_id = (
+                f"doi:{self.doi}" if self.doi else f"ref:{digest.hexdigest()[:16]}"
+            )
+            source = IMPORT_SOURCE
+            pdf_url = None
+
+        return Paper(
+            id=paper_id,
+            title=self.title,
+            authors=self.authors,
+            abstract=self.abstract,
+            pdf_url=pdf_url,
+            publication_date=date(self.year, 1, 1) if self.year else None,
+            source=source,
+            doi=self.doi,
+            citation_count=self.citation_count or 0,
+            venue=self.venue,
+        )
+
+
+# --------------------------
+# Parsers
+# --------------------------
+
+
+def _clean(value: str) -> str:
+    """Strip LaTeX grouping braces and collapse whitespace."""
+    return " ".join(value.replace("{", "").replace("}", "").split())
+
+
+def _split_authors(value: str) -> List[str]:
+    authors = []
+    for name in re.split(r"\s+and\s+", _clean(value)):
+        if "," in name:
+            last, first = name.split(",", 1)
+            name = f"{first.strip()} {last.strip()}"
+        if name:
+            authors.append(name)
+    return authors
+
+
+def _find_arxiv_id(*values: Optional[str]) -> Optional[str]:
+    for value in values:
+        if value:
+            match = _ARXIV_ID.search(value)
+            if match:
+                return match.group("id")
+    return None
+
+
+def _find_doi(value: Optional[str]) -> Optional[str]:
+    match = _DOI.search(value) if value else None
+    return match.group(0).rstrip(".,;") if match else None
+
+
+def _parse_year(value: Optional[str]) -> Optional[int]:
+    match = _YEAR.search(value) if value else None
+    return int(match.group(0)) if match else None
+
+
+def _parse_bibtex_fields(body: str) -> Dict[str, str]:
+    """Parse ``name = value`` pairs, where values are {braced}, "quoted" or bare."""
+    fields: Dict[str, str] = {}
+    pos, length = 0, len(body)
+    while pos < length:
+        match = _BIBTEX_FIELD.match(body, pos)
+        if not match:
+            break
+        name = match.group(1).lower()
+        pos = match.end()
+        if pos >= length:
+            break
+
+        if body[pos] in '{"':
+            closing = "}" if body[pos] == "{" else '"'
+            depth, start = 0, pos + 1
+            while pos < length:
+                char = body[pos]
+                if char == "{":
+                    depth += 1
+                elif char == "}":
+                    depth -= 1
+                if (closing == "}" and depth == 0) or (
+                    closing == '"' and char == '"' and depth == 0 and pos >= start
+                ):
+                    break
+                pos += 1
+            fields[name] = body[start:pos]
+            pos += 1
+        else:
+            end = body.find(",", pos)
+            end = length if end == -1 else end
+            fields[name] = body[pos:end].strip()
+            pos = end
+    return fields
+
+
+def _bibtex_entry(entry_type: str, text: str) -> Optional[ReferenceEntry]:
+    if entry_type in ("comment", "string", "preamble"):
+        return None
+
+    key, _, body = text.partition(",")
+    fields = _parse_bibtex_fields(body)
+    eprint = _BARE_ARXIV_ID.match(fields.get("eprint", "").strip())
+    if eprint and "arxiv" in fields.get("archiveprefix", "arxiv").lower():
+        arxiv_id: Optional[str] = eprint.group(1)
+    else:
+        arxiv_id = _find_arxiv_id(
+            fields.get("journal"), fields.get("url"), fields.get("note")
+        )
+
+    return ReferenceEntry(
+        key=key.strip(),
+        title=_clean(fields.get("title", "")),
+        authors=_split_authors(fields.get("author", "")),
+        abstract=_clean(fields.get("abstract", "")),
+        year=_parse_year(fields.get("year") or fields.get("date")),
+        venue=_clean(fields.get("journal") or fields.get("booktitle") or "") or None,
+        doi=_find_doi(fields.get("doi")),
+        arxiv_id=arxiv_id,
+    )
+
+
+def iter_bibtex(lines: Iterable[str]) -> Iterator[ReferenceEntry]:
+    """Yield entries from BibTeX text, holding at most one entry in memory."""
+    buffer: List[str] = []
+    entry_type: Optional[str] = None
+    opening = "{"
+    delimiters = _BIBTEX_DELIMITERS[opening]
+    depth = 0
+
+    for line in lines:
+        pos = 0
+        while pos < len(line):
+            if entry_type is None:
+                match = _BIBTEX_START.search(line, pos)
+                if not match:
+                    break
+                entry_type = match.group(1).lower()
+                opening = match.group(2)
+                delimiters = _BIBTEX_DELIMITERS[opening]
+                depth, pos, buffer = 1, match.end(), []
+                continue
+
+            match = delimiters.search(line, pos)
+            if not match:
+                buffer.append(line[pos:])
+                break
+
+            end = match.end()
+            depth += 1 if match.group() == opening else -1
+            if depth == 0:
+                buffer.append(line[pos : end - 1])
+                entry = _bibtex_entry(entry_type, "".join(buffer))
+                if entry is not None:
+                    yield entry
+                entry_type = None
+            else:
+                buffer.append(line[pos:end])
+            pos = end
+
+
+def _first_tag_getter(tags: Dict[str, List[str]]) -> Callable[..., Optional[str]]:
+    """Return a lookup for the first value among several equivalent RIS tags."""
+
+    def first(*names: str) -> Optional[str]:
+        return next((tags[n][0] for n in names if tags.get(n)), None)
+
+    return first
+
+
+def iter_ris(lines: Iterable[str]) -> Iterator[ReferenceEntry]:
+    """Yield entries from RIS text, one ``TY``..``ER`` record at a time."""
+    tags: Dict[str, List[str]] = {}
+    count = 0
+
+    for line in lines:
+        match = _RIS_LINE.match(line.rstrip("\r\n"))
+        if not match:
+            continue
+        tag, value = match.group(1), match.group(2).strip()
+
+        if tag == "ER":
+            count += 1
+            first = _first_tag_getter(tags)
+            urls = " ".join(tags.get("UR", []) + tags.get("L1", []))
+            yield ReferenceEntry(
+                key=first("ID") or f"ris{count}",
+                title=first("TI", "T1", "CT") or "",
+                authors=[
+                    _split_authors(a)[0]
+                    for a in tags.get("AU", []) + tags.get("A1", [])
+                    if a
+                ],
+                abstract=first("AB", "N2") or "",
+                year=_parse_year(first("PY", "Y1", "DA")),
+                venue=first("JO", "T2", "JF", "PB"),
+                doi=_find_doi(first("DO")),
+                arxiv_id=_find_arxiv_id(urls, first("N1"), first("JO", "T2")),
+            )
+            tags = {}
+        elif value:
+            tags.setdefault(tag, []).append(value)
+
+
+def iter_references(path: Path, fmt: Optional[str] = None) -> Iterator[ReferenceEntry]:
+    """Stream entries from a ``.bib`` or ``.ris`` file (format inferred from suffix)."""
+    fmt = (fmt or path.suffix.lstrip(".")).lower()
+    parsers = {"bib": iter_bibtex, "bibtex": iter_bibtex, "ris": iter_ris}
+    if fmt not in parsers:
+        raise ValueError(f"Unsupported reference format: {fmt}")
+
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield from parsers[fmt](f)
+
+
+# --------------------------
+# Import pipeline
+# --------------------------
+
+
+def resolve_entries(
+    entries: List[ReferenceEntry], provider: MetadataProvider, cache: MetadataCache
+) -> int:
+    """
+    Fill in missing DOIs, arXiv IDs and citation counts with batched lookups.
+
+    Entries whose lookup fails are left as parsed rather than aborting.
+
+    Returns:
+        The number of identifiers that could not be looked up
+    """
+    identifiers = [e.identifier for e in entries if e.identifier]
+    failed: List[str] = []
+    metadata = lookup_cached([i for i in identifiers if i], provider, cache, failed)
+
+    for entry in entries:
+        meta = metadata.get(entry.identifier or "")
+        if meta is None:
+            continue
+        entry.doi = entry.doi or meta.doi
+        entry.arxiv_id = entry.arxiv_id or meta.arxiv_id
+        entry.year = entry.year or meta.year
+        entry.title = entry.title or meta.title or ""
+        entry.authors = entry.authors or meta.authors
+        entry.citation_count = meta.citation_count
+    return len(failed)
+
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    # identifiers whose metadata lookup failed; imported as parsed
+    unresolved: int = 0
+    # handed to a write queue whose current writer has not committed them yet
+    queued: int = 0
+    pending_downloads: List[Paper] = field(default_factory=list)
+
+
+def import_references(
+    entries: Iterable[ReferenceEntry],
+    project: Project,
+    provider: Optional[MetadataProvider] = None,
+    cache: Optional[MetadataCache] = None,
+    batch_size: int = 5000,
+    queue: Optional[WriteQueue] = None,
+) -> ImportResult:
+    """
+    Resolve and insert reference entries into a project in large batches.
+
+    Args:
+        entries: Parsed entries (typically from :func:`iter_references`)
+        project: Destination project
+        provider: Metadata provider for identifier resolution (None skips it)
+        cache: Metadata cache consulted before the provider
+        batch_size: Entries resolved and committed per transaction
+        queue: Write queue to hand batches to when several importers share
+            a project (default: write through the project's store)
+
+    Returns:
+        Import counts and the papers whose PDFs can be downloaded later
+    """
+    result = ImportResult()
+    iterator = iter(entries)
+    submitted = 0
+
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            break
+        if provider is not None:
+            result.unresolved += resolve_entries(
+                batch, provider, cache or MetadataCache()
+            )
+
+        papers = [entry.to_paper() for entry in batch if entry.title]
+        result.pending_downloads.extend(p for p in papers if p.pdf_url)
+        if queue is not None:
+            submitted += queue.save_papers(papers)
+        else:
+            result.imported += get_store(project).save_papers(papers)
+
+    if queue is not None:
+        result.queued = queue.outstanding()
+        result.imported += submitted - result.queued
+    return result
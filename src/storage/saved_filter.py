@@ -0,0 +1,163 @@
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set
+from src.api.base_api import Paper
+from src.storage.locks import file_lock
+
+SAVED_FILTER_FILENAME = "saved_filter.bin"
+SAVED_FILTER_LOCK = ".saved_filter.lock"
+# keys the filter is sized for before it is rebuilt larger, and the false
+# positive rate at that size (positives are always checked exactly)
+DEFAULT_FILTER_CAPACITY = int(os.getenv("IWADI_SAVED_FILTER_CAPACITY", "200000"))
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+_HEADER = struct.Struct("<4sBIIQQ")  # magic, version, hashes, capacity, bits, count
+_MAGIC = b"IWBF"
+_FORMAT_VERSION = 1
+
+
+def filter_keys(paper: Paper) -> List[str]:
+    """Keys a saved paper is recorded under: its source ID and its DOI."""
+    keys = [f"id:{paper.id}"]
+    if paper.doi:
+        keys.append(f"doi:{paper.doi.lower()}")
+    return keys
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_FILTER_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self.num_bits = max(
+            8,
+            math.ceil(
+                -self.capacity * math.log(false_positive_rate) / math.log(2) ** 2
+            ),
+        )
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+    @property
+    def saturated(self) -> bool:
+        """Whether more keys were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            self.num_hashes,
+            self.capacity,
+            self.num_bits,
+            self.count,
+        )
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Inverse of :meth:`to_bytes`.
+
+        Raises:
+            ValueError: If the data is not a filter in a known format
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated saved-paper filter")
+        magic, version, num_hashes, capacity, num_bits, count = _HEADER.unpack_from(
+            data
+        )
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Unknown saved-paper filter format")
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bytearray(data[_HEADER.size :])
+        bloom.count = count
+        if len(bloom.bits) != (num_bits + 7) // 8:
+            raise ValueError("Truncated saved-paper filter")
+        return bloom
+
+
+class SavedFilter:
+    """
+    Bloom filter of the IDs and DOIs saved in any project under a root,
+    kept in ``<root>/saved_filter.bin``.
+
+    A miss means the paper is certainly not saved; a hit must be confirmed
+    against the project databases (see
+    :func:`src.storage.federated.saved_paper_ids`). Saves OR their keys into
+    the file under a lock, so concurrent writers never lose each other's
+    bits. Until the file is first built, :meth:`add` does nothing.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / SAVED_FILTER_FILENAME
+        self.lock_path = root / SAVED_FILTER_LOCK
+
+    def load(self) -> Optional[BloomFilter]:
+        """The stored filter, or None if it is missing or unreadable."""
+        try:
+            return BloomFilter.from_bytes(self.path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def rebuild(self, all_keys: Callable[[], Set[str]]) -> BloomFilter:
+        """
+        Replace the stored filter with one holding ``all_keys()``.
+
+        The keys are collected under the lock, so a save committed meanwhile
+        either is among them or adds itself to the new file afterwards.
+        """
+        with file_lock(self.lock_path):
+            keys = all_keys()
+            # leave room to grow before the next rebuild
+            bloom = BloomFilter(capacity=max(DEFAULT_FILTER_CAPACITY, 2 * len(keys)))
+            for key in keys:
+                bloom.add(key)
+            self._write(bloom)
+        return bloom
+
+    def add(self, papers: Iterable[Paper]) -> None:
+        """Record saved papers in the stored filter, if there is one."""
+        keys = [key for paper in papers for key in filter_keys(paper)]
+        if not keys:
+            return
+        with file_lock(self.lock_path):
+            bloom = self.load()
+            if bloom is None:
+                return
+            for key in keys:
+                bloom.add(key)
+            self._write(bloom)
+
+    def _write(self, bloom: BloomFilter) -> None:
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(bloom.to_bytes())
+        os.replace(tmp_path, self.path)
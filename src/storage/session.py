@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+from src.api.arxiv_ids import arxiv_base_id
+from src.api.base_api import Paper
+from src.storage.cache import default_cache_dir
+from src.storage.codec import decode_paper, encode_paper
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("IWADI_SESSION_MAX_ENTRIES", "1000"))
+
+# result_number is the row number shown for the latest search (NULL for
+# papers kept from earlier searches); last_used drives LRU eviction
+CREATE_SESSION_TABLE = """
+CREATE TABLE IF NOT EXISTS session_results (
+    paper_id TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    result_number INTEGER UNIQUE,
+    last_used REAL NOT NULL
+);
+"""
+CREATE_LAST_USED_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_session_last_used ON session_results(last_used)"
+)
+UPSERT_RESULT = """
+INSERT INTO session_results (paper_id, data, result_number, last_used)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(paper_id) DO UPDATE SET
+    data = excluded.data,
+    result_number = excluded.result_number,
+    last_used = excluded.last_used
+"""
+# the latest search's results are never evicted, even past the bound
+EVICT_LRU = """
+DELETE FROM session_results WHERE paper_id IN (
+    SELECT paper_id FROM session_results
+    WHERE result_number IS NULL
+    ORDER BY last_used
+    LIMIT MAX(0, (SELECT COUNT(*) FROM session_results) - ?)
+)
+"""
+
+
+class SessionStore:
+    """
+    Results of recent searches, so ``save`` can work without the network.
+
+    Papers are stored in the compact binary encoding from
+    :mod:`src.storage.codec`. Each search renumbers its results from 1 in
+    display order; older results stay reachable by ID until evicted,
+    least recently used first, once more than ``max_entries`` are held.
+    """
+
+    def __init__(
+        self, db_path: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self.db_path = db_path or default_cache_dir() / "session.db"
+        self.max_entries = max_entries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(CREATE_SESSION_TABLE)
+            conn.execute(CREATE_LAST_USED_INDEX)
+
+    def record_results(self, papers: Sequence[Paper]) -> None:
+        """Store a search's results as the current, numbered result list."""
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE session_results SET result_number = NULL "
+                "WHERE result_number IS NOT NULL"
+            )
+            conn.executemany(
+                UPSERT_RESULT,
+                [
+                    (paper.id, encode_paper(paper), number, now)
+                    for number, paper in enumerate(papers, 1)
+                ],
+            )
+            conn.execute(EVICT_LRU, (self.max_entries,))
+
+    def recent(self) -> List[Paper]:
+        """The latest search's results, in display order."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT data FROM session_results "
+                "WHERE result_number IS NOT NULL ORDER BY result_number"
+            )
+            return [decode_paper(row[0]) for row in rows]
+
+    def resolve(self, refs: Sequence[str]) -> Tuple[List[Paper], List[str]]:
+        """
+        Look up papers by ID or by result number from the latest search.
+
+        An exact ID match wins over a result number, since IEEE article
+        numbers are numeric too. Versioned arXiv URLs match the stored
+        versionless ID.
+
+        Returns:
+            The papers found (in ``refs`` order) and the refs that were not
+        """
+        found: List[Paper] = []
+        missing: List[str] = []
+        with sqlite3.connect(self.db_path) as conn:
+            for ref in refs:
+                row = conn.execute(
+                    "SELECT paper_id, data FROM session_results WHERE paper_id = ?",
+                    (ref,),
+                ).fetchone()
+                base_id = arxiv_base_id(ref)
+                if row is None and base_id is not None:
+                    row = conn.execute(
+                        "SELECT paper_id, data FROM session_results WHERE paper_id = ?",
+                        (base_id,),
+                    ).fetchone()
+                if row is None and ref.isdigit():
+                    row = conn.execute(
+                        "SELECT paper_id, data FROM session_results "
+                        "WHERE result_number = ?",
+                        (int(ref),),
+                    ).fetchone()
+                if row is None:
+                    missing.append(ref)
+                    continue
+                conn.execute(
+                    "UPDATE session_results SET last_used = ? WHERE paper_id = ?",
+                    (time.time(), row[0]),
+                )
+                found.append(decode_paper(row[1]))
+        return found, missing
@@ -0,0 +1,225 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from src.cli.project import Project
+from src.storage.store import get_store
+
+SNAPSHOT_FILENAME = "view.db"
+SNAPSHOT_METADATA_FILENAME = "view_metadata.json"
+
+# Denormalized copy of the live papers table. ``pk`` is a stable integer key
+# for the external-content FTS index; the triggers keep the index in step
+# with every insert, update and delete.
+SNAPSHOT_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS papers (
+        pk INTEGER PRIMARY KEY,
+        id TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL,
+        authors TEXT NOT NULL,
+        abstract TEXT NOT NULL,
+        year INTEGER,
+        publication_date TEXT,
+        source TEXT,
+        doi TEXT,
+        citation_count INTEGER,
+        pdf_path TEXT,
+        saved_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS paper_authors (
+        paper_id TEXT NOT NULL,
+        author TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        PRIMARY KEY (paper_id, position)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_papers_year ON papers(year)",
+    "CREATE INDEX IF NOT EXISTS idx_papers_source ON papers(source)",
+    "CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors(author)",
+    "CREATE TABLE IF NOT EXISTS facet_year (year INTEGER PRIMARY KEY, papers INTEGER)",
+    "CREATE TABLE IF NOT EXISTS facet_source (source TEXT PRIMARY KEY, papers INTEGER)",
+    "CREATE TABLE IF NOT EXISTS facet_author (author TEXT PRIMARY KEY, papers INTEGER)",
+    "CREATE TABLE IF NOT EXISTS snapshot_meta (key TEXT PRIMARY KEY, value TEXT)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+        title, abstract, content='papers', content_rowid='pk'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS papers_fts_insert AFTER INSERT ON papers BEGIN
+        INSERT INTO papers_fts (rowid, title, abstract)
+        VALUES (new.pk, new.title, new.abstract);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS papers_fts_delete AFTER DELETE ON papers BEGIN
+        INSERT INTO papers_fts (papers_fts, rowid, title, abstract)
+        VALUES ('delete', old.pk, old.title, old.abstract);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS papers_fts_update AFTER UPDATE ON papers BEGIN
+        INSERT INTO papers_fts (papers_fts, rowid, title, abstract)
+        VALUES ('delete', old.pk, old.title, old.abstract);
+        INSERT INTO papers_fts (rowid, title, abstract)
+        VALUES (new.pk, new.title, new.abstract);
+    END
+    """,
+]
+
+# rows of the live database changed since the last sync (all on the first);
+# the bound parameter is the previous sync time or NULL
+SELECT_CHANGED = """
+CREATE TEMP TABLE changed AS
+SELECT id FROM live.papers WHERE ?1 IS NULL OR updated_at >= ?1
+"""
+COPY_CHANGED_PAPERS = """
+INSERT INTO papers (
+    id, title, authors, abstract, year, publication_date,
+    source, doi, citation_count, pdf_path, saved_at
+)
+SELECT
+    p.id, p.title,
+    (SELECT COALESCE(group_concat(value, ', '), '') FROM json_each(p.authors)),
+    p.abstract,
+    CAST(substr(p.publication_date, 1, 4) AS INTEGER),
+    p.publication_date, p.source, p.doi, p.citation_count, p.pdf_path, p.saved_at
+FROM live.papers AS p JOIN temp.changed USING (id)
+WHERE true
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    authors = excluded.authors,
+    abstract = excluded.abstract,
+    year = excluded.year,
+    publication_date = excluded.publication_date,
+    source = excluded.source,
+    doi = excluded.doi,
+    citation_count = excluded.citation_count,
+    pdf_path = excluded.pdf_path,
+    saved_at = excluded.saved_at
+"""
+COPY_CHANGED_AUTHORS = """
+INSERT INTO paper_authors (paper_id, author, position)
+SELECT p.id, names.value, names.key
+FROM live.papers AS p JOIN temp.changed USING (id), json_each(p.authors) AS names
+"""
+REFRESH_FACETS = [
+    "DELETE FROM facet_year",
+    """
+    INSERT INTO facet_year SELECT year, COUNT(*) FROM papers
+    WHERE year IS NOT NULL GROUP BY year
+    """,
+    "DELETE FROM facet_source",
+    """
+    INSERT INTO facet_source SELECT source, COUNT(*) FROM papers
+    WHERE source IS NOT NULL GROUP BY source
+    """,
+    "DELETE FROM facet_author",
+    """
+    INSERT INTO facet_author SELECT author, COUNT(DISTINCT paper_id)
+    FROM paper_authors GROUP BY author
+    """,
+]
+
+DATASETTE_METADATA = {
+    "tables": {
+        "papers": {
+            "facets": ["year", "source"],
+            "sortable_columns": ["title", "year", "citation_count", "saved_at"],
+            "label_column": "title",
+        },
+        "facet_year": {"sort_desc": "year"},
+        "facet_source": {"sort_desc": "papers"},
+        "facet_author": {"sort_desc": "papers"},
+    }
+}
+
+
+class ProjectSnapshot:
+    """
+    Read-optimized copy of a project's ``iwadi.db`` for browsing.
+
+    Each :meth:`sync` copies only the papers changed since the previous one,
+    reading the live database through a read-only ``ATTACH`` so writers are
+    never blocked. Papers are denormalized (one row with display-ready
+    authors and a year column, plus one row per author), facet counts are
+    stored in ``facet_*`` tables, and ``papers_fts`` indexes titles and
+    abstracts for Datasette's search box.
+    """
+
+    def __init__(self, project: Project) -> None:
+        self.project = project
+        self.path = project.path / SNAPSHOT_FILENAME
+        self.metadata_path = project.path / SNAPSHOT_METADATA_FILENAME
+
+    def sync(self, rebuild: bool = False) -> int:
+        """
+        Bring the snapshot up to date with the live database.
+
+        Args:
+            rebuild: Discard the snapshot and copy everything
+
+        Returns:
+            Number of papers copied or removed
+        """
+        live_path = get_store(self.project).db_path  # migrates the live schema
+        if rebuild:
+            self.path.unlink(missing_ok=True)
+
+        conn = sqlite3.connect(self.path, isolation_level=None, uri=True)
+        try:
+            for statement in SNAPSHOT_SCHEMA:
+                conn.execute(statement)
+            conn.execute(
+                "ATTACH DATABASE ? AS live",
+                (f"{Path(live_path).resolve().as_uri()}?mode=ro",),
+            )
+            started = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            row = conn.execute(
+                "SELECT value FROM snapshot_meta WHERE key = 'synced_at'"
+            ).fetchone()
+
+            conn.execute("BEGIN")
+            try:
+                conn.execute(SELECT_CHANGED, (row[0] if row else None,))
+                changed = conn.execute(COPY_CHANGED_PAPERS).rowcount
+                conn.execute("DELETE FROM paper_authors WHERE paper_id IN temp.changed")
+                conn.execute(COPY_CHANGED_AUTHORS)
+                # the live store never deletes today, but a snapshot must
+                # not outlive rows removed by hand
+                removed = conn.execute(
+                    "DELETE FROM papers WHERE id NOT IN (SELECT id FROM live.papers)"
+                ).rowcount
+                conn.execute(
+                    "DELETE FROM paper_authors "
+                    "WHERE paper_id NOT IN (SELECT id FROM live.papers)"
+                )
+                if changed or removed:
+                    for statement in REFRESH_FACETS:
+                        conn.execute(statement)
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshot_meta VALUES ('synced_at', ?)",
+                    (started,),
+                )
+                conn.execute("DROP TABLE temp.changed")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("DETACH DATABASE live")
+        finally:
+            conn.close()
+
+        self.metadata_path.write_text(
+            json.dumps(
+                {
+                    "title": f"iwadi: {self.project.name}",
+                    "databases": {self.path.stem: DATASETTE_METADATA},
+                },
+                indent=2,
+            )
+        )
+        return changed + removed
@@ -0,0 +1,806 @@
+import atexit
+import json
+import os
+import sqlite3
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+from itertools import islice
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from src.api.arxiv_ids import arxiv_base_id
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.catalog import ProjectCatalog
+from src.storage.init_db import init_schema, normalize_author, trigrams
+from src.storage.saved_filter import SavedFilter
+
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_CACHE_KIB = 64 * 1024
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_FUZZY_LIMIT = 10
+DEFAULT_FUZZY_MIN_SCORE = 0.3
+# seconds a writer waits for another process's transaction before failing
+DEFAULT_BUSY_TIMEOUT = float(os.getenv("IWADI_BUSY_TIMEOUT", "30"))
+
+# values of papers.pdf_state; NULL means no PDF is tracked for the paper
+PDF_LOCAL = "local"
+PDF_QUEUED = "queued"
+PDF_EVICTED = "evicted"
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache hands back the same prepared statement on every call. A paper whose
+# DOI is already stored under another ID is merged into that row (the
+# multi-target upsert needs SQLite 3.35+).
+UPSERT_PAPER = """
+INSERT INTO papers (
+    id, title, authors, abstract,
+    pdf_path, publication_date,
+    source, doi, citation_count, saved_at, updated_at,
+    pdf_state, pdf_accessed_at, venue, pdf_size
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    authors = excluded.authors,
+    abstract = excluded.abstract,
+    pdf_path = COALESCE(excluded.pdf_path, papers.pdf_path),
+    pdf_state = COALESCE(excluded.pdf_state, papers.pdf_state),
+    pdf_size = CASE WHEN excluded.pdf_path IS NULL
+        THEN papers.pdf_size ELSE excluded.pdf_size END,
+    pdf_accessed_at = COALESCE(excluded.pdf_accessed_at, papers.pdf_accessed_at),
+    publication_date = excluded.publication_date,
+    source = excluded.source,
+    doi = excluded.doi,
+    citation_count = excluded.citation_count,
+    venue = excluded.venue,
+    saved_at = COALESCE(papers.saved_at, excluded.saved_at),
+    updated_at = excluded.updated_at
+ON CONFLICT(doi) WHERE doi IS NOT NULL DO UPDATE SET
+    pdf_path = COALESCE(excluded.pdf_path, papers.pdf_path),
+    pdf_state = COALESCE(excluded.pdf_state, papers.pdf_state),
+    pdf_size = CASE WHEN excluded.pdf_path IS NULL
+        THEN papers.pdf_size ELSE excluded.pdf_size END,
+    pdf_accessed_at = COALESCE(excluded.pdf_accessed_at, papers.pdf_accessed_at),
+    citation_count = MAX(excluded.citation_count, papers.citation_count),
+    venue = COALESCE(papers.venue, excluded.venue),
+    updated_at = excluded.updated_at
+"""
+PAPER_COLUMNS = (
+    "id, title, authors, abstract, pdf_path, publication_date, source, doi, "
+    "citation_count"
+)
+# venue is not in PAPER_COLUMNS, which federated queries also run against
+# project databases that have not been migrated yet
+SELECT_PAPERS = f"SELECT {PAPER_COLUMNS}, venue FROM papers"
+# Paper fields that iter_papers can project; the stored JSON authors column
+# is only decoded when requested
+PAPER_FIELDS = (
+    "id",
+    "title",
+    "authors",
+    "abstract",
+    "publication_date",
+    "source",
+    "doi",
+    "citation_count",
+    "venue",
+)
+AUTHOR_FILTER = """
+EXISTS (
+    SELECT 1 FROM paper_authors JOIN authors ON authors.id = paper_authors.author_id
+    WHERE paper_authors.paper_id = papers.id AND authors.normalized_name = ?
+)
+"""
+# kept current by triggers (see migration 11), so reading it is O(1)
+SELECT_LIBRARY_STATS = "SELECT paper_count, pdf_bytes FROM library_stats"
+PAPER_EXISTS = "SELECT 1 FROM papers WHERE id = ?"
+INSERT_AUTHOR = "INSERT OR IGNORE INTO authors (name, normalized_name) VALUES (?, ?)"
+DELETE_PAPER_AUTHORS = "DELETE FROM paper_authors WHERE paper_id = ?"
+# skips papers that were merged into an existing row by DOI
+INSERT_PAPER_AUTHOR = """
+INSERT OR REPLACE INTO paper_authors (paper_id, author_id, position)
+SELECT ?, authors.id, ? FROM authors
+WHERE authors.normalized_name = ? AND EXISTS (SELECT 1 FROM papers WHERE id = ?)
+"""
+SELECT_PAPERS_BY_AUTHOR = f"""
+SELECT {", ".join("papers." + c for c in PAPER_COLUMNS.split(", "))}
+FROM authors
+JOIN paper_authors ON paper_authors.author_id = authors.id
+JOIN papers ON papers.id = paper_authors.paper_id
+WHERE authors.normalized_name = ?
+ORDER BY papers.publication_date DESC
+"""
+SELECT_COAUTHORS = """
+SELECT other.name, COUNT(*) AS shared
+FROM authors AS author
+JOIN paper_authors AS mine ON mine.author_id = author.id
+JOIN paper_authors AS theirs
+    ON theirs.paper_id = mine.paper_id AND theirs.author_id != author.id
+JOIN authors AS other ON other.id = theirs.author_id
+WHERE author.normalized_name = ?
+GROUP BY other.id
+ORDER BY shared DESC, other.name
+"""
+SELECT_EXISTING_IDS = (
+    "SELECT id FROM papers WHERE id IN (SELECT value FROM json_each(?))"
+)
+DELETE_PAPER_TRIGRAMS = "DELETE FROM paper_trigrams WHERE paper_id = ?"
+DELETE_PAPER_TRIGRAM_SIZES = "DELETE FROM paper_trigram_sizes WHERE paper_id = ?"
+INSERT_PAPER_TRIGRAM = (
+    "INSERT OR IGNORE INTO paper_trigrams (trigram, paper_id, field) VALUES (?, ?, ?)"
+)
+INSERT_PAPER_TRIGRAM_SIZE = (
+    "INSERT OR REPLACE INTO paper_trigram_sizes (paper_id, field, size) "
+    "VALUES (?, ?, ?)"
+)
+# Scores each title and author name by trigram Jaccard similarity with the
+# query (shared / (query + field - shared)) and keeps a paper's best field.
+# Only papers sharing at least one trigram are ever touched.
+SELECT_FUZZY = f"""
+WITH query AS (SELECT value AS trigram FROM json_each(:grams)),
+matches AS (
+    SELECT t.paper_id, t.field, COUNT(*) AS shared
+    FROM query JOIN paper_trigrams AS t ON t.trigram = query.trigram
+    GROUP BY t.paper_id, t.field
+),
+scored AS (
+    SELECT m.paper_id,
+        MAX(CAST(m.shared AS REAL) / (:size + s.size - m.shared)) AS score
+    FROM matches AS m
+    JOIN paper_trigram_sizes AS s ON s.paper_id = m.paper_id AND s.field = m.field
+    GROUP BY m.paper_id
+)
+SELECT {", ".join("papers." + c for c in PAPER_COLUMNS.split(", "))}, scored.score
+FROM scored JOIN papers ON papers.id = scored.paper_id
+WHERE scored.score >= :min_score
+ORDER BY scored.score DESC, papers.id
+LIMIT :limit
+"""
+# :arxiv_id is the stored form of a bare, prefixed or versioned arXiv ID
+SELECT_EXACT = f"""
+SELECT {PAPER_COLUMNS} FROM papers
+WHERE id = :query OR id = :arxiv_id OR doi = :query
+    OR title LIKE :title ESCAPE '\\'
+ORDER BY title LIMIT :limit
+"""
+INSERT_PAPER_VERSION = (
+    "INSERT OR IGNORE INTO paper_versions (paper_id, version, pdf_url, seen_at) "
+    "SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM papers WHERE id = ?)"
+)
+SELECT_SAVED_VERSIONS = """
+SELECT paper_id, MAX(version) FROM paper_versions
+WHERE paper_id IN (SELECT value FROM json_each(?))
+GROUP BY paper_id
+"""
+SELECT_VERSION_HISTORY = (
+    "SELECT version, pdf_url, seen_at FROM paper_versions "
+    "WHERE paper_id = ? ORDER BY version"
+)
+SELECT_CACHED_CITATIONS = (
+    "SELECT paper_id, citation_str FROM citations WHERE format = ?"
+)
+UPSERT_CITATION = (
+    "INSERT OR REPLACE INTO citations (paper_id, format, citation_str, fetched_at) "
+    "SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM papers WHERE id = ?)"
+)
+DELETE_PAPER_CITATIONS = "DELETE FROM citations WHERE paper_id = ?"
+UPDATE_CITATION_COUNT = (
+    "UPDATE papers SET citation_count = ?, updated_at = ? WHERE id = ?"
+)
+UPDATE_PDF_PATH = """
+UPDATE papers SET
+    pdf_path = ?, pdf_size = ?, pdf_state = 'local', pdf_accessed_at = ?,
+    updated_at = ?
+WHERE id = ?
+"""
+SELECT_PDF = "SELECT pdf_path, pdf_state, source FROM papers WHERE id = ?"
+TOUCH_PDF = "UPDATE papers SET pdf_accessed_at = ? WHERE id = ?"
+# never-opened PDFs (from before access was tracked) go first
+SELECT_LOCAL_PDFS_LRU = """
+SELECT id, pdf_path FROM papers
+WHERE pdf_state = 'local' AND pdf_path IS NOT NULL
+ORDER BY pdf_accessed_at IS NOT NULL, pdf_accessed_at, id
+"""
+MARK_PDF_EVICTED = """
+UPDATE papers SET pdf_state = 'evicted', pdf_size = NULL, updated_at = ?
+WHERE id = ?
+"""
+COUNT_PDF_STATES = "SELECT pdf_state, COUNT(*) FROM papers GROUP BY pdf_state"
+# a listed PDF that a paper references again is no longer an orphan
+SELECT_ORPHANED_PDFS = """
+SELECT path, paper_id FROM orphaned_pdfs
+WHERE path NOT IN (SELECT pdf_path FROM papers WHERE pdf_path IS NOT NULL)
+ORDER BY path
+"""
+DELETE_ORPHANED_PDF = "DELETE FROM orphaned_pdfs WHERE path = ?"
+UPSERT_PAPER_TEXT = (
+    "INSERT OR REPLACE INTO paper_text (paper_id, text, origin) VALUES (?, ?, ?)"
+)
+SELECT_PAPER_TEXT = "SELECT text FROM paper_text WHERE paper_id = ?"
+
+_Self = TypeVar("_Self", bound="ProjectStore")
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _utc_timestamp(value: Union[date, datetime]) -> str:
+    """ISO timestamp in UTC, matching how saved_at is stored."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    return value.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def _row_to_paper(row: Tuple) -> Paper:
+    return Paper(
+        id=row[0],
+        title=row[1],
+        authors=json.loads(row[2]),
+        abstract=row[3],
+        pdf_url=None,  # not stored, only local path
+        publication_date=_parse_date(row[5]),
+        source=row[6],
+        doi=row[7],
+        citation_count=row[8],
+        venue=row[9] if len(row) > 9 else None,
+    )
+
+
+def select_fields(columns: Optional[Sequence[str]]) -> List[str]:
+    """
+    Paper fields to select for a projection, ``id`` first.
+
+    Raises:
+        ValueError: If ``columns`` names an unknown field
+    """
+    fields = ["id"] + [c for c in (columns or PAPER_FIELDS) if c != "id"]
+    unknown = set(fields) - set(PAPER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown paper columns: {', '.join(sorted(unknown))}")
+    return fields
+
+
+def _decode_field(name: str, value: Any) -> Any:
+    if name == "authors":
+        return json.loads(value)
+    if name == "publication_date":
+        return _parse_date(value)
+    return value
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _access_time() -> str:
+    # finer than _now so PDFs opened within one second keep their LRU order
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _pdf_size(pdf_path: Path) -> Optional[int]:
+    try:
+        return pdf_path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def _paper_row(
+    paper: Paper, pdf_path: Optional[Path], pdf_state: Optional[str] = None
+) -> Tuple:
+    now = _now()
+    if pdf_state is None and pdf_path:
+        pdf_state = PDF_LOCAL
+    return (
+        paper.id,
+        paper.title,
+        json.dumps(paper.authors),
+        paper.abstract,
+        str(pdf_path) if pdf_path else None,
+        paper.publication_date.isoformat() if paper.publication_date else None,
+        paper.source,
+        paper.doi,
+        paper.citation_count or 0,
+        now,
+        now,
+        pdf_state,
+        _access_time() if pdf_state == PDF_LOCAL else None,
+        paper.venue,
+        _pdf_size(pdf_path) if pdf_path and pdf_state == PDF_LOCAL else None,
+    )
+
+
+class ProjectStore:
+    """
+    Long-lived connection to a project's ``iwadi.db``.
+
+    The connection runs in WAL mode with ``synchronous=NORMAL``, so a commit
+    costs a WAL append instead of a full fsync, and writes are grouped into
+    large ``executemany`` transactions. Use :func:`get_store` to share one
+    store per database within a process.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        cache_kib: int = DEFAULT_CACHE_KIB,
+        catalog: Optional[ProjectCatalog] = None,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        saved_filter: Optional[SavedFilter] = None,
+    ) -> None:
+        self.db_path = db_path
+        self.catalog = catalog
+        self.saved_filter = saved_filter
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # IMMEDIATE takes the write lock when a transaction starts, so
+        # concurrent writers wait in the busy handler instead of failing
+        # with "database is locked" when upgrading a read transaction
+        self.conn = sqlite3.connect(
+            db_path,
+            timeout=busy_timeout,
+            isolation_level="IMMEDIATE",
+            cached_statements=256,
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        init_schema(self.conn)
+
+    @classmethod
+    def for_project(cls, project: Project) -> "ProjectStore":
+        return cls(
+            project.path / "iwadi.db",
+            catalog=ProjectCatalog(project.base_path),
+            saved_filter=SavedFilter(project.base_path),
+        )
+
+    def __enter__(self: _Self) -> _Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --------------------------
+    # Papers
+    # --------------------------
+
+    def save_paper(
+        self,
+        paper: Paper,
+        pdf_path: Optional[Path] = None,
+        pdf_state: Optional[str] = None,
+    ) -> None:
+        """
+        Insert or update one paper; an existing pdf_path is kept if none is given.
+
+        ``pdf_state`` defaults to local when a ``pdf_path`` is given; pass
+        ``PDF_QUEUED`` to record where a PDF will go before it is fetched.
+        """
+        with self.conn:
+            self.conn.execute(UPSERT_PAPER, _paper_row(paper, pdf_path, pdf_state))
+            self._index_papers([paper])
+        self._record_saved([paper])
+        self._record_change()
+
+    def _record_saved(self, papers: List[Paper]) -> None:
+        """Add committed papers to the projects root's saved-paper filter."""
+        if self.saved_filter is not None:
+            self.saved_filter.add(papers)
+
+    def _record_change(self) -> None:
+        """Update the project's catalog entry after a committed write."""
+        if self.catalog is None:
+            return
+        paper_count, pdf_bytes = self.conn.execute(SELECT_LIBRARY_STATS).fetchone()
+        self.catalog.record_change(self.db_path.parent, paper_count, pdf_bytes)
+
+    def _index_papers(self, papers: List[Paper]) -> None:
+        """Refresh author, trigram, version and citation rows (inside a transaction)."""
+        self._link_authors(papers)
+        self._index_trigrams(papers)
+        self._record_versions(papers)
+        # cached citations may describe the metadata being replaced
+        self.conn.executemany(DELETE_PAPER_CITATIONS, [(p.id,) for p in papers])
+
+    def _record_versions(self, papers: List[Paper]) -> None:
+        now = _now()
+        self.conn.executemany(
+            INSERT_PAPER_VERSION,
+            [
+                (p.id, p.version, p.pdf_url, now, p.id)
+                for p in papers
+                if p.version is not None
+            ],
+        )
+
+    def _index_trigrams(self, papers: List[Paper]) -> None:
+        # papers merged into another row by DOI have no row of their own
+        stored = {
+            row[0]
+            for row in self.conn.execute(
+                SELECT_EXISTING_IDS, (json.dumps([p.id for p in papers]),)
+            )
+        }
+        ids = [(p.id,) for p in papers]
+        self.conn.executemany(DELETE_PAPER_TRIGRAMS, ids)
+        self.conn.executemany(DELETE_PAPER_TRIGRAM_SIZES, ids)
+
+        grams: List[Tuple[str, str, int]] = []
+        sizes: List[Tuple[str, int, int]] = []
+        for paper in papers:
+            if paper.id not in stored:
+                continue
+            fields = [(-1, paper.title)] + list(enumerate(paper.authors))
+            for field, text in fields:
+                field_grams = trigrams(text)
+                grams.extend((gram, paper.id, field) for gram in field_grams)
+                sizes.append((paper.id, field, len(field_grams)))
+        self.conn.executemany(INSERT_PAPER_TRIGRAM, grams)
+        self.conn.executemany(INSERT_PAPER_TRIGRAM_SIZE, sizes)
+
+    def _link_authors(self, papers: List[Paper]) -> None:
+        """Refresh the normalized author rows for papers."""
+        links = [
+            (paper.id, position, normalize_author(name), name)
+            for paper in papers
+            for position, name in enumerate(paper.authors)
+        ]
+        links = [link for link in links if link[2]]
+        self.conn.executemany(
+            INSERT_AUTHOR, [(name, normalized) for _, _, normalized, name in links]
+        )
+        self.conn.executemany(DELETE_PAPER_AUTHORS, [(p.id,) for p in papers])
+        self.conn.executemany(
+            INSERT_PAPER_AUTHOR,
+            [
+                (pid, position, normalized, pid)
+                for pid, position, normalized, _ in links
+            ],
+        )
+
+    def save_papers(
+        self,
+        papers: Iterable[Paper],
+        pdf_paths: Optional[Mapping[str, Path]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert or update many papers, one transaction per ``batch_size`` rows.
+
+        Args:
+            papers: Papers to write (consumed lazily)
+            pdf_paths: Optional PDF locations keyed by paper ID
+            batch_size: Rows per transaction
+
+        Returns:
+            Number of papers written
+        """
+        pdf_paths = pdf_paths or {}
+        iterator = iter(papers)
+        written = 0
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                if written:
+                    self._record_change()
+                return written
+            with self.conn:
+                self.conn.executemany(
+                    UPSERT_PAPER, [_paper_row(p, pdf_paths.get(p.id)) for p in batch]
+                )
+                self._index_papers(batch)
+            self._record_saved(batch)
+            written += len(batch)
+
+    def paper_count(self) -> int:
+        return int(self.conn.execute(SELECT_LIBRARY_STATS).fetchone()[0])
+
+    def contains(self, paper_id: str) -> bool:
+        """Whether a paper is saved in this project."""
+        return self.conn.execute(PAPER_EXISTS, (paper_id,)).fetchone() is not None
+
+    def saved_versions(self, paper_ids: Sequence[str]) -> Dict[str, int]:
+        """Newest recorded arXiv version of each paper that has one."""
+        rows = self.conn.execute(SELECT_SAVED_VERSIONS, (json.dumps(list(paper_ids)),))
+        return {row[0]: row[1] for row in rows}
+
+    def version_history(self, paper_id: str) -> List[Tuple[int, Optional[str], str]]:
+        """(version, pdf_url, first seen) for each recorded version, oldest first."""
+        rows = self.conn.execute(SELECT_VERSION_HISTORY, (paper_id,))
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    def get_papers(self) -> List[Paper]:
+        return [_row_to_paper(row) for row in self.conn.execute(SELECT_PAPERS)]
+
+    def iter_papers(
+        self,
+        source: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        author: Optional[str] = None,
+        saved_since: Optional[Union[date, datetime]] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Paper]:
+        """
+        Stream stored papers in ID order, filtering in SQL.
+
+        Rows are fetched ``page_size`` at a time with keyset pagination
+        (``id > last_id``), so no read transaction is held between pages and
+        memory stays constant regardless of library size.
+
+        Args:
+            source: Only papers from this source
+            year_from: Earliest publication year (inclusive)
+            year_to: Latest publication year (inclusive)
+            author: Only papers with this author (normalized match)
+            saved_since: Only papers first saved at or after this time
+            columns: Paper fields to load (``id`` is always included); others
+                are left at empty defaults
+            page_size: Rows per query
+
+        Raises:
+            ValueError: If ``columns`` names an unknown field
+        """
+        fields = select_fields(columns)
+        pages = self.iter_pages(
+            source, year_from, year_to, author, saved_since, fields, page_size
+        )
+        for rows in pages:
+            for row in rows:
+                values: Dict[str, Any] = {"title": "", "authors": [], "abstract": ""}
+                values.update(
+                    (name, _decode_field(name, value))
+                    for name, value in zip(fields, row)
+                )
+                yield Paper(**values)
+
+    def iter_pages(
+        self,
+        source: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        author: Optional[str] = None,
+        saved_since: Optional[Union[date, datetime]] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[List[Tuple]]:
+        """
+        Raw pages of rows behind :meth:`iter_papers`, undecoded.
+
+        Each row holds the columns of ``select_fields(columns)`` in order,
+        with authors as JSON text and dates as ISO strings.
+        """
+        fields = select_fields(columns)
+        conditions = ["id > ?"]
+        params: List[Any] = []
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+        if year_from is not None:
+            conditions.append("publication_date >= ?")
+            params.append(f"{year_from:04d}-01-01")
+        if year_to is not None:
+            conditions.append("publication_date < ?")
+            params.append(f"{year_to + 1:04d}-01-01")
+        if author is not None:
+            conditions.append(AUTHOR_FILTER)
+            params.append(normalize_author(author))
+        if saved_since is not None:
+            conditions.append("saved_at >= ?")
+            params.append(_utc_timestamp(saved_since))
+
+        sql = (
+            f"SELECT {', '.join(fields)} FROM papers "
+            f"WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?"
+        )
+        last_id = ""
+        while True:
+            rows = self.conn.execute(sql, [last_id, *params, page_size]).fetchall()
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    def find_exact(self, query: str, limit: int = DEFAULT_FUZZY_LIMIT) -> List[Paper]:
+        """
+        Papers with this ID or DOI, or whose title contains ``query``.
+
+        arXiv IDs match with or without their URL, ``arXiv:`` prefix or
+        version suffix.
+        """
+        rows = self.conn.execute(
+            SELECT_EXACT,
+            {
+                "query": query,
+                "arxiv_id": arxiv_base_id(query),
+                "title": _like_pattern(query),
+                "limit": limit,
+            },
+        )
+        return [_row_to_paper(row) for row in rows]
+
+    def find_fuzzy(
+        self,
+        query: str,
+        limit: int = DEFAULT_FUZZY_LIMIT,
+        min_score: float = DEFAULT_FUZZY_MIN_SCORE,
+    ) -> List[Tuple[Paper, float]]:
+        """
+        Papers whose title or an author name approximately matches ``query``.
+
+        Returns:
+            Up to ``limit`` papers with their similarity (0-1), best first
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        rows = self.conn.execute(
+            SELECT_FUZZY,
+            {
+                "grams": json.dumps(grams),
+                "size": len(grams),
+                "min_score": min_score,
+                "limit": limit,
+            },
+        )
+        return [(_row_to_paper(row[:-1]), row[-1]) for row in rows]
+
+    def papers_by_author(self, name: str) -> List[Paper]:
+        """All papers by an author, matched on the normalized name."""
+        rows = self.conn.execute(SELECT_PAPERS_BY_AUTHOR, (normalize_author(name),))
+        return [_row_to_paper(row) for row in rows]
+
+    def coauthors(self, name: str) -> List[Tuple[str, int]]:
+        """Co-authors of an author with the number of papers they share."""
+        rows = self.conn.execute(SELECT_COAUTHORS, (normalize_author(name),))
+        return [(row[0], row[1]) for row in rows]
+
+    def update_citation_counts(self, counts: Mapping[str, int]) -> int:
+        """Update stored citation counts in one transaction; returns rows changed."""
+        now = _now()
+        with self.conn:
+            cursor = self.conn.executemany(
+                UPDATE_CITATION_COUNT,
+                [(count, now, paper_id) for paper_id, count in counts.items()],
+            )
+        return cursor.rowcount
+
+    def set_pdf_paths(self, pdf_paths: Mapping[str, Path]) -> None:
+        """Record PDFs now on disk (state local, just accessed)."""
+        now, accessed = _now(), _access_time()
+        with self.conn:
+            self.conn.executemany(
+                UPDATE_PDF_PATH,
+                [
+                    (str(path), _pdf_size(path), accessed, now, paper_id)
+                    for paper_id, path in pdf_paths.items()
+                ],
+            )
+        self._record_change()
+
+    # --------------------------
+    # PDF tiering
+    # --------------------------
+
+    def pdf_location(
+        self, paper_id: str
+    ) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+        """(pdf_path, pdf_state, source) of a saved paper, or None."""
+        row = self.conn.execute(SELECT_PDF, (paper_id,)).fetchone()
+        return (row[0], row[1], row[2]) if row else None
+
+    def touch_pdfs(self, paper_ids: Sequence[str]) -> None:
+        """Mark PDFs as just used, moving them to the back of the eviction order."""
+        accessed = _access_time()
+        with self.conn:
+            self.conn.executemany(TOUCH_PDF, [(accessed, pid) for pid in paper_ids])
+
+    def local_pdfs_lru(self) -> List[Tuple[str, str]]:
+        """(paper ID, pdf_path) of PDFs on disk, least recently used first."""
+        return [(row[0], row[1]) for row in self.conn.execute(SELECT_LOCAL_PDFS_LRU)]
+
+    def mark_pdfs_evicted(self, paper_ids: Sequence[str]) -> None:
+        """Record deleted PDFs; their metadata and extracted text are kept."""
+        if not paper_ids:
+            return
+        now = _now()
+        with self.conn:
+            self.conn.executemany(MARK_PDF_EVICTED, [(now, pid) for pid in paper_ids])
+        self._record_change()
+
+    def pdf_state_counts(self) -> Dict[Optional[str], int]:
+        """Papers per PDF state (None for papers without a PDF)."""
+        return {row[0]: row[1] for row in self.conn.execute(COUNT_PDF_STATES)}
+
+    def orphaned_pdfs(self) -> List[Tuple[str, str]]:
+        """(path, paper ID) of PDFs whose papers a schema upgrade removed."""
+        return [(row[0], row[1]) for row in self.conn.execute(SELECT_ORPHANED_PDFS)]
+
+    def forget_orphaned_pdfs(self, paths: Sequence[str]) -> None:
+        """Drop PDFs from the orphan list once they are gone from disk."""
+        with self.conn:
+            self.conn.executemany(DELETE_ORPHANED_PDF, [(path,) for path in paths])
+
+    # --------------------------
+    # Citations
+    # --------------------------
+
+    def cached_citations(self, citation_format: str) -> Dict[str, str]:
+        """Citation strings fetched earlier in one format, keyed by paper ID."""
+        rows = self.conn.execute(SELECT_CACHED_CITATIONS, (citation_format,))
+        return {row[0]: row[1] for row in rows}
+
+    def cache_citations(
+        self, citation_format: str, citations: Mapping[str, str]
+    ) -> None:
+        """Store fetched citation strings (keyed by paper ID) in one transaction."""
+        now = _now()
+        with self.conn:
+            self.conn.executemany(
+                UPSERT_CITATION,
+                [
+                    (paper_id, citation_format, text, now, paper_id)
+                    for paper_id, text in citations.items()
+                ],
+            )
+
+    # --------------------------
+    # Extracted text
+    # --------------------------
+
+    def save_paper_text(self, paper_id: str, text: str, origin: str) -> None:
+        with self.conn:
+            self.conn.execute(UPSERT_PAPER_TEXT, (paper_id, text, origin))
+
+    def get_paper_text(self, paper_id: str) -> Optional[str]:
+        row = self.conn.execute(SELECT_PAPER_TEXT, (paper_id,)).fetchone()
+        return row[0] if row else None
+
+
+_stores: Dict[Path, ProjectStore] = {}
+
+
+def get_store(project: Project) -> ProjectStore:
+    """Shared store for a project, opened on first use and closed at exit."""
+    db_path = (project.path / "iwadi.db").resolve()
+    store = _stores.get(db_path)
+    if store is None:
+        root = project.base_path.resolve()
+        store = _stores[db_path] = ProjectStore(
+            db_path, catalog=ProjectCatalog(root), saved_filter=SavedFilter(root)
+        )
+    return store
+
+
+@atexit.register
+def close_stores() -> None:
+    while _stores:
+        _stores.popitem()[1].close()
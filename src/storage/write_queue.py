@@ -0,0 +1,131 @@
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.codec import decode_papers, encode_papers
+from src.storage.locks import file_lock
+from src.storage.store import get_store
+
+QUEUE_DIRNAME = ".write_queue"
+WRITER_LOCK = "writer.lock"
+
+_LENGTH = struct.Struct("<I")
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+
+def _unpack_str(data: bytes, pos: int) -> Tuple[str, int]:
+    (length,) = _LENGTH.unpack_from(data, pos)
+    pos += _LENGTH.size
+    return data[pos : pos + length].decode("utf-8"), pos + length
+
+
+def _encode_batch(papers: Iterable[Paper], pdf_paths: Mapping[str, Path]) -> bytes:
+    """A paper batch from the codec, then (paper ID, PDF path) pairs."""
+    papers = list(papers)
+    body = encode_papers(papers)
+    paths = [(p.id, str(pdf_paths[p.id])) for p in papers if p.id in pdf_paths]
+    out = [_LENGTH.pack(len(body)), body, _LENGTH.pack(len(paths))]
+    for paper_id, path in paths:
+        out += [_pack_str(paper_id), _pack_str(path)]
+    return b"".join(out)
+
+
+def _decode_batch(data: bytes) -> Tuple[List[Paper], Dict[str, Path]]:
+    (length,) = _LENGTH.unpack_from(data, 0)
+    pos = _LENGTH.size + length
+    papers = decode_papers(data[_LENGTH.size : pos])
+    (count,) = _LENGTH.unpack_from(data, pos)
+    pos += _LENGTH.size
+    pdf_paths: Dict[str, Path] = {}
+    for _ in range(count):
+        paper_id, pos = _unpack_str(data, pos)
+        path, pos = _unpack_str(data, pos)
+        pdf_paths[paper_id] = Path(path)
+    return papers, pdf_paths
+
+
+class WriteQueue:
+    """
+    Spool directory through which worker processes hand paper batches to a
+    single writer.
+
+    Workers :meth:`submit` batches as files and then try to :meth:`drain`.
+    Whichever process gets the writer lock applies every queued batch in
+    submission order; the others return at once instead of waiting on the
+    database lock. A batch is only removed after its transaction commits,
+    so a crashed writer leaves it for the next one.
+    """
+
+    def __init__(self, project: Project) -> None:
+        self.project = project
+        self.queue_dir = project.path / QUEUE_DIRNAME
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self._submitted = 0
+        # batches from this queue not yet seen committed, with their sizes
+        self._outstanding: Dict[Path, int] = {}
+
+    def submit(
+        self, papers: Iterable[Paper], pdf_paths: Optional[Mapping[str, Path]] = None
+    ) -> Path:
+        """Queue a batch; the file appears atomically under its final name."""
+        papers = list(papers)
+        self._submitted += 1
+        name = f"{time.time_ns():020d}-{os.getpid()}-{self._submitted}.batch"
+        tmp_path = self.queue_dir / f".{name}.tmp"
+        tmp_path.write_bytes(_encode_batch(papers, pdf_paths or {}))
+        batch_path = self.queue_dir / name
+        os.replace(tmp_path, batch_path)
+        self._outstanding[batch_path] = len(papers)
+        return batch_path
+
+    def pending(self) -> List[Path]:
+        return sorted(self.queue_dir.glob("*.batch"))
+
+    def outstanding(self) -> int:
+        """Papers submitted through this queue that no writer has committed yet."""
+        self._outstanding = {
+            path: count for path, count in self._outstanding.items() if path.exists()
+        }
+        return sum(self._outstanding.values())
+
+    def drain(self, wait: bool = False) -> int:
+        """
+        Apply queued batches if no other process is already doing so.
+
+        Args:
+            wait: Block until the writer lock is free instead of returning
+
+        Returns:
+            Number of papers written by this call
+        """
+        written = 0
+        while True:
+            with file_lock(self.queue_dir / WRITER_LOCK, blocking=wait) as acquired:
+                if not acquired:
+                    # the current writer re-checks the queue after unlocking
+                    return written
+                store = get_store(self.project)
+                for batch_path in self.pending():
+                    papers, pdf_paths = _decode_batch(batch_path.read_bytes())
+                    written += store.save_papers(papers, pdf_paths)
+                    batch_path.unlink()
+            # a batch submitted while we held the lock may have been skipped
+            # by a worker that found the lock taken
+            if not self.pending():
+                return written
+
+    def save_papers(
+        self, papers: Iterable[Paper], pdf_paths: Optional[Mapping[str, Path]] = None
+    ) -> int:
+        """Submit a batch and help drain the queue; returns papers submitted."""
+        papers = list(papers)
+        self.submit(papers, pdf_paths)
+        self.drain()
+        return len(papers)
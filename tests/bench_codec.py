@@ -0,0 +1,95 @@
+"""
+Round-trip benchmark of the binary paper codec against JSON.
+
+Run with ``PYTHONPATH=./ python tests/bench_codec.py [papers]``.
+"""
+
+import json
+import sys
+import time
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Callable, Dict, List
+from src.api.base_api import Paper
+from src.storage.codec import decode_papers, encode_papers, lazy_papers
+
+
+def make_papers(count: int) -> List[Paper]:
+    authors = [f"Author Number {i}" for i in range(200)]
+    return [
+        Paper(
+            id=f"http://arxiv.org/abs/2101.{i:05d}",
+            title=f"A study of topic {i} in machine learning",
+            authors=[authors[(i * 7 + j) % 200] for j in range(4)],
+            abstract="We study a problem. " * 20,
+            pdf_url=f"http://arxiv.org/pdf/2101.{i:05d}v1",
+            publication_date=date(2021, 1, 1 + i % 28),
+            source="arXiv" if i % 2 else "IEEE",
+            doi=f"10.1/{i}",
+            citation_count=i,
+            version=1,
+        )
+        for i in range(count)
+    ]
+
+
+def json_encode(papers: List[Paper]) -> bytes:
+    rows = []
+    for paper in papers:
+        row = asdict(paper)
+        row["publication_date"] = (
+            paper.publication_date.isoformat() if paper.publication_date else None
+        )
+        rows.append(row)
+    return json.dumps(rows).encode("utf-8")
+
+
+def json_decode(data: bytes) -> List[Paper]:
+    papers = []
+    for row in json.loads(data):
+        if row["publication_date"]:
+            row["publication_date"] = date.fromisoformat(row["publication_date"])
+        papers.append(Paper(**row))
+    return papers
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(count: int) -> Dict[str, Dict[str, float]]:
+    papers = make_papers(count)
+    binary, text = encode_papers(papers), json_encode(papers)
+    assert decode_papers(binary) == papers == json_decode(text)
+
+    results = {
+        "binary": {
+            "bytes": len(binary),
+            "encode_s": best_of(lambda: encode_papers(papers)),
+            "decode_s": best_of(lambda: decode_papers(binary)),
+            "ids_only_s": best_of(lambda: [p.id for p in lazy_papers(binary)]),
+        },
+        "json": {
+            "bytes": len(text),
+            "encode_s": best_of(lambda: json_encode(papers)),
+            "decode_s": best_of(lambda: json_decode(text)),
+            "ids_only_s": best_of(lambda: [p.id for p in json_decode(text)]),
+        },
+    }
+    for name, row in results.items():
+        print(
+            f"{name:>6}: {row['bytes'] / 1024:8.1f} KiB  "
+            f"encode {row['encode_s'] * 1000:7.1f} ms  "
+            f"decode {row['decode_s'] * 1000:7.1f} ms  "
+            f"ids only {row['ids_only_s'] * 1000:7.1f} ms"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
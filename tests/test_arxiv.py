@@ -2,6 +2,7 @@ import pytest
 import arxiv
 from unittest.mock import MagicMock, patch
 from datetime import date
+from typing import Iterator
 from src.api.arxiv_api import ArxivAPI
 from src.api.base_api_error import APIResponseError, APIRequestError, APIServiceError
 
@@ -39,6 +40,58 @@ class TestArxivAPI:
                 arxiv_api.search("test query")
             assert "No results found" in str(exc_info.value)
 
+    def test_search_splits_version(self, arxiv_api: ArxivAPI) -> None:
+        """Test that papers are keyed by the versionless ID"""
+        mock_paper = MagicMock()
+        mock_paper.entry_id = "http://arxiv.org/abs/1706.03762v7"
+        mock_paper.authors = []
+        mock_paper.published.date.return_value = date(2017, 6, 12)
+
+        with patch.object(arxiv_api.client, "results", return_value=iter([mock_paper])):
+            (paper,) = arxiv_api.search("attention")
+
+        assert paper.id == "http://arxiv.org/abs/1706.03762"
+        assert paper.version == 7
+
+    def test_latest_versions_batches(self, arxiv_api: ArxivAPI) -> None:
+        """Test that version checks send many IDs per request"""
+
+        def results(search: arxiv.Search) -> Iterator[MagicMock]:
+            for arxiv_id in search.id_list:
+                result = MagicMock()
+                result.entry_id = f"http://arxiv.org/abs/{arxiv_id}v2"
+                result.authors = []
+                yield result
+
+        ids = [f"http://arxiv.org/abs/2101.{i:05d}" for i in range(5)]
+        with patch.object(arxiv_api.client, "results", side_effect=results) as mock:
+            latest = arxiv_api.latest_versions(ids + ["12345678"], batch_size=2)
+
+        assert mock.call_count == 3
+        assert mock.call_args_list[0].args[0].id_list == ["2101.00000", "2101.00001"]
+        assert set(latest) == set(ids)
+        assert {paper.version for paper in latest.values()} == {2}
+
+    def test_count_uses_total_results(self, arxiv_api: ArxivAPI) -> None:
+        """Test count-only query reads opensearch:totalResults"""
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.content = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom" '
+            b'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+            b"<opensearch:totalResults>1234</opensearch:totalResults></feed>"
+        )
+
+        with patch("requests.get", return_value=mock_response) as mock_get:
+            total = arxiv_api.count(
+                "ti:transformer", after=date(2020, 1, 1), before=date(2020, 12, 31)
+            )
+
+        assert total == 1234
+        params = mock_get.call_args.kwargs["params"]
+        assert params["max_results"] == "0"
+        assert "submittedDate:[202001010000 TO 202012312359]" in params["search_query"]
+
     def test_get_citation_success(self, arxiv_api: ArxivAPI) -> None:
         """Test citation generation"""
         mock_paper = MagicMock()
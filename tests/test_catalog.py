@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.cli.commands.list_projects import list as list_projects
+from src.cli.project import Project
+from src.storage.catalog import ProjectCatalog
+from src.storage.store import get_store
+
+
+def make_project(root: Path, name: str) -> Project:
+    project = Project(name=name, base_path=root)
+    project.papers_path.mkdir(parents=True)
+    project.save_metadata()
+    return project
+
+
+def test_store_writes_update_catalog(tmp_path: Path) -> None:
+    """Test that saving papers and PDFs updates the project's catalog entry"""
+    project = make_project(tmp_path, "Tracked")
+    catalog = ProjectCatalog(tmp_path)
+    catalog.register(project)
+
+    pdf = project.pdf_path_for("1")
+    pdf.write_bytes(b"%PDF" + b"0" * 96)
+    store = get_store(project)
+    store.save_paper(
+        Paper(id="1", title="T", authors=[], abstract="", source="arXiv"), pdf
+    )
+    store.save_papers(
+        Paper(id=str(i), title="T", authors=[], abstract="", source="arXiv")
+        for i in range(2, 5)
+    )
+
+    [entry] = catalog.entries()
+    assert (entry.name, entry.paper_count, entry.pdf_bytes) == ("Tracked", 4, 100)
+    assert entry.created == project.created
+    assert catalog.find("Tracked") == project.path
+
+
+def test_rebuild_scans_existing_projects(tmp_path: Path) -> None:
+    """Test cataloguing projects created before the catalog existed"""
+    project = make_project(tmp_path, "Legacy")
+    (project.papers_path / "a.pdf").write_bytes(b"x" * 10)
+    get_store(project).save_paper(
+        Paper(id="a", title="T", authors=[], abstract="", source="arXiv")
+    )
+    make_project(tmp_path, "Empty")
+    (tmp_path / "not_a_project").mkdir()
+
+    catalog = ProjectCatalog(tmp_path)
+    (catalog.db_path).unlink()
+    catalog = ProjectCatalog(tmp_path)
+
+    assert catalog.rebuild() == 2
+    entries = {e.name: e for e in catalog.entries()}
+    assert entries["Legacy"].paper_count == 1
+    assert entries["Legacy"].pdf_bytes == 10
+    assert entries["Empty"].paper_count == 0
+    assert (
+        entries["Empty"].created
+        == json.loads((tmp_path / "Empty" / "project_meta.json").read_text())["created"]
+    )
+
+
+def test_list_projects_stats(tmp_path: Path) -> None:
+    """Test 'iwadi list-projects' reading names and stats from the catalog"""
+    make_project(tmp_path, "Alpha")
+    make_project(tmp_path, "Beta")
+
+    runner = CliRunner()
+    result = runner.invoke(list_projects, ["--path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "• Alpha" in result.output and "• Beta" in result.output
+
+    get_store(Project(name="Beta", base_path=tmp_path)).save_paper(
+        Paper(id="b", title="T", authors=[], abstract="", source="arXiv")
+    )
+    result = runner.invoke(list_projects, ["--path", str(tmp_path), "--stats"])
+    beta = next(line for line in result.output.splitlines() if line.startswith("Beta"))
+    assert beta.split()[1] == "1"
+    assert "0 B" in beta
+
+
+def test_upgraded_root_is_scanned_once(tmp_path: Path) -> None:
+    """Test that projects from before the catalog survive a first registration"""
+    make_project(tmp_path, "Old1")
+    make_project(tmp_path, "Old2")
+    ProjectCatalog(tmp_path).register(make_project(tmp_path, "New"))
+
+    runner = CliRunner()
+    result = runner.invoke(list_projects, ["--path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert all(f"• {name}" in result.output for name in ("Old1", "Old2", "New"))
+
+    # later listings read the catalog; only --rescan walks the root again
+    make_project(tmp_path, "Copied")
+    result = runner.invoke(list_projects, ["--path", str(tmp_path)])
+    assert "Copied" not in result.output
+    result = runner.invoke(list_projects, ["--path", str(tmp_path), "--rescan"])
+    assert "• Copied" in result.output
+
+
+def test_resaving_does_not_recount_pdfs(tmp_path: Path) -> None:
+    """Test that saving a paper or its PDF again leaves pdf_bytes unchanged"""
+    project = make_project(tmp_path, "Resaved")
+    catalog = ProjectCatalog(tmp_path)
+    pdf = project.pdf_path_for("1")
+    pdf.write_bytes(b"x" * 100)
+    paper = Paper(id="1", title="T", authors=[], abstract="", source="arXiv")
+
+    store = get_store(project)
+    store.save_paper(paper, pdf)
+    store.save_paper(paper, pdf)
+    store.save_papers([paper], {"1": pdf})
+    store.set_pdf_paths({"1": pdf})
+    [entry] = catalog.entries()
+    assert (entry.paper_count, entry.pdf_bytes) == (1, 100)
+
+    pdf.write_bytes(b"x" * 40)  # replaced by a smaller download
+    store.set_pdf_paths({"1": pdf})
+    store.mark_pdfs_evicted(["1"])
+    store.save_paper(paper)
+    [entry] = catalog.entries()
+    assert (entry.paper_count, entry.pdf_bytes) == (1, 0)
@@ -0,0 +1,77 @@
+from datetime import date
+from pathlib import Path
+from typing import Optional
+from src.api.base_api import Citation, Paper
+from src.api.citations import BIBTEX, format_citation, format_citations
+from src.cli.project import Project
+from src.storage.citations import iter_citations
+from src.storage.store import get_store
+
+
+def make_paper(paper_id: str, **fields: object) -> Paper:
+    values: dict = {
+        "title": "Attention Is All You Need",
+        "authors": ["Ashish Vaswani", "Noam Shazeer"],
+        "abstract": "",
+        "publication_date": date(2017, 6, 12),
+        "source": "arXiv",
+    }
+    values.update(fields)
+    return Paper(id=paper_id, **values)
+
+
+def test_format_citation_styles() -> None:
+    """Test citations formatted from metadata alone"""
+    paper = make_paper("http://arxiv.org/abs/1706.03762")
+
+    mla = format_citation(paper, 0)
+    assert mla.citation_str == (
+        'Ashish Vaswani, Noam Shazeer. "Attention Is All You Need." arXiv, 2017, '
+        "http://arxiv.org/abs/1706.03762."
+    )
+    assert format_citation(paper, 1).citation_format == "APA"
+
+    bibtex = format_citation(paper, BIBTEX).citation_str
+    assert bibtex.startswith("@misc{vaswani2017attention,\n")
+    assert "  author = {Ashish Vaswani and Noam Shazeer},\n" in bibtex
+    assert "  eprint = {1706.03762},\n" in bibtex
+
+    ieee = make_paper("123", title="50% of R&D", doi="10.1109/X", source="IEEE")
+    bibtex = format_citation(ieee, BIBTEX).citation_str
+    assert "title = {{50\\% of R\\&D}}" in bibtex
+    assert "url = {https://doi.org/10.1109/X}" in bibtex
+
+
+def test_format_citations_unique_keys() -> None:
+    """Test that clashing BibTeX keys get suffixes"""
+    papers = [make_paper(str(i)) for i in range(3)]
+    keys = [c.citation_str.split(",")[0] for c in format_citations(papers, BIBTEX)]
+    assert keys == [
+        "@misc{vaswani2017attention",
+        "@misc{vaswani2017attentiona",
+        "@misc{vaswani2017attentionb",
+    ]
+
+
+def test_iter_citations_uses_and_fills_cache(tmp_path: Path) -> None:
+    """Test that fetched citations are cached and replaced on re-save"""
+    project = Project(name="Library", base_path=tmp_path)
+    store = get_store(project)
+    store.save_papers([make_paper("1", source="IEEE"), make_paper("2")])
+    fetched = []
+
+    def fetch(citation: Citation) -> Optional[str]:
+        fetched.append(citation.id)
+        return "publisher citation" if citation.source == "IEEE" else None
+
+    first = list(iter_citations(project, 0, fetch, source="IEEE"))
+    second = list(iter_citations(project, 0, fetch))
+
+    assert first == ["publisher citation"]
+    assert second[0] == "publisher citation"
+    assert second[1].startswith("Ashish Vaswani")
+    assert fetched == ["1", "2"]  # paper 1 came from the cache the second time
+    assert store.cached_citations("MLA") == {"1": "publisher citation"}
+
+    store.save_papers([make_paper("1", source="IEEE")])
+    assert store.cached_citations("MLA") == {}
@@ -0,0 +1,119 @@
+import pytest
+import struct
+from datetime import date
+from src.api.base_api import Citation, Paper
+from src.storage.codec import (
+    decode_citation,
+    decode_citations,
+    decode_paper,
+    decode_papers,
+    encode_citation,
+    encode_citations,
+    encode_paper,
+    encode_papers,
+    lazy_paper,
+    lazy_papers,
+)
+
+PAPERS = [
+    Paper(
+        id="http://arxiv.org/abs/1706.03762",
+        title="Attention Is All You Need",
+        authors=["Ashish Vaswani", "Łukasz Kaiser"],
+        abstract="Transformers.",
+        pdf_url="http://arxiv.org/pdf/1706.03762v7",
+        publication_date=date(2017, 6, 12),
+        source="arXiv",
+        citation_count=100000,
+        version=7,
+    ),
+    Paper(id="1", title="", authors=[], abstract="", citation_count=None),
+    Paper(
+        id="2",
+        title="Tensor2Tensor",
+        authors=["Ashish Vaswani"],
+        abstract="",
+        source="arXiv",
+        doi="10.1/t2t",
+    ),
+]
+
+
+def test_paper_round_trip() -> None:
+    """Test that every field survives encoding, including missing values"""
+    for paper in PAPERS:
+        assert decode_paper(encode_paper(paper)) == paper
+    assert decode_papers(encode_papers(PAPERS)) == PAPERS
+    assert decode_papers(encode_papers([])) == []
+
+
+def test_citation_round_trip() -> None:
+    """Test single and batched citations"""
+    citations = [
+        Citation(
+            id="1",
+            title="T",
+            citation_format="APA",
+            citation_str="A (2020). T.",
+            authors=["A"],
+            year=2020,
+            source="IEEE",
+            url="https://doi.org/10.1/x",
+        ),
+        Citation(id="2", title="U", citation_format="APA", citation_str="", authors=[]),
+    ]
+    assert decode_citation(encode_citation(citations[0])) == citations[0]
+    assert decode_citations(encode_citations(citations)) == citations
+    with pytest.raises(ValueError):
+        decode_paper(encode_citation(citations[0]))
+
+
+def test_batch_string_table() -> None:
+    """Test that repeated authors and sources are stored once per batch"""
+    papers = [
+        Paper(
+            id=str(i),
+            title="",
+            authors=["A Very Long Author Name"] * 3,
+            abstract="",
+            source="arXiv",
+        )
+        for i in range(100)
+    ]
+    batch = encode_papers(papers)
+    assert batch.count(b"A Very Long Author Name") == 1
+    assert len(batch) < sum(len(encode_paper(p)) for p in papers) / 2
+
+
+def test_lazy_access() -> None:
+    """Test that lazy records decode only the fields that are read"""
+    records = lazy_papers(encode_papers(PAPERS))
+    assert [r.id for r in records] == ["http://arxiv.org/abs/1706.03762", "1", "2"]
+    assert records[0]._cache.keys() == {"id"}
+    assert records[2].authors == ["Ashish Vaswani"]
+    assert records[1].citation_count is None and records[1].doi is None
+    assert [r.materialize() for r in records] == PAPERS
+    assert lazy_paper(encode_paper(PAPERS[0])).publication_date == date(2017, 6, 12)
+    with pytest.raises(AttributeError):
+        _ = records[0].missing
+
+
+def test_schema_evolution() -> None:
+    """Test that unknown tags are skipped and missing ones defaulted"""
+    data = encode_paper(Paper(id="1", title="T", authors=[], abstract="A"))
+    newer = data + struct.pack("<BI", 200, 3) + b"new"  # a field added later
+    assert decode_paper(newer) == decode_paper(data)
+
+    # a writer that never had the title field
+    older = bytes(data[:2]) + struct.pack("<BI", 1, 1) + b"1"
+    assert decode_paper(older) == Paper(
+        id="1", title="", authors=[], abstract="", citation_count=None
+    )
+
+
+def test_unknown_version_rejected() -> None:
+    """Test that data from a newer codec is refused rather than misread"""
+    data = bytearray(encode_paper(Paper(id="1", title="", authors=[], abstract="")))
+    data[0] = 99
+    with pytest.raises(ValueError):
+        decode_paper(bytes(data))
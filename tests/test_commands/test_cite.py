@@ -0,0 +1,40 @@
+from datetime import date
+from pathlib import Path
+from unittest import mock
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.cli.commands.cite import cite
+from src.cli.project import Project
+from src.storage.store import get_store
+
+
+def test_cite_streams_bibtex(tmp_path: Path) -> None:
+    """Test that 'iwadi cite' writes one entry per saved paper"""
+    project = Project(name="Library", base_path=tmp_path)
+    get_store(project).save_papers(
+        Paper(
+            id=f"http://arxiv.org/abs/2101.0000{i}",
+            title=f"Paper {i}",
+            authors=["Ada Lovelace"],
+            abstract="",
+            publication_date=date(2021, 1, i + 1),
+            source="arXiv",
+        )
+        for i in range(3)
+    )
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value = project
+    output = tmp_path / "library.bib"
+
+    result = CliRunner().invoke(cite, ["-o", str(output)], obj=iwadi_ctx)
+    printed = CliRunner().invoke(cite, ["-f", "apa", "--after", "2022"], obj=iwadi_ctx)
+
+    assert result.exit_code == 0, result.output
+    assert "Wrote 3 citations" in result.output
+    entries = output.read_text().strip().split("\n\n")
+    assert [e.split(",")[0] for e in entries] == [
+        "@misc{lovelace2021paper",
+        "@misc{lovelace2021papera",
+        "@misc{lovelace2021paperb",
+    ]
+    assert "No saved papers to cite" in printed.output
@@ -0,0 +1,42 @@
+from pathlib import Path
+from unittest import mock
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.cli.commands.find import find
+from src.cli.project import Project
+from src.storage.store import get_store
+
+
+def test_find_fuzzy_command(tmp_path: Path) -> None:
+    """Test 'iwadi find --fuzzy' against a saved library"""
+    project = Project(name="Library", base_path=tmp_path)
+    get_store(project).save_papers(
+        [
+            Paper(
+                id="1",
+                title="Attention Is All You Need",
+                authors=["A. Vaswani"],
+                abstract="",
+                source="arXiv",
+            ),
+            Paper(
+                id="2",
+                title="Deep Residual Learning",
+                authors=["K. He"],
+                abstract="",
+                source="IEEE",
+            ),
+        ]
+    )
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value = project
+    runner = CliRunner()
+
+    result = runner.invoke(
+        find, ["--fuzzy", "atention is al you need", "-f", "minimal"], obj=iwadi_ctx
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("1. Attention Is All You Need")
+
+    result = runner.invoke(find, ["no such paper"], obj=iwadi_ctx)
+    assert "No saved papers match" in result.output
@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+from typing import Any
+from unittest import mock
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.store import PDF_LOCAL, PDF_QUEUED, get_store
+
+
+def fake_download(paper_id: str, dirpath: str, filename: str, **kwargs: Any) -> None:
+    Path(dirpath, filename).write_bytes(b"%PDF" + b"x" * 996)
+
+
+def test_lazy_save_then_open(tmp_path: Path) -> None:
+    """Test that a lazy project fetches the PDF on first open"""
+    with mock.patch.dict(os.environ, {"IEEE_API_KEY": "test_key"}):
+        from src.cli.commands.open_paper import open_paper
+        from src.cli.commands.save import save_selected
+        from src.cli.commands.storage import storage
+
+    project = Project(name="Library", base_path=tmp_path, pdf_mode="lazy")
+    project.papers_path.mkdir(parents=True)
+    project.save_metadata()
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value = project
+    paper = Paper(
+        id="http://arxiv.org/abs/2101.00001",
+        title="Lazy Paper",
+        authors=[],
+        abstract="",
+        source="arXiv",
+    )
+    store = get_store(project)
+
+    fetch_text = mock.patch(
+        "src.api.arxiv_api.ArxivAPI.get_full_text", return_value=None
+    )
+    download_pdf = mock.patch(
+        "src.api.arxiv_api.ArxivAPI.download_paper", side_effect=fake_download
+    )
+    with fetch_text, download_pdf as download:
+        assert save_selected([paper], project) == 1
+        download.assert_not_called()
+        location = store.pdf_location(paper.id)
+        assert location is not None and location[1] == PDF_QUEUED
+
+        result = CliRunner().invoke(open_paper, ["Lazy", "--print-path"], obj=iwadi_ctx)
+        (updated_at,) = store.conn.execute("SELECT updated_at FROM papers").fetchone()
+        with mock.patch.object(store, "set_pdf_paths") as set_pdf_paths:
+            again = CliRunner().invoke(
+                open_paper, [paper.id, "--print-path"], obj=iwadi_ctx
+            )
+
+    assert result.exit_code == 0, result.output
+    pdf_path = project.pdf_path_for(paper.id)
+    assert result.output.strip().endswith(str(pdf_path))
+    assert again.exit_code == 0, again.output
+    assert download.call_count == 1
+    location = store.pdf_location(paper.id)
+    assert location is not None and location[1] == PDF_LOCAL
+    # reopening a PDF already on disk leaves the paper itself unmodified
+    set_pdf_paths.assert_not_called()
+    assert store.conn.execute("SELECT updated_at FROM papers").fetchone() == (
+        updated_at,
+    )
+
+    status = CliRunner().invoke(storage, ["--budget", "500"], obj=iwadi_ctx)
+    assert status.exit_code == 0, status.output
+    assert "Evicted 1 PDFs" in status.output
+    assert "Local: 0, queued: 0, evicted: 1" in status.output
+    assert not pdf_path.exists()
+    assert Project.from_metadata(project.metadata_path).pdf_budget == 500
+
+
+def test_open_by_bare_arxiv_id(tmp_path: Path) -> None:
+    """Test that arXiv papers open by bare, prefixed or versioned ID"""
+    with mock.patch.dict(os.environ, {"IEEE_API_KEY": "test_key"}):
+        from src.cli.commands.open_paper import open_paper
+
+    project = Project(name="Library", base_path=tmp_path)
+    project.papers_path.mkdir(parents=True)
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value = project
+    paper = Paper(
+        id="http://arxiv.org/abs/1706.03762",
+        title="Attention Is All You Need",
+        authors=[],
+        abstract="",
+        source="arXiv",
+    )
+    pdf_path = project.pdf_path_for(paper.id)
+    fake_download(paper.id, str(pdf_path.parent), pdf_path.name)
+    get_store(project).save_paper(paper, pdf_path)
+
+    for query in ("1706.03762", "arXiv:1706.03762", paper.id + "v7"):
+        result = CliRunner().invoke(open_paper, [query, "--print-path"], obj=iwadi_ctx)
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == str(pdf_path)
@@ -0,0 +1,51 @@
+import os
+from pathlib import Path
+from unittest import mock
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.store import get_store
+
+
+def arxiv_paper(number: int, version: int) -> Paper:
+    return Paper(
+        id=f"http://arxiv.org/abs/2101.0000{number}",
+        title=f"Paper {number}",
+        authors=[],
+        abstract="",
+        source="arXiv",
+        version=version,
+    )
+
+
+def test_refresh_saves_only_new_versions(tmp_path: Path) -> None:
+    """Test that 'iwadi refresh' re-saves papers with a newer arXiv version"""
+    with mock.patch.dict(os.environ, {"IEEE_API_KEY": "test_key"}):
+        from src.cli.commands.refresh import refresh
+        from src.cli.commands.save import save_selected
+
+    project = Project(name="Library", base_path=tmp_path)
+    get_store(project).save_papers([arxiv_paper(1, 1), arxiv_paper(2, 3)])
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value = project
+    latest = {p.id: p for p in [arxiv_paper(1, 2), arxiv_paper(2, 3)]}
+
+    check = mock.patch(
+        "src.api.arxiv_api.ArxivAPI.latest_versions", return_value=latest
+    )
+    resave = mock.patch("src.cli.commands.refresh.save_selected", return_value=1)
+    with check as latest_versions, resave as save:
+        result = CliRunner().invoke(refresh, [], obj=iwadi_ctx)
+        checked = CliRunner().invoke(refresh, ["--check"], obj=iwadi_ctx)
+
+    assert result.exit_code == 0, result.output
+    assert sorted(latest_versions.call_args.args[0]) == sorted(latest)
+    assert "v1 → v2: Paper 1" in result.output
+    assert [p.id for p in save.call_args.args[0]] == [arxiv_paper(1, 2).id]
+    assert "1 papers have new versions" in checked.output
+    assert save.call_count == 1
+
+    # a version that is already saved is skipped without downloading
+    with mock.patch("src.cli.commands.save.API_MAP") as api_map:
+        assert save_selected([arxiv_paper(2, 3)], project) == 0
+    api_map.get.assert_not_called()
@@ -1,4 +1,11 @@
+import json
+import os
 import subprocess
+from typing import Any, Iterator
+from unittest import mock
+import pytest
+from click.testing import CliRunner
+from src.api.base_api import Paper
 
 
 def test_search_basic() -> None:
@@ -16,6 +23,79 @@ def test_search_basic() -> None:
     assert "Authors" in result.stdout
 
 
+@pytest.fixture
+def offline_search() -> Iterator[Any]:
+    """The search command against a stub arXiv API, without the session cache"""
+    api = mock.Mock()
+    api.search.return_value = [
+        Paper(id="1", title="Attention", authors=["A"], abstract="", source="arXiv")
+    ]
+    with mock.patch.dict(os.environ, {"IEEE_API_KEY": "test_key"}):
+        from src.cli.commands.search import API_MAP, search
+
+        sources = mock.patch.dict(API_MAP, {"arxiv": api})
+        session = mock.patch("src.cli.commands.search.SessionStore")
+        saved = mock.patch(
+            "src.cli.commands.search.saved_paper_ids", return_value=set()
+        )
+        with sources, session, saved:
+            yield search
+
+
+def test_search_stream_format_does_not_prompt(offline_search: Any) -> None:
+    """Test that piped NDJSON output is not followed by a save prompt"""
+    result = CliRunner().invoke(
+        offline_search, ["attention", "-f", "ndjson"], obj=mock.Mock()
+    )
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["id"] for line in result.stdout.splitlines()] == ["1"]
+    assert "save" not in result.stderr
+
+
+def test_search_stream_format_saves_on_stderr(offline_search: Any) -> None:
+    """Test that --save with a stream format keeps the selection flow off stdout"""
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value.name = "thesis"
+    with mock.patch(
+        "src.cli.commands.search.save_selected", return_value=1
+    ) as save_selected:
+        result = CliRunner().invoke(
+            offline_search,
+            ["attention", "-f", "csv", "--save", "--prefetch", "0"],
+            input="1\nthesis\n",
+            obj=iwadi_ctx,
+        )
+    assert result.exit_code == 0, result.output
+    rows = result.stdout.splitlines()
+    assert len(rows) == 2 and rows[1].startswith("1,Attention")
+    assert "Saved 1 papers to project 'thesis'" in result.stderr
+    assert [p.id for p in save_selected.call_args.args[0]] == ["1"]
+
+
+def test_search_dedupes_and_ranks_results(offline_search: Any) -> None:
+    """Test that a paper found twice is listed once and ranking is by citations"""
+    from src.cli.commands.search import API_MAP  # imported by the fixture
+
+    results = [
+        Paper("1", "Preprint", [], "", source="arXiv", doi="10.1/X", citation_count=5),
+        Paper("2", "Other", [], "", source="arXiv", citation_count=9),
+        Paper("3", "Published", [], "", source="IEEE", doi="10.1/x", citation_count=7),
+    ]
+    found = mock.patch.object(API_MAP["arxiv"], "search", return_value=results)
+    enrich = mock.patch("src.cli.commands.search.enrich_citation_counts")
+    with found, enrich:
+        result = CliRunner().invoke(
+            offline_search,
+            ["attention", "--sort", "citations", "-f", "ndjson"],
+            obj=mock.Mock(),
+        )
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["id"] for line in result.stdout.splitlines()] == [
+        "2",
+        "1",
+    ]
+
+
 # TODO: CLI Runner
 # TODO: Check error handling i.e. rate limits, no results
 # TODO: check that parameters are passed correctly
@@ -1,7 +1,13 @@
 import pytest
+import sqlite3
+from datetime import date
 from unittest import mock
 from click.testing import CliRunner
+from src.api.base_api import Paper
 from src.cli.commands.view import view
+from src.cli.project import Project
+from src.storage.snapshot import ProjectSnapshot
+from src.storage.store import get_store
 from pathlib import Path
 
 
@@ -11,32 +17,116 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
-def test_view_command_basic(runner: CliRunner) -> None:
+@pytest.fixture
+def project(tmp_path: Path) -> Project:
+    project = Project(name="test_project", base_path=tmp_path)
+    get_store(project).save_papers(
+        [
+            Paper(
+                id="1",
+                title="Attention Is All You Need",
+                authors=["Ashish Vaswani", "Noam Shazeer"],
+                abstract="The dominant sequence transduction models",
+                publication_date=date(2017, 6, 12),
+                source="arXiv",
+            ),
+            Paper(
+                id="2",
+                title="Deep Residual Learning",
+                authors=["Kaiming He"],
+                abstract="Deeper neural networks are more difficult to train",
+                publication_date=date(2016, 6, 27),
+                source="IEEE",
+            ),
+        ]
+    )
+    return project
+
+
+def test_view_command_basic(runner: CliRunner, project: Project) -> None:
     """Basic test for the view command to ensure it runs without errors."""
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.return_value = project
+
+    # Mock subprocess.run to prevent actual command execution
+    with mock.patch("subprocess.run") as mock_subprocess:
+        result = runner.invoke(view, obj=iwadi_ctx)
+
+    snapshot = ProjectSnapshot(project)
+    mock_subprocess.assert_called_once_with(
+        ["datasette", str(snapshot.path), "--metadata", str(snapshot.metadata_path)],
+        check=True,
+    )
+    assert result.exit_code == 0
+    assert "Snapshot updated (2 papers changed)" in result.output
+    assert "Launching Datasette for project: test_project" in result.output
+
+
+def test_view_without_project(runner: CliRunner) -> None:
+    """Test that view exits when no project can be resolved"""
+    iwadi_ctx = mock.Mock()
+    iwadi_ctx.resolve_project.side_effect = ValueError("No active project set")
+
+    with mock.patch("subprocess.run") as mock_subprocess:
+        result = runner.invoke(view, obj=iwadi_ctx)
+
+    assert result.exit_code == 1
+    mock_subprocess.assert_not_called()
+
 
-    # Mock the active project and metadata.db
-    active_project = mock.Mock()
-    active_project.name = "test_project"
-    active_project.path = Path("/mock/path/to/test_project")
+def test_snapshot_facets_and_search(project: Project) -> None:
+    """Test denormalized rows, facet tables and full-text search"""
+    snapshot = ProjectSnapshot(project)
+    assert snapshot.sync() == 2
 
-    # Create a mock for metadata.db existence
-    metadata_db = active_project.path / "metadata.db"
+    conn = sqlite3.connect(snapshot.path)
+    assert conn.execute(
+        "SELECT authors, year FROM papers WHERE id = '1'"
+    ).fetchone() == (
+        "Ashish Vaswani, Noam Shazeer",
+        2017,
+    )
+    assert conn.execute("SELECT * FROM facet_year ORDER BY year").fetchall() == [
+        (2016, 1),
+        (2017, 1),
+    ]
+    assert conn.execute(
+        "SELECT papers.id FROM papers_fts JOIN papers ON papers.pk = papers_fts.rowid "
+        "WHERE papers_fts MATCH 'neural'"
+    ).fetchall() == [("2",)]
+    conn.close()
 
-    with mock.patch("pathlib.Path.exists", return_value=True):
-        # Create a mock IwadiContext object
-        iwadi_ctx = mock.Mock()
-        iwadi_ctx.active_project = active_project
 
-        # Mock subprocess.run to prevent actual command execution
-        with mock.patch("subprocess.run") as mock_subprocess:
-            # Invoke the view command with the mocked context
-            result = runner.invoke(view, obj=iwadi_ctx)
+def test_snapshot_is_incremental(project: Project) -> None:
+    """Test that later syncs copy only changed papers and refresh facets"""
+    snapshot = ProjectSnapshot(project)
+    snapshot.sync()
+    conn = sqlite3.connect(snapshot.path)
+    conn.execute("UPDATE snapshot_meta SET value = '2000-01-01T00:00:00+00:00'")
+    conn.commit()
 
-            # Assert subprocess.run is called as expected
-            mock_subprocess.assert_called_once_with(
-                ["datasette", str(metadata_db)], check=True
-            )
+    store = get_store(project)
+    store.conn.execute("UPDATE papers SET updated_at = '1999-01-01T00:00:00+00:00'")
+    store.conn.commit()
+    store.save_paper(
+        Paper(
+            id="3",
+            title="Transformers for Neural Translation",
+            authors=["Noam Shazeer"],
+            abstract="",
+            publication_date=date(2017, 1, 1),
+            source="arXiv",
+        )
+    )
 
-            # Assert the command ran successfully
-            assert result.exit_code == 0
-            assert "Launching Datasette for project: test_project" in result.output
+    assert snapshot.sync() == 1
+    assert conn.execute(
+        "SELECT papers FROM facet_year WHERE year = 2017"
+    ).fetchone() == (2,)
+    assert conn.execute(
+        "SELECT papers FROM facet_author WHERE author = 'Noam Shazeer'"
+    ).fetchone() == (2,)
+    assert conn.execute(
+        "SELECT COUNT(*) FROM papers_fts WHERE papers_fts MATCH 'neural'"
+    ).fetchone() == (2,)
+    conn.close()
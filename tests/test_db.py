@@ -0,0 +1,43 @@
+from datetime import date
+from pathlib import Path
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.db import (
+    get_paper_text,
+    get_papers,
+    save_paper_in_db,
+    save_paper_text,
+)
+
+
+def make_paper(paper_id: str = "12345678") -> Paper:
+    return Paper(
+        id=paper_id,
+        title="Stored Paper",
+        authors=["Author One", "Author Two"],
+        abstract="Abstract",
+        publication_date=date(2023, 1, 1),
+        source="IEEE",
+        doi="10.1109/TEST.2023.1",
+    )
+
+
+def test_save_paper_without_pdf(tmp_path: Path) -> None:
+    """Test that papers ingested from full text are stored without a PDF"""
+    project = Project(name="TextOnly", base_path=tmp_path)
+    save_paper_in_db(make_paper(), project, None)
+
+    papers = get_papers(project)
+    assert [p.id for p in papers] == ["12345678"]
+    assert papers[0].authors == ["Author One", "Author Two"]
+
+
+def test_paper_text_roundtrip(tmp_path: Path) -> None:
+    """Test storing and replacing the extracted text of a paper"""
+    project = Project(name="Text", base_path=tmp_path)
+    save_paper_in_db(make_paper(), project, None)
+
+    assert get_paper_text(project, "12345678") is None
+    save_paper_text(project, "12345678", "from pdf", origin="pdf")
+    save_paper_text(project, "12345678", "structured", origin="fulltext")
+    assert get_paper_text(project, "12345678") == "structured"
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Iterator
+from click.testing import CliRunner
+import click
+from src.api.base_api import Paper
+from src.cli.utils.display import PagedTable, display_papers, stream_papers
+
+
+def make_paper(paper_id: str) -> Paper:
+    return Paper(
+        id=paper_id,
+        title='Tabs\tand\nnewlines, "quoted"',
+        authors=["Ada Lovelace", "Alan Turing"],
+        abstract="",
+        publication_date=date(2020, 1, 1),
+        source="arXiv",
+        doi=f"10.1/{paper_id}",
+    )
+
+
+def test_stream_papers_formats() -> None:
+    """Test NDJSON, CSV and TSV rows"""
+    papers = [make_paper("1"), make_paper("2")]
+
+    ndjson = "".join(stream_papers(papers, "ndjson", saved={"2"}))
+    records = [json.loads(line) for line in ndjson.splitlines()]
+    assert [r["saved"] for r in records] == [False, True]
+    assert records[0]["url"] == "https://doi.org/10.1/1"
+
+    rows = list(csv.reader(io.StringIO("".join(stream_papers(papers, "csv")))))
+    assert rows[0][:4] == ["id", "title", "authors", "year"]
+    assert rows[1][1] == papers[0].title  # quoted, not flattened
+    assert rows[1][2] == "Ada Lovelace; Alan Turing"
+
+    tsv = "".join(stream_papers(papers, "tsv")).splitlines()
+    assert len(tsv) == 3
+    assert tsv[1].split("\t")[1] == 'Tabs and newlines, "quoted"'
+
+
+def test_stream_papers_is_lazy() -> None:
+    """Test that a row is produced before the input is exhausted"""
+    consumed = []
+
+    def papers() -> Iterator[Paper]:
+        for i in range(3):
+            consumed.append(i)
+            yield make_paper(str(i))
+
+    rows = stream_papers(papers(), "csv")
+    first = next(rows)
+    assert first.startswith("id,title")
+    assert consumed == [0]
+
+
+def test_display_papers_stream_keeps_stdout_clean() -> None:
+    """Test that the empty-result notice goes to stderr"""
+
+    @click.command()
+    def show() -> None:
+        display_papers(iter([]), format="ndjson")
+
+    result = CliRunner().invoke(show)
+    assert result.stdout == ""
+    assert "No papers to display" in result.stderr
+
+
+def test_paged_table_sizes_columns_from_sample() -> None:
+    """Test that pages share the sampled widths and cut longer cells"""
+    papers = [make_paper(str(i)) for i in range(12)]
+    papers[10].authors = ["A Much Longer Author Name Than The Sample Holds"]
+    table = PagedTable(papers, page_rows=5, sample=3)
+
+    assert table.page_count == 3
+    first = click.unstyle(table.render_page(0)).splitlines()
+    last = click.unstyle(table.render_page(2, header=False)).splitlines()
+    assert first[1].startswith("|  # | Title")
+    assert len(first) == 3 + 2 * 5 and len(last) == 2 * 2
+    assert {len(line) for line in first + last} == {len(first[0])}
+    assert "| 11 |" in last[0] and "..." in last[0]
+
+
+def test_display_table_pages_through_pager() -> None:
+    """Test that a multi-page table is written as one continuous table"""
+
+    @click.command()
+    def show() -> None:
+        display_papers([make_paper(str(i)) for i in range(60)], format="table")
+
+    output = click.unstyle(CliRunner().invoke(show).output)
+    rows = [line for line in output.splitlines() if line.startswith("|")]
+    assert len(rows) == 1 + 60
+    assert rows[0].startswith("|  # | Title") and rows[-1].startswith("| 60 |")
@@ -0,0 +1,83 @@
+import os
+from datetime import date
+from pathlib import Path
+from unittest import mock
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.catalog import ProjectCatalog
+from src.storage.federated import FederatedQuery
+from src.storage.store import get_store
+
+
+def make_projects(root: Path, count: int) -> None:
+    """Projects p00..; each saves its own paper, every third also a shared one"""
+    shared = Paper(
+        id="shared",
+        title="Shared Transformer Survey",
+        authors=["Ada Lovelace"],
+        abstract="",
+        publication_date=date(2020, 1, 1),
+        source="arXiv",
+    )
+    for i in range(count):
+        project = Project(name=f"p{i:02d}", base_path=root)
+        project.path.mkdir()
+        project.save_metadata()
+        ProjectCatalog(root).register(project)
+        papers = [
+            Paper(
+                id=f"own{i}",
+                title=f"Transformer study {i}",
+                authors=[f"Author {i}"],
+                abstract="",
+                publication_date=date(2000 + i, 1, 1),
+                source="IEEE",
+            )
+        ]
+        get_store(project).save_papers(papers + ([shared] if i % 3 == 0 else []))
+
+
+def test_search_across_groups(tmp_path: Path) -> None:
+    """Test that results from every attached group are merged"""
+    make_projects(tmp_path, 13)
+    (tmp_path / "empty").mkdir()  # no database: skipped
+    federated = FederatedQuery.from_root(tmp_path, group_size=3, workers=2)
+
+    results = federated.search("transformer", limit=100)
+    assert len(results) == 14
+    locations = {paper.id: projects for paper, projects in results}
+    assert locations["shared"] == ["p00", "p03", "p06", "p09", "p12"]
+    assert [p.id for p, _ in results[:2]] == ["shared", "own12"]  # newest first
+
+    assert [p.id for p, _ in federated.search("survey", author="lovelace")] == [
+        "shared"
+    ]
+    assert [p.id for p, _ in federated.search("study", limit=2)] == ["own12", "own11"]
+    assert federated.search("study 100%") == []
+
+    found = federated.projects_containing(["own4", "shared", "missing"])
+    assert found == {"own4": ["p04"], "shared": locations["shared"]}
+
+
+def test_search_command_all_projects(tmp_path: Path) -> None:
+    """Test 'iwadi search --local --all-projects'"""
+    make_projects(tmp_path, 4)
+    with mock.patch.dict(
+        os.environ, {"IEEE_API_KEY": "test_key", "IWADI_CACHE_DIR": str(tmp_path)}
+    ):
+        from src.cli.commands.search import search
+
+        with mock.patch(
+            "src.cli.commands.search.default_projects_root", return_value=tmp_path
+        ):
+            result = CliRunner().invoke(
+                search,
+                ["survey", "--local", "--all-projects", "-f", "minimal"],
+                input="n\n",
+                obj=mock.Mock(),
+            )
+
+    assert result.exit_code == 0, result.output
+    assert "1. Shared Transformer Survey" in result.output
+    assert "1. saved in: p00, p03" in result.output
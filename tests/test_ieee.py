@@ -69,6 +69,53 @@ class TestIEEEAPI:
             pdf_path = Path(tmp_path) / "ieee_12345678.pdf"
             assert pdf_path.exists()
 
+    def test_count_success(self, ieee_api: IEEEAPI) -> None:
+        """Test count request uses one record and a publication year bucket"""
+        with patch("src.api.ieee_api.Xplore") as mock_xplore:
+            mock_query = mock_xplore.return_value
+            mock_query.callAPI.return_value = {"total_records": 321, "articles": []}
+
+            total = ieee_api.count(
+                "machine learning", after=date(2021, 1, 1), before=date(2021, 12, 31)
+            )
+
+            assert total == 321
+            mock_query.publicationYear.assert_called_once_with("2021")
+            mock_query.maximumResults.assert_called_once_with(1)
+
+    def test_get_full_text_open_access(
+        self, ieee_api: IEEEAPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test open access full text is flattened into titles and paragraphs"""
+        monkeypatch.delenv("IEEE_AUTH_TOKEN", raising=False)
+        xml = (
+            "<response><article><body><sec><title>Introduction</title>"
+            "<p>First <italic>paragraph</italic>.</p></sec>"
+            "<sec><p>Second paragraph.</p></sec></body></article></response>"
+        )
+        with patch("src.api.ieee_api.Xplore") as mock_xplore:
+            mock_xplore.return_value.callAPI.return_value = xml
+            text = ieee_api.get_full_text("12345678")
+
+            mock_xplore.return_value.openAccess.assert_called_once_with("12345678")
+            mock_xplore.return_value.fullTextRequest.assert_not_called()
+
+        assert text == "Introduction\n\nFirst paragraph.\n\nSecond paragraph."
+
+    def test_get_full_text_unavailable(
+        self, ieee_api: IEEEAPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that non open access papers fall through to the entitled endpoint"""
+        monkeypatch.setenv("IEEE_AUTH_TOKEN", "token")
+        with patch("src.api.ieee_api.Xplore") as mock_xplore:
+            mock_xplore.return_value.callAPI.return_value = (
+                "<ApiResponse><error>Not Open Access</error></ApiResponse>"
+            )
+            assert ieee_api.get_full_text("12345678") is None
+
+            mock_xplore.return_value.setAuthToken.assert_called_once_with("token")
+            mock_xplore.return_value.fullTextRequest.assert_called_once_with("12345678")
+
     # ---- Failure Cases ----
     def test_search_empty_query(self, ieee_api: IEEEAPI) -> None:
         """Test empty query validation"""
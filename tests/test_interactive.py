@@ -0,0 +1,50 @@
+from typing import List, Optional
+from click.testing import CliRunner
+import click
+from src.api.base_api import Paper
+from src.cli.utils.interactive import prompt_paper_selection
+
+
+def make_paper(number: int) -> Paper:
+    return Paper(
+        id=str(number),
+        title=f"{'Graph' if number % 5 == 0 else 'Vision'} paper {number}",
+        authors=["Ada Lovelace"],
+        abstract="",
+    )
+
+
+def select(user_input: str, count: int = 25) -> tuple:
+    chosen: List[Optional[List[Paper]]] = []
+
+    @click.command()
+    def pick() -> None:
+        papers = [make_paper(i) for i in range(1, count + 1)]
+        chosen.append(prompt_paper_selection(papers, page_size=10))
+
+    result = CliRunner().invoke(pick, input=user_input)
+    assert result.exit_code == 0, result.output
+    return chosen[0], click.unstyle(result.output)
+
+
+def test_selection_lists_one_page_at_a_time() -> None:
+    """Test paging through the selection list"""
+    selected, output = select("n\nn\nn\n3,21\n")
+
+    assert "1. Vision paper 1" in output and "21. Vision paper 21" in output
+    assert output.index("Page 3/3") > output.index("21. Vision paper 21")
+    assert "No more pages that way." in output
+    assert [p.id for p in selected] == ["3", "21"]
+
+
+def test_selection_filter() -> None:
+    """Test filtering the list while keeping paper numbers"""
+    selected, output = select("/graph\nall\n")
+
+    assert "5. Graph paper 5" in output
+    assert "5 of 25 papers matching 'graph'" in output
+    assert [p.id for p in selected] == ["5", "10", "15", "20", "25"]
+
+    selected, output = select("/nothing\n/\n7\n")
+    assert "No papers match 'nothing'." in output
+    assert [p.id for p in selected] == ["7"]
@@ -0,0 +1,208 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import List
+from src.api.base_api import Paper
+from src.api.base_api_error import APIRequestError, APIResponseError
+from src.api.metadata_api import (
+    SemanticScholarProvider,
+    enrich_citation_counts,
+    lookup_cached,
+    paper_identifier,
+)
+from src.cli.project import Project
+from src.storage.cache import MetadataCache
+from src.storage.db import get_papers, save_paper_in_db, update_citation_counts
+
+
+def mock_response(records: List) -> MagicMock:
+    response = MagicMock()
+    response.ok = True
+    response.json.return_value = records
+    return response
+
+
+def make_papers() -> List[Paper]:
+    return [
+        Paper(
+            id="http://arxiv.org/abs/1706.03762v7",
+            title="Attention Is All You Need",
+            authors=["Ashish Vaswani"],
+            abstract="",
+            publication_date=date(2017, 6, 12),
+            source="arXiv",
+        ),
+        Paper(
+            id="12345678",
+            title="IEEE Paper",
+            authors=["Author"],
+            abstract="",
+            source="IEEE",
+            doi="10.1109/TEST.2023.1",
+        ),
+        Paper(id="local", title="No IDs", authors=[], abstract="", source="arXiv"),
+    ]
+
+
+class TestMetadataProvider:
+    @pytest.fixture
+    def provider(self) -> SemanticScholarProvider:
+        return SemanticScholarProvider(
+            "http://localhost:9999", batch_size=2, max_retries=2, min_interval=0
+        )
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> MetadataCache:
+        return MetadataCache(tmp_path / "metadata.db")
+
+    def test_paper_identifier(self) -> None:
+        """Test DOI preference and arXiv ID extraction"""
+        papers = make_papers()
+        assert paper_identifier(papers[0]) == "ARXIV:1706.03762"
+        assert paper_identifier(papers[1]) == "DOI:10.1109/TEST.2023.1"
+        assert paper_identifier(papers[2]) is None
+
+    def test_lookup_batches_requests(self, provider: SemanticScholarProvider) -> None:
+        """Test that identifiers are split into batch_size requests"""
+        responses = [
+            mock_response([{"citationCount": 1}, None]),
+            mock_response([{"citationCount": 3, "externalIds": {"DOI": "10.1/x"}}]),
+        ]
+        with patch.object(provider.session, "post", side_effect=responses) as post:
+            results = provider.lookup(["DOI:a", "DOI:b", "DOI:c"])
+
+        assert post.call_count == 2
+        assert post.call_args_list[0].kwargs["json"] == {"ids": ["DOI:a", "DOI:b"]}
+        assert post.call_args.args[0] == "http://localhost:9999/paper/batch"
+        assert results["DOI:a"].citation_count == 1
+        assert "DOI:b" not in results
+        assert results["DOI:c"].doi == "10.1/x"
+
+    def test_lookup_http_error(self, provider: SemanticScholarProvider) -> None:
+        """Test that rate limiting is reported once the retries run out"""
+        response = MagicMock(ok=False, status_code=429, headers={})
+        post = patch.object(provider.session, "post", return_value=response)
+        sleep = patch("src.api.metadata_api.time.sleep")
+        raises = pytest.raises(APIRequestError)
+        with post as mock_post, sleep as mock_sleep, raises as exc_info:
+            provider.lookup(["DOI:a"])
+
+        assert mock_post.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+        assert exc_info.value.details.code == "metadata:http_error"
+        assert exc_info.value.details.retryable is True
+
+    def test_lookup_retries_rate_limit(self, provider: SemanticScholarProvider) -> None:
+        """Test that a 429 is retried after the server's Retry-After delay"""
+        limited = MagicMock(ok=False, status_code=429, headers={"Retry-After": "5"})
+        responses = [limited, mock_response([{"citationCount": 7}])]
+        post = patch.object(provider.session, "post", side_effect=responses)
+        with post, patch("src.api.metadata_api.time.sleep") as mock_sleep:
+            results = provider.lookup(["DOI:a"])
+
+        mock_sleep.assert_called_once_with(5.0)
+        assert results["DOI:a"].citation_count == 7
+
+    def test_lookup_cached_keeps_progress(
+        self, provider: SemanticScholarProvider, cache: MetadataCache
+    ) -> None:
+        """Test that each request is cached, misses included, before a failure"""
+        unavailable = MagicMock(ok=False, status_code=503, headers={})
+        responses = [mock_response([{"citationCount": 1}, None])] + [unavailable] * 3
+        failed: List[str] = []
+        post = patch.object(provider.session, "post", side_effect=responses)
+        with post, patch("src.api.metadata_api.time.sleep"):
+            results = lookup_cached(
+                ["DOI:a", "DOI:b", "DOI:c"], provider, cache, failed
+            )
+
+        assert list(results) == ["DOI:a"]
+        assert failed == ["DOI:c"]
+        assert cache.get_many(["DOI:a", "DOI:b", "DOI:c"]) == {
+            "DOI:a": asdict(results["DOI:a"]),
+            "DOI:b": None,
+        }
+
+        # the next run only asks for the identifier that failed
+        with patch.object(
+            provider.session, "post", return_value=mock_response([None])
+        ) as post:
+            lookup_cached(["DOI:a", "DOI:b", "DOI:c"], provider, cache)
+        assert post.call_args.kwargs["json"] == {"ids": ["DOI:c"]}
+
+    def test_lookup_non_json_response(self, provider: SemanticScholarProvider) -> None:
+        """Test that an HTML error page is reported as an invalid response"""
+        response = MagicMock(ok=True, status_code=200)
+        response.json.side_effect = ValueError("Expecting value")
+        post = patch.object(provider.session, "post", return_value=response)
+        with post, pytest.raises(APIResponseError) as exc_info:
+            provider.lookup(["DOI:a"])
+
+        assert exc_info.value.details.code == "metadata:invalid_response"
+
+    def test_lookup_by_title(self, provider: SemanticScholarProvider) -> None:
+        """Test that title identifiers use the match endpoint and exact titles"""
+        match = mock_response([])
+        match.status_code = 200
+        match.json.return_value = {
+            "data": [{"title": "Deep Residual Learning", "externalIds": {"DOI": "x"}}]
+        }
+        missing = MagicMock(ok=False, status_code=404)
+        get = patch.object(provider.session, "get", side_effect=[match, missing])
+        post = patch.object(provider.session, "post")
+        with get as mock_get, post as mock_post:
+            results = provider.lookup(
+                ["TITLE:deep residual learning", "TITLE:unknown paper"]
+            )
+
+        mock_post.assert_not_called()
+        assert mock_get.call_args_list[0].kwargs["params"]["query"] == (
+            "deep residual learning"
+        )
+        assert list(results) == ["TITLE:deep residual learning"]
+        assert results["TITLE:deep residual learning"].doi == "x"
+
+    def test_enrich_uses_cache(
+        self, provider: SemanticScholarProvider, cache: MetadataCache
+    ) -> None:
+        """Test that a second enrichment is served from the cache"""
+        records = [{"citationCount": 100000}, {"citationCount": 5}]
+        with patch.object(
+            provider.session, "post", return_value=mock_response(records)
+        ) as post:
+            counts = enrich_citation_counts(make_papers(), provider, cache)
+            papers = make_papers()
+            enrich_citation_counts(papers, provider, cache)
+
+        assert post.call_count == 1
+        assert counts == {"http://arxiv.org/abs/1706.03762v7": 100000, "12345678": 5}
+        assert papers[0].citation_count == 100000
+        assert papers[2].citation_count == 0
+
+    def test_cache_expiry(self, tmp_path: Path) -> None:
+        """Test that expired entries are treated as misses"""
+        cache = MetadataCache(tmp_path / "metadata.db", ttl=-1)
+        cache.put_many({"DOI:a": {"citation_count": 1}})
+
+        assert cache.get_many(["DOI:a"]) == {}
+        assert cache.purge_expired() == 1
+
+    def test_negative_cache_expiry(self, tmp_path: Path) -> None:
+        """Test that misses expire on their own, shorter TTL"""
+        cache = MetadataCache(tmp_path / "metadata.db", negative_ttl=-1)
+        cache.put_many({"DOI:a": {"citation_count": 1}, "DOI:b": None})
+
+        assert cache.get_many(["DOI:a", "DOI:b"]) == {"DOI:a": {"citation_count": 1}}
+        assert cache.purge_expired() == 1
+
+    def test_update_citation_counts(self, tmp_path: Path) -> None:
+        """Test that enriched counts are written back to iwadi.db"""
+        project = Project(name="Enriched", base_path=tmp_path)
+        for paper in make_papers():
+            save_paper_in_db(paper, project, tmp_path / f"{paper.title}.pdf")
+
+        assert update_citation_counts(project, {"12345678": 42, "missing": 1}) == 1
+        stored = {p.id: p.citation_count for p in get_papers(project)}
+        assert stored["12345678"] == 42
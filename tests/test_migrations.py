@@ -0,0 +1,249 @@
+import sqlite3
+from pathlib import Path
+from typing import List
+from src.api.base_api import Paper
+from src.storage.init_db import (
+    CREATE_PAPER_TEXT_TABLE,
+    SCHEMA_VERSION,
+    get_schema_version,
+    migrate,
+)
+from src.storage.store import ProjectStore
+
+LEGACY_PAPERS_TABLE = """
+CREATE TABLE papers (
+    id TEXT PRIMARY KEY, title TEXT NOT NULL, authors TEXT NOT NULL,
+    abstract TEXT NOT NULL, pdf_path TEXT, publication_date TEXT,
+    source TEXT NOT NULL, doi TEXT, citation_count INTEGER DEFAULT 0
+)
+"""
+
+
+def index_names(conn: sqlite3.Connection) -> set:
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    return {row[0] for row in rows}
+
+
+def test_fresh_database_is_current(tmp_path: Path) -> None:
+    """Test that a new database lands on the latest version with indexes"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    assert migrate(conn) == SCHEMA_VERSION
+    assert get_schema_version(conn) == SCHEMA_VERSION
+    assert {"idx_papers_doi", "idx_papers_date", "idx_papers_source_date"} <= (
+        index_names(conn)
+    )
+
+    statements: List[str] = []
+    conn.set_trace_callback(statements.append)
+    migrate(conn)  # already current: only the version check runs
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_legacy_database_upgrade(tmp_path: Path) -> None:
+    """Test upgrading an unversioned database with duplicate DOIs"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.execute(CREATE_PAPER_TEXT_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, 't', '[]', ?, ?, NULL, 'IEEE', ?, ?)",
+        [
+            ("a", "", None, "10.1/x", 3),
+            ("b", "Abstract", "b.pdf", "10.1/x", 7),
+            ("c", "", None, None, 0),
+        ],
+    )
+    conn.execute("INSERT INTO paper_text VALUES ('b', 'text', 'pdf')")
+    conn.commit()
+
+    assert migrate(conn) == SCHEMA_VERSION
+    rows = conn.execute(
+        "SELECT id, doi, abstract, pdf_path, citation_count FROM papers ORDER BY id"
+    ).fetchall()
+    # the duplicate is merged into the first row instead of losing its DOI
+    assert rows == [("a", "10.1/x", "Abstract", "b.pdf", 7), ("c", None, "", None, 0)]
+    assert conn.execute("SELECT paper_id FROM paper_text").fetchall() == [("a",)]
+
+
+def test_lookups_use_indexes(tmp_path: Path) -> None:
+    """Test that DOI and source/date filters no longer scan the table"""
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        for sql in (
+            "SELECT id FROM papers WHERE doi = '10.1/x'",
+            "SELECT id FROM papers WHERE source = 'IEEE' AND publication_date > '2020'",
+        ):
+            plan = " ".join(
+                str(row[-1]) for row in store.conn.execute(f"EXPLAIN QUERY PLAN {sql}")
+            )
+            assert "USING" in plan and "SCAN papers" not in plan
+
+
+def test_same_doi_merges_into_existing_row(tmp_path: Path) -> None:
+    """Test that saving a known DOI under a new ID updates the stored paper"""
+    imported = Paper(
+        id="doi:10.1/x", title="T", authors=[], abstract="", source="x", doi="10.1/x"
+    )
+    saved = Paper(
+        id="123", title="T", authors=[], abstract="", source="IEEE", doi="10.1/x"
+    )
+
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_paper(imported)
+        store.save_paper(saved, tmp_path / "123.pdf")
+
+        rows = store.conn.execute("SELECT id, pdf_path FROM papers").fetchall()
+        assert rows == [("doi:10.1/x", str(tmp_path / "123.pdf"))]
+
+
+def test_legacy_authors_backfill(tmp_path: Path) -> None:
+    """Test that authors of existing papers are copied into the author tables"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, 't', ?, '', NULL, NULL, 'IEEE', NULL, 0)",
+        [("a", '["Grace Hopper", "Ada Lovelace"]'), ("b", '["grace  hopper"]')],
+    )
+    conn.commit()
+    migrate(conn)
+
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        assert {p.id for p in store.papers_by_author("Grace Hopper")} == {"a", "b"}
+        assert store.coauthors("Ada Lovelace") == [("Grace Hopper", 1)]
+
+
+def test_legacy_trigram_backfill(tmp_path: Path) -> None:
+    """Test that existing papers become findable after the trigram migration"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.execute(
+        "INSERT INTO papers VALUES ('a', 'Graph Neural Networks', "
+        "'[\"Thomas Kipf\"]', '', NULL, NULL, 'arXiv', NULL, 0)"
+    )
+    conn.commit()
+    migrate(conn)
+
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        assert [p.id for p, _ in store.find_fuzzy("graf neural netwroks")] == ["a"]
+        assert [p.id for p, _ in store.find_fuzzy("thomas kipf")] == ["a"]
+
+
+def test_legacy_arxiv_versions_folded(tmp_path: Path) -> None:
+    """Test that per-version arXiv rows become one versionless row with history"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, ?, '[\"A. Author\"]', '', ?, NULL, ?, NULL, 0)",
+        [
+            ("http://arxiv.org/abs/1706.03762v1", "Old title", "v1.pdf", "arXiv"),
+            ("http://arxiv.org/abs/1706.03762v5", "New title", "v5.pdf", "arXiv"),
+            ("http://arxiv.org/abs/1512.03385v1", "ResNet", None, "arXiv"),
+            ("12345678", "IEEE paper", None, "IEEE"),
+        ],
+    )
+    conn.execute(CREATE_PAPER_TEXT_TABLE)
+    conn.execute(
+        "INSERT INTO paper_text VALUES ('http://arxiv.org/abs/1512.03385v1', 't', 'pdf')"
+    )
+    conn.commit()
+    migrate(conn)
+
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        papers = {p.id: p for p in store.get_papers()}
+        assert set(papers) == {
+            "http://arxiv.org/abs/1706.03762",
+            "http://arxiv.org/abs/1512.03385",
+            "12345678",
+        }
+        assert papers["http://arxiv.org/abs/1706.03762"].title == "New title"
+        assert store.saved_versions(list(papers)) == {
+            "http://arxiv.org/abs/1706.03762": 5,
+            "http://arxiv.org/abs/1512.03385": 1,
+        }
+        assert store.get_paper_text("http://arxiv.org/abs/1512.03385") == "t"
+        # the folded row keeps its author links; the stale version's are gone
+        assert len(store.papers_by_author("A. Author")) == 3
+
+
+def test_legacy_pdf_state_backfill(tmp_path: Path) -> None:
+    """Test that PDFs saved before tiering are tracked as local"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.execute(CREATE_PAPER_TEXT_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, 't', '[]', '', ?, NULL, 'IEEE', NULL, 0)",
+        [("a", "/papers/a.pdf"), ("b", None)],
+    )
+    conn.commit()
+
+    migrate(conn)
+    rows = conn.execute("SELECT id, pdf_state FROM papers ORDER BY id").fetchall()
+    assert rows == [("a", "local"), ("b", None)]
+
+
+def test_legacy_import_venue_moved_out_of_source(tmp_path: Path) -> None:
+    """Test that venues stored as the source of imported papers are moved"""
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.execute(CREATE_PAPER_TEXT_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, 't', '[]', '', NULL, NULL, ?, NULL, 0)",
+        [("doi:10.1/x", "Nature"), ("ref:abc", "import"), ("123", "IEEE")],
+    )
+    conn.commit()
+
+    migrate(conn)
+    rows = conn.execute("SELECT id, source, venue FROM papers ORDER BY id").fetchall()
+    assert rows == [
+        ("123", "IEEE", None),
+        ("doi:10.1/x", "import", "Nature"),
+        ("ref:abc", "import", None),
+    ]
+
+
+def test_legacy_library_stats_backfill(tmp_path: Path) -> None:
+    """Test that paper counts and local PDF sizes are totalled on upgrade"""
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"x" * 25)
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.execute(CREATE_PAPER_TEXT_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, 't', '[]', '', ?, NULL, 'IEEE', NULL, 0)",
+        [("a", str(pdf)), ("b", str(tmp_path / "gone.pdf")), ("c", None)],
+    )
+    conn.commit()
+
+    migrate(conn)
+    stats = conn.execute("SELECT paper_count, pdf_bytes FROM library_stats")
+    assert stats.fetchone() == (3, 25)
+
+
+def test_legacy_arxiv_version_pdfs_relinked_or_listed(tmp_path: Path) -> None:
+    """Test that folding arXiv versions keeps old PDFs and lists the orphans"""
+    pdfs = {name: tmp_path / f"{name}.pdf" for name in ("a1", "a2", "b1")}
+    for pdf in pdfs.values():
+        pdf.write_bytes(b"%PDF")
+    conn = sqlite3.connect(tmp_path / "iwadi.db")
+    conn.execute(LEGACY_PAPERS_TABLE)
+    conn.execute(CREATE_PAPER_TEXT_TABLE)
+    conn.executemany(
+        "INSERT INTO papers VALUES (?, 't', '[]', '', ?, NULL, 'arXiv', NULL, 0)",
+        [
+            ("http://arxiv.org/abs/2101.00001v1", str(pdfs["a1"])),
+            ("http://arxiv.org/abs/2101.00001v2", str(pdfs["a2"])),
+            ("http://arxiv.org/abs/2101.00002v1", str(pdfs["b1"])),
+            ("http://arxiv.org/abs/2101.00002v2", None),
+        ],
+    )
+    conn.commit()
+
+    migrate(conn)
+    rows = conn.execute("SELECT id, pdf_path FROM papers ORDER BY id").fetchall()
+    assert rows == [
+        ("http://arxiv.org/abs/2101.00001", str(pdfs["a2"])),
+        # the newest version had no PDF, so it keeps the older one
+        ("http://arxiv.org/abs/2101.00002", str(pdfs["b1"])),
+    ]
+    # upgrading never deletes files; the dropped version's PDF is listed
+    assert all(pdf.exists() for pdf in pdfs.values())
+    orphans = conn.execute("SELECT path, paper_id FROM orphaned_pdfs").fetchall()
+    assert orphans == [(str(pdfs["a1"]), "http://arxiv.org/abs/2101.00001v1")]
@@ -0,0 +1,86 @@
+import sys
+from datetime import date
+from typing import List
+from src.api.base_api import Paper
+from src.api.paper_batch import PaperBatch
+
+
+def make_papers() -> List[Paper]:
+    return [
+        Paper(
+            id="a",
+            title="First",
+            authors=["Ada Lovelace", "Alan Turing"],
+            abstract="",
+            publication_date=date(2020, 5, 1),
+            source="arXiv",
+            citation_count=3,
+            version=2,
+        ),
+        Paper(
+            id="b",
+            title="Second",
+            authors=[],
+            abstract="",
+            source="IEEE",
+            doi="10.1/X",
+            citation_count=None,
+            venue="IEEE Transactions on Pattern Analysis",
+        ),
+        Paper(
+            id="c",
+            title="Dup",
+            authors=["Ada Lovelace"],
+            abstract="",
+            source="arXiv",
+            doi="10.1/x",
+            citation_count=10,
+        ),
+    ]
+
+
+def test_views_round_trip() -> None:
+    """Test that views expose the Paper API and convert back losslessly"""
+    papers = make_papers()
+    batch = PaperBatch.from_papers(papers)
+
+    assert len(batch) == 3
+    assert batch[0].authors == ("Ada Lovelace", "Alan Turing")
+    assert batch[0].publication_date == date(2020, 5, 1)
+    assert batch[1].citation_count is None
+    assert (batch[0].version, batch[1].version) == (2, None)
+    assert batch[1].venue == "IEEE Transactions on Pattern Analysis"
+    assert batch[-1].doi == "10.1/x"
+    assert batch.to_papers() == papers
+    assert batch[0] == papers[0]
+
+
+def test_strings_are_interned() -> None:
+    """Test that repeated sources and authors share one string object"""
+    source = "".join(["ar", "Xiv"])  # not the same object as the literal
+    batch = PaperBatch.from_papers(
+        make_papers() + [Paper("d", "", [], "", source=source)]
+    )
+
+    assert batch.sources[3] is sys.intern("arXiv")
+    assert batch.author_names[0] is batch.author_names[2]
+
+
+def test_dedupe_and_rank() -> None:
+    """Test bulk dedup by DOI and ranking by citations"""
+    batch = PaperBatch.from_papers(make_papers())
+
+    deduped = batch.dedupe()
+    assert deduped.ids == ["a", "b"]
+    assert deduped.to_papers() == make_papers()[:2]
+    assert deduped.authors_of(0) == ("Ada Lovelace", "Alan Turing")
+
+    ranked = batch.rank_by_citations()
+    assert ranked.ids == ["c", "a", "b"]
+    assert ranked.authors_of(0) == ("Ada Lovelace",)
+
+    ranked[2].citation_count = 50
+    assert ranked.rank_by_citations().ids == ["b", "c", "a"]
+    columns = batch.columns()
+    assert columns["citation_count"] == [3, None, 10]
+    assert columns["version"] == [2, None, None]
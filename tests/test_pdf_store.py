@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+import pytest
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.locks import LOCK_FILENAME
+from src.storage.pdf_store import (
+    evict_pdfs,
+    papers_usage,
+    parse_size,
+    prune_orphaned_pdfs,
+)
+from src.storage.store import PDF_EVICTED, PDF_LOCAL, get_store
+
+
+def test_parse_size() -> None:
+    """Test human-readable budgets"""
+    assert parse_size("750000") == 750000
+    assert parse_size("500M") == 500 * 1024**2
+    assert parse_size("1.5GiB") == int(1.5 * 1024**3)
+    assert parse_size("none") is None
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Project:
+    project = Project(name="Library", base_path=tmp_path, pdf_budget=2500)
+    project.papers_path.mkdir(parents=True)
+    store = get_store(project)
+    for number in range(4):
+        paper = Paper(
+            id=f"p{number}", title="T", authors=[], abstract="", source="IEEE"
+        )
+        pdf_path = project.pdf_path_for(paper.id)
+        pdf_path.write_bytes(b"x" * 1000)
+        store.save_paper(paper, pdf_path)
+        store.save_paper_text(paper.id, f"text {number}", origin="pdf")
+    return project
+
+
+def test_evict_least_recently_used(project: Project) -> None:
+    """Test that eviction frees the oldest PDFs down to the budget"""
+    store = get_store(project)
+    # the lock file and partial downloads are neither counted nor removed
+    (project.papers_path / LOCK_FILENAME).write_bytes(b"")
+    (project.papers_path / ".p9.pdf.123.part").write_bytes(b"x" * 5000)
+    store.touch_pdfs(["p0"])
+    assert papers_usage(project.papers_path) == 4000
+
+    evicted = evict_pdfs(project, keep={"p1"})
+
+    assert evicted == ["p2", "p3"]
+    assert papers_usage(project.papers_path) == 2000
+    assert (project.papers_path / LOCK_FILENAME).exists()
+    assert store.pdf_location("p2") == (
+        str(project.pdf_path_for("p2")),
+        PDF_EVICTED,
+        "IEEE",
+    )
+    location = store.pdf_location("p0")
+    assert location is not None and location[1] == PDF_LOCAL
+    assert store.get_paper_text("p2") == "text 2"  # extracted text is kept
+    assert evict_pdfs(project) == []
+
+
+def test_evict_without_budget(project: Project) -> None:
+    """Test that a project without a budget keeps every PDF"""
+    project.pdf_budget = None
+    assert evict_pdfs(project) == []
+    assert len(os.listdir(project.papers_path)) == 4
+
+
+def test_prune_orphaned_pdfs(project: Project, tmp_path: Path) -> None:
+    """Test that only listed orphans inside papers/ are deleted"""
+    store = get_store(project)
+    inside = project.papers_path / "old.pdf"
+    inside.write_bytes(b"%PDF")
+    outside = tmp_path / "elsewhere.pdf"
+    outside.write_bytes(b"%PDF")
+    escaping = project.papers_path / ".." / "escaping.pdf"
+    escaping.write_bytes(b"%PDF")
+    referenced = project.pdf_path_for("p0")
+    store.conn.executemany(
+        "INSERT INTO orphaned_pdfs VALUES (?, 'old', '')",
+        [(str(p),) for p in (inside, outside, escaping, referenced)]
+        + [(str(project.papers_path / "gone.pdf"),), ("relative.pdf",)],
+    )
+
+    deleted, skipped = prune_orphaned_pdfs(project)
+
+    assert deleted == [project.papers_path / "gone.pdf", inside]
+    assert skipped == [escaping, outside, Path("relative.pdf")]
+    assert not inside.exists() and outside.exists() and escaping.exists()
+    assert referenced.exists()  # a paper uses it again, so it is no orphan
+    assert [path for path, _ in store.orphaned_pdfs()] == [
+        str(escaping),
+        str(outside),
+        "relative.pdf",
+    ]
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+from typing import Generator, List
+from src.api.base_api import Paper
+from src.cli.utils.prefetch import Prefetcher
+
+
+def make_papers(count: int) -> List[Paper]:
+    return [
+        Paper(
+            id=f"http://arxiv.org/abs/2101.0000{i}v1",
+            title=f"Paper {i}",
+            authors=["Author"],
+            abstract="",
+            pdf_url=f"http://arxiv.org/pdf/2101.0000{i}v1",
+            source="arXiv",
+        )
+        for i in range(count)
+    ]
+
+
+class TestPrefetcher:
+    @pytest.fixture
+    def mock_get(self) -> Generator:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"%PDF-", b"content"]
+        with patch("requests.Session.get", return_value=response) as mock_get:
+            yield mock_get
+
+    def test_only_top_k_downloaded(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Test that only the first top_k results are fetched"""
+        with Prefetcher({}, top_k=2, cache_dir=tmp_path) as prefetcher:
+            prefetcher.start(make_papers(5))
+            prefetcher._executor.shutdown(wait=True)
+
+        assert mock_get.call_count == 2
+
+    def test_promote_moves_pdf(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Test that a selected paper is moved into the destination"""
+        papers = make_papers(3)
+        dest = tmp_path / "project" / "papers" / "paper.pdf"
+
+        with Prefetcher({}, top_k=3, cache_dir=tmp_path) as prefetcher:
+            prefetcher.start(papers)
+            assert prefetcher.promote(papers[1], dest)
+            cache_dir = prefetcher.cache_dir
+
+        assert dest.read_bytes() == b"%PDF-content"
+        assert not cache_dir.exists()  # unselected papers evicted
+
+    def test_promote_outside_top_k(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Test that papers that were never prefetched fall back to a normal download"""
+        papers = make_papers(3)
+
+        with Prefetcher({}, top_k=1, cache_dir=tmp_path) as prefetcher:
+            prefetcher.start(papers)
+            assert not prefetcher.promote(papers[2], tmp_path / "paper.pdf")
+
+    def test_failed_download_not_promoted(self, tmp_path: Path) -> None:
+        """Test that download errors are swallowed until promotion"""
+        papers = make_papers(1)
+
+        offline = patch("requests.Session.get", side_effect=ConnectionError("offline"))
+        prefetcher = Prefetcher({}, top_k=1, cache_dir=tmp_path)
+        with offline, prefetcher:
+            prefetcher.start(papers)
+            assert not prefetcher.promote(papers[0], tmp_path / "paper.pdf")
+
+    def test_falls_back_to_source_api(self, tmp_path: Path) -> None:
+        """Test that papers without a pdf_url are fetched through their API"""
+        paper = Paper(id="12345", title="IEEE", authors=[], abstract="", source="IEEE")
+        api = MagicMock()
+
+        def fake_download(paper_id: str, dirpath: str, filename: str) -> None:
+            (Path(dirpath) / filename).write_bytes(b"%PDF-")
+
+        api.download_paper.side_effect = fake_download
+
+        with Prefetcher({"ieee": api}, top_k=1, cache_dir=tmp_path) as prefetcher:
+            prefetcher.start([paper])
+            assert prefetcher.promote(paper, tmp_path / "12345.pdf")
+
+        assert (tmp_path / "12345.pdf").exists()
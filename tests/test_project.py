@@ -0,0 +1,75 @@
+import json
+import pytest
+from pathlib import Path
+from unittest import mock
+from src.api.base_api import Paper
+from src.cli.context import IwadiContext
+from src.cli.project import Project
+from src.storage.catalog import ProjectCatalog
+from src.storage.store import get_store
+
+
+def test_metadata_is_small_and_static(tmp_path: Path) -> None:
+    """Test that saved papers do not grow project_meta.json"""
+    project = Project(name="Static", base_path=tmp_path)
+    project.path.mkdir()
+    project.save_metadata()
+    before = project.metadata_path.read_bytes()
+
+    store = get_store(project)
+    store.save_paper(Paper(id="1", title="T", authors=[], abstract="", source="IEEE"))
+
+    assert store.contains("1") and not store.contains("2")
+    assert store.paper_count() == 1
+    assert project.metadata_path.read_bytes() == before
+    assert "papers" not in json.loads(before)
+    assert [p.name for p in project.path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_interrupted_write_keeps_old_metadata(tmp_path: Path) -> None:
+    """Test that a failed write leaves the previous file intact"""
+    project = Project(name="Atomic", base_path=tmp_path, created="2024-01-01")
+    project.path.mkdir()
+    project.save_metadata()
+
+    project.created = "2025-01-01"
+    failing = mock.patch("os.replace", side_effect=OSError("disk full"))
+    with failing, pytest.raises(OSError):
+        project.save_metadata()
+
+    assert Project.from_metadata(project.metadata_path).created == "2024-01-01"
+
+
+def test_load_legacy_metadata(tmp_path: Path) -> None:
+    """Test loading a file written with the old papers list"""
+    meta = tmp_path / "Old" / "project_meta.json"
+    meta.parent.mkdir()
+    meta.write_text(
+        json.dumps(
+            {
+                "project_name": "Old",
+                "created": "2024-01-01",
+                "papers": ["a", "b"],
+                "paths": {"root": str(meta.parent)},
+            }
+        )
+    )
+
+    project = Project.from_metadata(meta)
+    assert (project.name, project.base_path) == ("Old", tmp_path)
+
+
+def test_resolve_project_outside_default_root(tmp_path: Path) -> None:
+    """Test resolving by name a project created under a custom --path"""
+    default_root, custom_root = tmp_path / "default", tmp_path / "custom"
+    project = Project(name="Elsewhere", base_path=custom_root)
+    project.path.mkdir(parents=True)
+    project.save_metadata()
+    ProjectCatalog(default_root).register(project)
+
+    with mock.patch("src.cli.context.default_projects_root", return_value=default_root):
+        resolved = IwadiContext().resolve_project("Elsewhere")
+        assert resolved.path == project.path
+
+        with pytest.raises(ValueError, match="not found"):
+            IwadiContext().resolve_project("Missing")
@@ -0,0 +1,174 @@
+from pathlib import Path
+from typing import Dict, List, Sequence
+from src.api.base_api_error import APIRequestError
+from src.api.metadata_api import MetadataProvider, PaperMetadata
+from src.cli.project import Project
+from src.storage.cache import MetadataCache
+from src.storage.db import get_papers
+from src.storage.references import (
+    IMPORT_SOURCE,
+    import_references,
+    iter_bibtex,
+    iter_references,
+    iter_ris,
+)
+
+BIBTEX = """
+@comment{exported from a reference manager}
+
+@article{vaswani2017,
+  title = {Attention Is {All} You Need},
+  author = {Vaswani, Ashish and Shazeer, Noam and Parmar, Niki},
+  journal = {arXiv preprint arXiv:1706.03762},
+  year = 2017
+}
+
+@inproceedings{he2016,
+  title = "Deep Residual Learning for Image Recognition",
+  author = "Kaiming He and Xiangyu Zhang",
+  booktitle = {CVPR (Oral)},
+  doi = {10.1109/CVPR.2016.90},
+  year = {2016},
+}
+@misc{eprint, title={Eprint only}, eprint={2101.00001v2}, archivePrefix={arXiv}}
+"""
+
+RIS = """TY  - JOUR
+TI  - Attention Is All You Need
+AU  - Vaswani, Ashish
+AU  - Shazeer, Noam
+PY  - 2017/06/12
+UR  - https://arxiv.org/abs/1706.03762
+ER  -
+
+TY  - CONF
+T1  - Unresolved Paper
+AU  - Someone Else
+DO  - 10.1000/xyz123
+ER  -
+"""
+
+
+class FakeProvider(MetadataProvider):
+    def __init__(self, known: Dict[str, PaperMetadata]) -> None:
+        self.known = known
+        self.calls: List[List[str]] = []
+
+    def lookup(self, identifiers: Sequence[str]) -> Dict[str, PaperMetadata]:
+        self.calls.append(list(identifiers))
+        return {i: self.known[i] for i in identifiers if i in self.known}
+
+
+class FailingProvider(FakeProvider):
+    def lookup(self, identifiers: Sequence[str]) -> Dict[str, PaperMetadata]:
+        self.calls.append(list(identifiers))
+        raise APIRequestError(
+            message="Metadata lookup failed with HTTP 429",
+            status_code=429,
+            source="metadata",
+        )
+
+
+def test_parse_bibtex() -> None:
+    """Test braced, quoted and bare values plus arXiv ID detection"""
+    entries = list(iter_bibtex(BIBTEX.splitlines(keepends=True)))
+
+    assert [e.key for e in entries] == ["vaswani2017", "he2016", "eprint"]
+    assert entries[0].title == "Attention Is All You Need"
+    assert entries[0].authors == ["Ashish Vaswani", "Noam Shazeer", "Niki Parmar"]
+    assert entries[0].arxiv_id == "1706.03762"
+    assert entries[0].year == 2017
+    assert entries[1].doi == "10.1109/CVPR.2016.90"
+    assert entries[1].venue == "CVPR (Oral)"
+    assert entries[2].arxiv_id == "2101.00001"
+
+
+def test_parse_ris() -> None:
+    """Test RIS records split on ER tags"""
+    entries = list(iter_ris(RIS.splitlines(keepends=True)))
+
+    assert len(entries) == 2
+    assert entries[0].authors == ["Ashish Vaswani", "Noam Shazeer"]
+    assert entries[0].arxiv_id == "1706.03762"
+    assert entries[0].year == 2017
+    assert entries[1].title == "Unresolved Paper"
+    assert entries[1].doi == "10.1000/xyz123"
+
+
+def test_import_references(tmp_path: Path) -> None:
+    """Test batched resolution and bulk insert into the project DB"""
+    ref_file = tmp_path / "refs.bib"
+    ref_file.write_text(BIBTEX)
+    project = Project(name="Imported", base_path=tmp_path)
+    provider = FakeProvider(
+        {"DOI:10.1109/CVPR.2016.90": PaperMetadata(citation_count=200000)}
+    )
+
+    result = import_references(
+        iter_references(ref_file),
+        project,
+        provider=provider,
+        cache=MetadataCache(tmp_path / "cache.db"),
+        batch_size=2,
+    )
+
+    assert result.imported == 3
+    assert len(provider.calls) == 2  # one lookup per batch
+    assert {p.id for p in result.pending_downloads} == {
+        "http://arxiv.org/abs/1706.03762",
+        "http://arxiv.org/abs/2101.00001",
+    }
+
+    papers = {p.id: p for p in get_papers(project)}
+    assert papers["doi:10.1109/CVPR.2016.90"].citation_count == 200000
+    assert papers["http://arxiv.org/abs/1706.03762"].source == "arXiv"
+
+    # re-importing the same library updates rows instead of duplicating them
+    import_references(iter_references(ref_file), project)
+    assert len(get_papers(project)) == 3
+
+
+def test_import_keeps_source_and_resolves_titles(tmp_path: Path) -> None:
+    """Test that venues stay out of source and title-only entries are looked up"""
+    ref_file = tmp_path / "refs.bib"
+    ref_file.write_text(
+        BIBTEX + "@article{untitled, title={Title Only}, journal={Nature}}\n"
+    )
+    project = Project(name="Venues", base_path=tmp_path)
+    provider = FakeProvider(
+        {"TITLE:title only": PaperMetadata(doi="10.1038/t", citation_count=3)}
+    )
+
+    import_references(
+        iter_references(ref_file),
+        project,
+        provider=provider,
+        cache=MetadataCache(tmp_path / "cache.db"),
+    )
+
+    assert "TITLE:title only" in provider.calls[0]
+    papers = {p.id: p for p in get_papers(project)}
+    resnet = papers["doi:10.1109/CVPR.2016.90"]
+    assert (resnet.source, resnet.venue) == (IMPORT_SOURCE, "CVPR (Oral)")
+    resolved = papers["doi:10.1038/t"]
+    assert (resolved.source, resolved.venue) == (IMPORT_SOURCE, "Nature")
+    assert resolved.citation_count == 3
+
+
+def test_import_continues_when_lookups_fail(tmp_path: Path) -> None:
+    """Test that failed lookups leave entries unresolved instead of aborting"""
+    ref_file = tmp_path / "refs.bib"
+    ref_file.write_text(BIBTEX)
+    project = Project(name="Offline", base_path=tmp_path)
+
+    result = import_references(
+        iter_references(ref_file),
+        project,
+        provider=FailingProvider({}),
+        cache=MetadataCache(tmp_path / "cache.db"),
+        batch_size=2,
+    )
+
+    assert result.imported == 3
+    assert result.unresolved == 3
+    assert len(get_papers(project)) == 3
@@ -0,0 +1,89 @@
+import pytest
+from pathlib import Path
+from unittest import mock
+from click.testing import CliRunner
+import click
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.cli.utils.display import display_papers, validate_format
+from src.storage.federated import FederatedQuery, saved_paper_ids
+from src.storage.saved_filter import BloomFilter, SavedFilter
+from src.storage.store import get_store
+
+
+def make_paper(paper_id: str, doi: str = "") -> Paper:
+    return Paper(
+        id=paper_id,
+        title=paper_id,
+        authors=[],
+        abstract="",
+        source="IEEE",
+        doi=doi or None,
+    )
+
+
+def make_project(root: Path, name: str) -> Project:
+    project = Project(name=name, base_path=root)
+    project.path.mkdir()
+    project.save_metadata()
+    return project
+
+
+def test_bloom_filter() -> None:
+    """Test no false negatives, a bounded false positive rate and persistence"""
+    bloom = BloomFilter(capacity=1000)
+    for i in range(1000):
+        bloom.add(f"id:{i}")
+
+    assert all(f"id:{i}" in bloom for i in range(1000))
+    false_positives = sum(f"id:other{i}" in bloom for i in range(10000))
+    assert false_positives < 300  # sized for 1%
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    assert restored.count == 1000 and "id:5" in restored and not restored.saturated
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(b"nope" + bloom.to_bytes()[4:])
+
+
+def test_saved_paper_ids(tmp_path: Path) -> None:
+    """Test that hits are verified exactly and saves update the filter"""
+    thesis = make_project(tmp_path, "thesis")
+    get_store(thesis).save_papers([make_paper("a"), make_paper("b", doi="10.1/B")])
+
+    results = [make_paper("a"), make_paper("x", doi="10.1/b"), make_paper("c")]
+    assert saved_paper_ids(results, tmp_path) == {"a", "x"}  # builds the filter
+    assert SavedFilter(tmp_path).load() is not None
+
+    # a later save lands in the stored filter without a rebuild
+    survey = make_project(tmp_path, "survey")
+    get_store(survey).save_paper(make_paper("c"))
+    with mock.patch("src.storage.federated.build_saved_filter") as rebuild:
+        assert saved_paper_ids(results, tmp_path) == {"a", "x", "c"}
+    rebuild.assert_not_called()
+
+    # papers the filter rules out never reach the databases
+    with mock.patch.object(FederatedQuery, "saved_matches") as saved_matches:
+        assert saved_paper_ids([make_paper("unsaved")], tmp_path) == set()
+    saved_matches.assert_not_called()
+
+    # a false positive is caught by the exact check
+    with mock.patch.object(BloomFilter, "__contains__", return_value=True):
+        assert saved_paper_ids([make_paper("unsaved")], tmp_path) == set()
+
+
+def test_saved_badge() -> None:
+    """Test the badge in the table and minimal output"""
+
+    @click.command()
+    @click.argument("fmt")
+    def show(fmt: str) -> None:
+        display_papers(
+            [make_paper("a"), make_paper("b")],
+            format=validate_format(fmt),
+            saved={"b"},
+        )
+
+    table = CliRunner().invoke(show, ["table"]).output
+    assert "Saved" in table and table.count("[saved]") == 1
+    minimal = CliRunner().invoke(show, ["minimal"]).output.splitlines()
+    assert minimal == ["1. a (, N/A)", "2. b (, N/A) [saved]"]
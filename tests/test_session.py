@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+from typing import List
+from unittest import mock
+from click.testing import CliRunner
+from src.api.base_api import Paper
+from src.storage.session import SessionStore
+
+
+def make_papers(prefix: str, count: int) -> List[Paper]:
+    return [
+        Paper(id=f"{prefix}{i}", title=f"{prefix} {i}", authors=["A"], abstract="")
+        for i in range(1, count + 1)
+    ]
+
+
+def test_resolve_by_number_and_id(tmp_path: Path) -> None:
+    """Test that refs resolve to the latest results by number, or by ID"""
+    store = SessionStore(tmp_path / "session.db")
+    store.record_results(make_papers("old", 2))
+    store.record_results(make_papers("new", 3))
+
+    found, missing = store.resolve(["2", "old1", "7", "nope"])
+    assert [p.id for p in found] == ["new2", "old1"]
+    assert missing == ["7", "nope"]
+    assert [p.id for p in store.recent()] == ["new1", "new2", "new3"]
+
+
+def test_numeric_ids_win_over_numbers(tmp_path: Path) -> None:
+    """Test that an IEEE-style numeric ID is matched before a result number"""
+    store = SessionStore(tmp_path / "session.db")
+    store.record_results(make_papers("", 3))  # IDs "1".."3"
+    store.record_results(make_papers("x", 3))
+
+    found, _ = store.resolve(["1"])
+    assert found[0].id == "1"
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    """Test that older results are evicted least recently used first"""
+    store = SessionStore(tmp_path / "session.db", max_entries=4)
+    store.record_results(make_papers("a", 2))
+    store.record_results(make_papers("b", 1))
+    store.resolve(["a1"])  # a1 is now more recent than a2 and b1
+    store.record_results(make_papers("c", 2))
+
+    _, missing = store.resolve(["a1", "a2", "b1", "c1", "c2"])
+    assert missing == ["a2"]
+
+    # the current results are kept even when they alone exceed the bound
+    store.record_results(make_papers("d", 6))
+    assert len(store.recent()) == 6
+    _, missing = store.resolve(["a1", "c1"])
+    assert missing == ["a1", "c1"]
+
+
+def test_save_command_reads_session(tmp_path: Path) -> None:
+    """Test that 'iwadi save' picks papers from the last search"""
+    with mock.patch.dict(
+        os.environ, {"IEEE_API_KEY": "test_key", "IWADI_CACHE_DIR": str(tmp_path)}
+    ):
+        from src.cli.commands.save import save_papers
+
+        SessionStore().record_results(make_papers("p", 3))
+        iwadi_ctx = mock.Mock()
+        with mock.patch(
+            "src.cli.commands.save.save_selected", return_value=2
+        ) as save_selected:
+            result = CliRunner().invoke(save_papers, ["3", "p1", "9"], obj=iwadi_ctx)
+
+    assert result.exit_code == 0, result.output
+    assert "Not found in recent search results: 9" in result.output
+    papers = save_selected.call_args.args[0]
+    assert [p.id for p in papers] == ["p3", "p1"]
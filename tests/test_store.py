@@ -0,0 +1,236 @@
+import json
+import pytest
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import List
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.store import ProjectStore, get_store
+
+
+def make_papers(count: int) -> List[Paper]:
+    return [
+        Paper(id=str(i), title=f"Paper {i}", authors=["A"], abstract="", source="IEEE")
+        for i in range(count)
+    ]
+
+
+def test_store_uses_wal(tmp_path: Path) -> None:
+    """Test that the connection is tuned for write throughput"""
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_save_papers_batches(tmp_path: Path) -> None:
+    """Test bulk inserts across several transactions"""
+    statements: List[str] = []
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.conn.set_trace_callback(statements.append)
+        written = store.save_papers(iter(make_papers(5)), batch_size=2)
+        store.conn.set_trace_callback(None)
+
+        assert written == 5
+        assert len(store.get_papers()) == 5
+    assert sum(s.startswith("COMMIT") for s in statements) == 3
+
+
+def test_upsert_keeps_pdf_path(tmp_path: Path) -> None:
+    """Test that re-saving metadata without a PDF keeps the stored path"""
+    paper = make_papers(1)[0]
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_paper(paper, tmp_path / "0.pdf")
+        paper.citation_count = 7
+        store.save_papers([paper])
+
+        row = store.conn.execute(
+            "SELECT pdf_path, citation_count FROM papers"
+        ).fetchone()
+        assert row == (str(tmp_path / "0.pdf"), 7)
+
+
+def test_get_store_is_shared(tmp_path: Path) -> None:
+    """Test that one connection is reused per project database"""
+    project = Project(name="Shared", base_path=tmp_path)
+    assert get_store(project) is get_store(Project(name="Shared", base_path=tmp_path))
+
+
+def test_authors_are_normalized(tmp_path: Path) -> None:
+    """Test that spelling variants of an author share one authors row"""
+    papers = [
+        Paper(
+            id="1",
+            title="A",
+            authors=["José García", "Ada Lovelace"],
+            abstract="",
+            source="arXiv",
+        ),
+        Paper(
+            id="2",
+            title="B",
+            authors=["Jose  Garcia", "Alan Turing"],
+            abstract="",
+            source="IEEE",
+        ),
+        Paper(
+            id="3",
+            title="C",
+            authors=["ADA LOVELACE", "jose garcía"],
+            abstract="",
+            source="IEEE",
+        ),
+    ]
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_papers(papers)
+
+        assert store.conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0] == 3
+        assert {p.id for p in store.papers_by_author("jose garcia")} == {"1", "2", "3"}
+        assert store.coauthors("José García") == [
+            ("Ada Lovelace", 2),
+            ("Alan Turing", 1),
+        ]
+
+        # re-saving with a changed author list replaces the links
+        papers[0].authors = ["Ada Lovelace"]
+        store.save_paper(papers[0])
+        assert {p.id for p in store.papers_by_author("jose garcia")} == {"2", "3"}
+        assert papers[0].authors == json.loads(
+            store.conn.execute("SELECT authors FROM papers WHERE id = '1'").fetchone()[
+                0
+            ]
+        )
+
+
+def test_iter_papers_filters_and_pages(tmp_path: Path) -> None:
+    """Test SQL-side filters and keyset pagination across pages"""
+    papers = [
+        Paper(
+            id=f"p{i:02d}",
+            title=f"Paper {i}",
+            authors=["Grace Hopper"] if i % 2 else ["Alan Turing"],
+            abstract="",
+            publication_date=date(2015 + i % 5, 3, 1),
+            source="arXiv" if i < 6 else "IEEE",
+        )
+        for i in range(10)
+    ]
+    statements: List[str] = []
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_papers(papers)
+        store.conn.set_trace_callback(statements.append)
+        all_papers = list(store.iter_papers(page_size=3))
+        store.conn.set_trace_callback(None)
+
+        assert [p.id for p in all_papers] == [p.id for p in papers]
+        assert all_papers[0].publication_date == date(2015, 3, 1)
+        assert sum(s.startswith("SELECT") for s in statements) == 4
+
+        assert [p.id for p in store.iter_papers(source="IEEE", year_from=2017)] == [
+            "p07",
+            "p08",
+            "p09",
+        ]
+        assert [p.id for p in store.iter_papers(year_to=2015)] == ["p00", "p05"]
+        assert [
+            p.id for p in store.iter_papers(author="grace hopper", year_to=2016)
+        ] == [
+            "p01",
+            "p05",
+        ]
+
+
+def test_iter_papers_projection_and_saved_since(tmp_path: Path) -> None:
+    """Test column projection and the saved-since filter"""
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_papers(make_papers(2))
+        store.conn.execute("UPDATE papers SET saved_at = '2020-01-01T00:00:00+00:00'")
+
+        projected = next(store.iter_papers(columns=("title",)))
+        assert (projected.id, projected.title, projected.authors) == (
+            "0",
+            "Paper 0",
+            [],
+        )
+
+        assert list(store.iter_papers(saved_since=datetime.now(timezone.utc))) == []
+        since_2019 = store.iter_papers(saved_since=date(2019, 1, 1), columns=())
+        assert len(list(since_2019)) == 2
+
+        with pytest.raises(ValueError):
+            list(store.iter_papers(columns=("pdf_path",)))
+
+
+def test_find_fuzzy_ranks_typos(tmp_path: Path) -> None:
+    """Test approximate title and author matches, best first"""
+    papers = [
+        Paper(
+            id="1",
+            title="Attention Is All You Need",
+            authors=["Ashish Vaswani"],
+            abstract="",
+            source="arXiv",
+        ),
+        Paper(
+            id="2",
+            title="Attention Mechanisms in Vision",
+            authors=["Li Wei"],
+            abstract="",
+            source="arXiv",
+        ),
+        Paper(
+            id="3",
+            title="Deep Residual Learning",
+            authors=["Kaiming He"],
+            abstract="",
+            source="IEEE",
+        ),
+    ]
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_papers(papers)
+
+        matches = store.find_fuzzy("atention is al you need")
+        assert [p.id for p, _ in matches] == ["1"]
+        assert matches[0][1] > 0.5
+        loose = store.find_fuzzy("atention is al you need", min_score=0.05)
+        assert [p.id for p, _ in loose][:2] == ["1", "2"]
+        assert [p.id for p, _ in store.find_fuzzy("kaiming")] == ["3"]
+        assert store.find_fuzzy("zzz qqq") == []
+
+        # re-saving replaces the indexed trigrams
+        papers[2].title = "Residual Networks Revisited"
+        store.save_paper(papers[2])
+        assert [p.id for p, _ in store.find_fuzzy("residual netwrks")] == ["3"]
+        assert store.find_fuzzy("deep residual learning", min_score=0.6) == []
+
+        assert [p.id for p in store.find_exact("residual")] == ["3"]
+        assert [p.id for p in store.find_exact("2")] == ["2"]
+        # LIKE wildcards in the query are matched literally
+        assert store.find_exact("%") == [] and store.find_exact("_") == []
+
+
+def test_arxiv_version_history(tmp_path: Path) -> None:
+    """Test that each saved arXiv version is recorded once under one row"""
+    paper = Paper(
+        id="http://arxiv.org/abs/1706.03762",
+        title="Attention Is All You Need",
+        authors=[],
+        abstract="",
+        pdf_url="http://arxiv.org/pdf/1706.03762v1",
+        source="arXiv",
+        version=1,
+    )
+    with ProjectStore(tmp_path / "iwadi.db") as store:
+        store.save_paper(paper)
+        store.save_paper(paper)
+        paper.version, paper.pdf_url = 3, "http://arxiv.org/pdf/1706.03762v3"
+        store.save_papers(
+            [paper, Paper(id="x", title="", authors=[], abstract="", source="IEEE")]
+        )
+
+        assert store.paper_count() == 2
+        assert store.saved_versions([paper.id, "x", "missing"]) == {paper.id: 3}
+        history = store.version_history(paper.id)
+        assert [(v, url) for v, url, _ in history] == [
+            (1, "http://arxiv.org/pdf/1706.03762v1"),
+            (3, "http://arxiv.org/pdf/1706.03762v3"),
+        ]
@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+from pathlib import Path
+from src.api.trends import count_by_year
+from src.storage.cache import MetadataCache
+
+
+def test_count_by_year_caches_buckets(tmp_path: Path) -> None:
+    """Test one count request per year and cached buckets on repeat queries"""
+    api = MagicMock()
+    api.count.side_effect = lambda query, before, after, author: after.year - 2000
+    cache = MetadataCache(tmp_path / "cache.db")
+
+    counts = count_by_year(api, "arxiv", "llm", range(2020, 2023), cache)
+    assert counts == {2020: 20, 2021: 21, 2022: 22}
+    assert api.count.call_count == 3
+
+    # only the new year is requested
+    counts = count_by_year(api, "arxiv", "llm", range(2021, 2024), cache)
+    assert counts == {2021: 21, 2022: 22, 2023: 23}
+    assert api.count.call_count == 4
+
+    count_by_year(api, "arxiv", "llm", [2023], cache, refresh=True)
+    assert api.count.call_count == 5
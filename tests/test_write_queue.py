@@ -0,0 +1,123 @@
+import multiprocessing
+from pathlib import Path
+from typing import Callable, List
+from src.api.base_api import Paper
+from src.cli.project import Project
+from src.storage.locks import LOCK_FILENAME, file_lock, move_into_place
+from src.storage.store import ProjectStore, get_store
+from src.storage.write_queue import WRITER_LOCK, WriteQueue
+
+
+def make_papers(worker: int, count: int) -> List[Paper]:
+    return [
+        Paper(
+            id=f"w{worker}-{i}",
+            title=f"Paper {i}",
+            authors=[f"Author {worker}"],
+            abstract="",
+            source="arXiv",
+        )
+        for i in range(count)
+    ]
+
+
+def queue_worker(base_path: str, worker: int) -> None:
+    queue = WriteQueue(Project(name="Shared", base_path=Path(base_path)))
+    for batch in range(5):
+        queue.save_papers(make_papers(worker, 20)[batch * 4 : batch * 4 + 4])
+
+
+def store_worker(base_path: str, worker: int) -> None:
+    store = get_store(Project(name="Shared", base_path=Path(base_path)))
+    for paper in make_papers(worker, 20):
+        store.save_paper(paper)
+
+
+def run_workers(target: Callable[[str, int], None], base_path: Path) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=target, args=(str(base_path), i)) for i in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+    assert [process.exitcode for process in workers] == [0, 0, 0, 0]
+
+
+def test_concurrent_store_writers(tmp_path: Path) -> None:
+    """Test that processes writing one project directly all succeed"""
+    run_workers(store_worker, tmp_path)
+
+    with ProjectStore(tmp_path / "Shared" / "iwadi.db") as store:
+        assert store.paper_count() == 80
+
+
+def test_write_queue_applies_all_batches(tmp_path: Path) -> None:
+    """Test that queued batches from several processes all land exactly once"""
+    run_workers(queue_worker, tmp_path)
+
+    project = Project(name="Shared", base_path=tmp_path)
+    queue = WriteQueue(project)
+    queue.drain(wait=True)  # in case the last writer exited mid-handoff
+    assert queue.pending() == []
+    with ProjectStore(project.path / "iwadi.db") as store:
+        assert store.paper_count() == 80
+        assert len(store.papers_by_author("Author 3")) == 20
+
+
+def test_queue_batches_survive_until_written(tmp_path: Path) -> None:
+    """Test that a batch left by a crashed writer is applied by the next one"""
+    project = Project(name="Crash", base_path=tmp_path)
+    queue = WriteQueue(project)
+    pdf = tmp_path / "w0-0.pdf"
+    pdf.write_bytes(b"%PDF")
+    queue.submit(make_papers(0, 3), {"w0-0": pdf})
+
+    assert queue.drain() == 3
+    assert queue.pending() == []
+    stored = get_store(project).conn.execute(
+        "SELECT pdf_path FROM papers WHERE id = 'w0-0'"
+    )
+    assert stored.fetchone()[0] == str(pdf)
+
+
+def test_queue_counts_batches_left_for_another_writer(tmp_path: Path) -> None:
+    """Test that batches another writer has not committed are not counted"""
+    project = Project(name="Busy", base_path=tmp_path)
+    queue = WriteQueue(project)
+    pdf = tmp_path / "w0-0.pdf"
+    pdf.write_bytes(b"%PDF")
+
+    with file_lock(queue.queue_dir / WRITER_LOCK):  # another writer is busy
+        queue.save_papers(make_papers(0, 3))
+        queue.save_papers(make_papers(0, 1), {"w0-0": pdf})
+        assert queue.outstanding() == 4
+        assert get_store(project).paper_count() == 0
+
+    queue.drain()
+    assert queue.outstanding() == 0
+    stored = get_store(project).conn.execute(
+        "SELECT pdf_path, pdf_state FROM papers WHERE id = 'w0-0'"
+    )
+    assert stored.fetchone() == (str(pdf), "local")
+
+
+def test_file_lock_is_exclusive(tmp_path: Path) -> None:
+    """Test that a held lock is refused to a non-blocking second holder"""
+    lock_path = tmp_path / LOCK_FILENAME
+    with file_lock(lock_path) as first, file_lock(lock_path, blocking=False) as second:
+        assert first and not second
+    with file_lock(lock_path, blocking=False) as again:
+        assert again
+
+
+def test_move_into_place(tmp_path: Path) -> None:
+    """Test that a finished download replaces the destination in one step"""
+    src = tmp_path / "download.part"
+    src.write_bytes(b"new")
+    dest = tmp_path / "papers" / "paper.pdf"
+
+    move_into_place(src, dest)
+
+    assert dest.read_bytes() == b"new"
+    assert not src.exists()
+    assert sorted(p.name for p in dest.parent.iterdir()) == [LOCK_FILENAME, "paper.pdf"]